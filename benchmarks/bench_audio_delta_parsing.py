@@ -0,0 +1,76 @@
+"""Micro-benchmark comparing full pydantic parsing of audio deltas with the fast path.
+
+Each path starts from the raw websocket frame, so the str paths include the UTF-8 decode that
+websockets performs on text frames.
+
+Usage:
+    python benchmarks/bench_audio_delta_parsing.py [--chunk-ms 20] [--number 20000]
+"""
+
+import argparse
+import base64
+import json
+import os
+import timeit
+
+from pipecat.services.openai.realtime import events
+
+from pipecat_extension.services.openai_realtime_events import parse_server_event
+
+
+def make_message(chunk_ms: int) -> str:
+    # 24 kHz, 16-bit mono PCM, as emitted by the realtime API.
+    audio = os.urandom(24000 * 2 * chunk_ms // 1000)
+    return json.dumps(
+        {
+            "type": "response.output_audio.delta",
+            "event_id": "event_CQJ2o1Tq3c2yJ0hGJp1zN",
+            "response_id": "resp_CQJ2nQvDmiHQvrLqEBDnm",
+            "item_id": "item_CQJ2nX1c3Umv0cGFDx7pP",
+            "output_index": 0,
+            "content_index": 0,
+            "delta": base64.b64encode(audio).decode(),
+        },
+        separators=(",", ":"),
+    )
+
+
+def full_parse(frame: bytes) -> bytes:
+    evt = events.parse_server_event(frame.decode())
+    return base64.b64decode(evt.delta)
+
+
+def fast_parse_str(frame: bytes) -> bytes:
+    return parse_server_event(frame.decode()).audio
+
+
+def fast_parse_raw(frame: bytes) -> bytes:
+    return parse_server_event(frame).audio
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--chunk-ms", type=int, default=20, help="audio per delta in ms")
+    parser.add_argument("--number", type=int, default=20000, help="deltas per measurement")
+    parser.add_argument("--repeat", type=int, default=5, help="measurements per path")
+    args = parser.parse_args()
+
+    frame = make_message(args.chunk_ms).encode()
+    assert full_parse(frame) == fast_parse_str(frame) == fast_parse_raw(frame)
+
+    paths = [
+        ("pydantic (str frame)", lambda: full_parse(frame)),
+        ("fast path (str frame)", lambda: fast_parse_str(frame)),
+        ("fast path (raw frame)", lambda: fast_parse_raw(frame)),
+    ]
+    print(f"frame size: {len(frame)} bytes, {args.number} deltas per run")
+    baseline = None
+    for name, func in paths:
+        best = min(timeit.repeat(func, number=args.number, repeat=args.repeat))
+        per_event_us = best / args.number * 1e6
+        baseline = baseline or per_event_us
+        print(f"{name:<24} {per_event_us:8.2f} us/event  {baseline / per_event_us:5.2f}x")
+
+
+if __name__ == "__main__":
+    main()
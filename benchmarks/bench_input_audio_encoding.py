@@ -0,0 +1,57 @@
+"""Micro-benchmark comparing pydantic serialization of input audio appends with direct encoding.
+
+Usage:
+    python benchmarks/bench_input_audio_encoding.py [--chunk-ms 20] [--number 20000]
+"""
+
+import argparse
+import base64
+import json
+import os
+import timeit
+
+from pipecat.services.openai.realtime import events
+
+from pipecat_extension.services.openai_realtime_sender import encode_input_audio_append
+
+
+def pydantic_send_client_event(audio: bytes, event_id: str = None) -> str:
+    # What OpenAIRealtimeLLMService._send_user_audio and send_client_event do.
+    event = events.InputAudioBufferAppendEvent(audio=base64.b64encode(audio).decode("utf-8"))
+    if event_id:
+        event.event_id = event_id
+    return json.dumps(event.model_dump(exclude_none=True))
+
+
+def direct(audio: bytes, event_id: str = None) -> bytes:
+    return encode_input_audio_append(audio, event_id)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--chunk-ms", type=int, default=20, help="audio per append in ms")
+    parser.add_argument("--number", type=int, default=20000, help="appends per measurement")
+    parser.add_argument("--repeat", type=int, default=5, help="measurements per path")
+    args = parser.parse_args()
+
+    # 24 kHz, 16-bit mono PCM, as sent to the realtime API.
+    audio = os.urandom(24000 * 2 * args.chunk_ms // 1000)
+    assert json.loads(pydantic_send_client_event(audio, "event")) == json.loads(
+        direct(audio, "event")
+    )
+
+    paths = [
+        ("pydantic + json.dumps", lambda: pydantic_send_client_event(audio)),
+        ("direct encoding", lambda: direct(audio)),
+    ]
+    print(f"chunk size: {len(audio)} bytes, {args.number} appends per run")
+    baseline = None
+    for name, func in paths:
+        best = min(timeit.repeat(func, number=args.number, repeat=args.repeat))
+        per_event_us = best / args.number * 1e6
+        baseline = baseline or per_event_us
+        print(f"{name:<24} {per_event_us:8.2f} us/event  {baseline / per_event_us:5.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,253 @@
+"""Benchmark of bot audio pacing with many concurrent calls on one event loop, offline.
+
+Each call is a pipeline of an audio source and the output of a FastAPIWebsocketTransport
+with the Telnyx serializer, sending to an in-memory websocket instead of the network. The
+source is either a LocalTTSService, standing in for the real TTS service, or raw
+``response.output_audio.delta`` messages decoded by the realtime service's fast path and
+pushed as OpenAIRealtimeLLMServiceExt pushes them. Every call speaks the same few sentences,
+and an AudioPacingObserver on each transport output counts the underruns the caller would
+hear and the jitter of the send intervals.
+
+For each number of concurrent calls it reports the calls with at least one underrun, the
+total underruns and the silence they inserted, p50/p99 of the per-call jitter and of the
+longest interval between two chunks, and the garbage collections run meanwhile with their
+total and longest pause.
+
+Usage:
+    python benchmarks/bench_output_pacing.py [--sessions 10,100,300] [--source tts]
+        [--profile cloud] [--prebuffer-ms 40] [--ramp-secs 1.0]
+"""
+
+import argparse
+import asyncio
+import base64
+import gc
+import random
+import statistics
+import time
+
+from loguru import logger
+from pipecat.frames.frames import (
+    EndFrame,
+    TTSAudioRawFrame,
+    TTSSpeakFrame,
+    TTSStartedFrame,
+    TTSStoppedFrame,
+)
+from pipecat.pipeline.pipeline import Pipeline
+from pipecat.pipeline.runner import PipelineRunner
+from pipecat.pipeline.task import PipelineParams, PipelineTask
+from pipecat.processors.frame_processor import FrameDirection, FrameProcessor
+from pipecat.serializers.telnyx import TelnyxFrameSerializer
+from pipecat.transports.websocket.fastapi import (
+    FastAPIWebsocketParams,
+    FastAPIWebsocketTransport,
+)
+from starlette.websockets import WebSocketState
+
+from pipecat_extension.audio.output_pacing import AudioPacingObserver, AudioPacingStats
+from pipecat_extension.services.local_tts import TTS_PROFILES, LocalTTSService, synthesize
+from pipecat_extension.services.openai_realtime_events import parse_audio_delta
+
+SENTENCES = [
+    "Hello, my name is Hunter's Digital.",
+    "I'll help you fill in your application today.",
+    "Could you tell me your full name, please?",
+]
+
+
+class RealtimeAudioDeltas(FrameProcessor):
+    """Speaks each TTSSpeakFrame as raw realtime audio deltas decoded by the fast path.
+
+    The messages are built up front, so each delta costs what the realtime service spends on
+    it: decoding the base64 payload and pushing a TTSAudioRawFrame. Deltas arrive at
+    ``real_time_factor`` times their duration, after ``ttfb_ms``, as the TTS profile sets.
+    """
+
+    def __init__(self, params, delta_ms: int = 20):
+        super().__init__()
+        self._params = params
+        self._delta_ms = delta_ms
+        self._messages: dict[str, list[bytes]] = {}
+
+    def _deltas(self, text: str) -> list[bytes]:
+        if text not in self._messages:
+            audio = synthesize(text, 24000, self._params.chars_per_second).tobytes()
+            size = 24000 * 2 * self._delta_ms // 1000
+            self._messages[text] = [
+                (
+                    '{"type":"response.output_audio.delta","event_id":"event_0",'
+                    '"response_id":"resp_0","item_id":"item_0","output_index":0,'
+                    f'"content_index":0,"delta":"{base64.b64encode(audio[i : i + size]).decode()}"}}'
+                ).encode()
+                for i in range(0, len(audio), size)
+            ]
+        return self._messages[text]
+
+    async def process_frame(self, frame, direction: FrameDirection):
+        await super().process_frame(frame, direction)
+        if not isinstance(frame, TTSSpeakFrame):
+            await self.push_frame(frame, direction)
+            return
+        messages = self._deltas(frame.text)
+        await asyncio.sleep(self._params.ttfb_ms / 1000)
+        await self.push_frame(TTSStartedFrame())
+        for message in messages:
+            evt = parse_audio_delta(message)
+            await self.push_frame(
+                TTSAudioRawFrame(audio=evt.audio, sample_rate=24000, num_channels=1)
+            )
+            await asyncio.sleep(self._delta_ms / 1000 * self._params.real_time_factor)
+        await self.push_frame(TTSStoppedFrame())
+
+
+class GCPauses:
+    """Counts the garbage collections per generation and times their pauses while installed."""
+
+    def __init__(self):
+        self.collections = [0, 0, 0]
+        self.pauses: list[float] = []
+        self._start = 0.0
+
+    def _callback(self, phase: str, info: dict):
+        if phase == "start":
+            self._start = time.perf_counter()
+        else:
+            self.collections[info["generation"]] += 1
+            self.pauses.append(time.perf_counter() - self._start)
+
+    def __enter__(self):
+        gc.callbacks.append(self._callback)
+        return self
+
+    def __exit__(self, *exc):
+        gc.callbacks.remove(self._callback)
+
+
+class NullWebSocket:
+    """In-memory websocket that counts what is sent to it and never receives anything."""
+
+    def __init__(self):
+        self.client_state = WebSocketState.CONNECTED
+        self.application_state = WebSocketState.CONNECTED
+        self.sent_bytes = 0
+        self._closed = asyncio.Event()
+
+    async def send_text(self, data: str):
+        self.sent_bytes += len(data)
+
+    async def send_bytes(self, data: bytes):
+        self.sent_bytes += len(data)
+
+    async def _receive(self):
+        await self._closed.wait()
+        return
+        yield
+
+    def iter_text(self):
+        return self._receive()
+
+    def iter_bytes(self):
+        return self._receive()
+
+    async def close(self):
+        self.client_state = WebSocketState.DISCONNECTED
+        self.application_state = WebSocketState.DISCONNECTED
+        self._closed.set()
+
+
+async def run_call(args, start_delay: float) -> tuple[AudioPacingStats, int]:
+    await asyncio.sleep(start_delay)
+    websocket = NullWebSocket()
+    serializer = TelnyxFrameSerializer(
+        stream_id="bench",
+        outbound_encoding="PCMU",
+        inbound_encoding="PCMU",
+        params=TelnyxFrameSerializer.InputParams(auto_hang_up=False),
+    )
+    transport = FastAPIWebsocketTransport(
+        websocket=websocket,
+        params=FastAPIWebsocketParams(
+            audio_out_enabled=True, add_wav_header=False, serializer=serializer
+        ),
+    )
+    params = TTS_PROFILES[args.profile]
+    if args.source == "realtime":
+        source = RealtimeAudioDeltas(params)
+    else:
+        source = LocalTTSService(params=params)
+    observer = AudioPacingObserver(transport.output(), prebuffer_ms=args.prebuffer_ms)
+    task = PipelineTask(
+        Pipeline([source, transport.output()]),
+        params=PipelineParams(audio_out_sample_rate=8000),
+        observers=[observer],
+    )
+    await task.queue_frames([*(TTSSpeakFrame(text) for text in SENTENCES), EndFrame()])
+    await PipelineRunner(handle_sigint=False).run(task)
+    return observer.stats, websocket.sent_bytes
+
+
+def percentiles(values: list[float]) -> tuple[float, float]:
+    if len(values) < 2:
+        return values[0], values[0]
+    p99 = statistics.quantiles(values, n=100, method="inclusive")[98]
+    return statistics.median(values), p99
+
+
+async def bench_sessions(args, sessions: int):
+    rng = random.Random(0)
+    gc.collect()
+    start = time.perf_counter()
+    with GCPauses() as pauses:
+        results = await asyncio.gather(
+            *(run_call(args, rng.uniform(0, args.ramp_secs)) for _ in range(sessions))
+        )
+    elapsed = time.perf_counter() - start
+
+    stats = [result[0] for result in results]
+    audio_secs = sum(s.audio_secs for s in stats)
+    jitter_p50, jitter_p99 = percentiles([s.jitter_secs * 1000 for s in stats])
+    interval_p50, interval_p99 = percentiles([s.max_interval_secs * 1000 for s in stats])
+    print(
+        f"{sessions:>8} {elapsed:>7.1f} {audio_secs / elapsed:>9.1f}"
+        f" {sum(1 for s in stats if s.underruns):>9} {sum(s.underruns for s in stats):>9}"
+        f" {sum(s.underrun_secs for s in stats):>9.2f}"
+        f" {jitter_p50:>7.1f} {jitter_p99:>7.1f} {interval_p50:>7.1f} {interval_p99:>7.1f}"
+        f" {'/'.join(map(str, pauses.collections)):>13} {sum(pauses.pauses) * 1000:>7.1f}"
+        f" {max(pauses.pauses, default=0) * 1000:>7.1f}"
+    )
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sessions", default="10,100,300", help="comma-separated concurrent call counts"
+    )
+    parser.add_argument(
+        "--source", choices=["tts", "realtime"], default="tts", help="where the bot audio comes from"
+    )
+    parser.add_argument("--profile", choices=sorted(TTS_PROFILES), default="cloud")
+    parser.add_argument(
+        "--prebuffer-ms", type=float, default=40, help="audio the caller buffers before playing"
+    )
+    parser.add_argument(
+        "--ramp-secs", type=float, default=1.0, help="calls start spread over this many seconds"
+    )
+    args = parser.parse_args()
+
+    logger.remove()
+    print(
+        f"{args.source} source, TTS profile {args.profile},"
+        f" {args.prebuffer_ms:.0f} ms caller prebuffer"
+    )
+    print(
+        f"{'sessions':>8} {'wall s':>7} {'audio x':>9} {'calls gap':>9} {'underruns':>9}"
+        f" {'gap s':>9} {'jit p50':>7} {'jit p99':>7} {'max p50':>7} {'max p99':>7}"
+        f" {'gc gen0/1/2':>13} {'gc ms':>7} {'gc max':>7}"
+    )
+    for sessions in sorted(int(count) for count in args.sessions.split(",")):
+        await bench_sessions(args, sessions)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
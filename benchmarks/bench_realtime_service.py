@@ -0,0 +1,383 @@
+"""Benchmark of the OpenAIRealtimeLLMServiceExt receive path on synthetic sessions.
+
+Drives ``_receive_task_handler`` from an in-memory websocket with three event mixes:
+
+- ``audio``: spoken turns, dominated by 20 ms output audio deltas.
+- ``transcript``: text-heavy turns with input and output transcript deltas.
+- ``tool``: short turns that each end in an asynchronous tool call.
+
+For each mix it reports events per second, p50/p99 latency from dispatch to handler completion,
+the mean peak of memory held while handling an event above what was held before it (traced by
+tracemalloc, so Python allocations only), and RSS as the number of concurrent sessions grows.
+Frames are pushed into a counting sink instead of a pipeline, so the numbers cover this
+extension layer and the pipecat handlers it calls, not downstream processors.
+
+Usage:
+    python benchmarks/bench_realtime_service.py [--mix audio,transcript,tool] [--turns 50]
+        [--sessions 1,10,50,100] [--fast-audio-delta-parsing]
+"""
+
+import argparse
+import asyncio
+import base64
+import gc
+import os
+import statistics
+import time
+import tracemalloc
+
+from loguru import logger
+from pipecat.clocks.system_clock import SystemClock
+from pipecat.frames.frames import FunctionCallResultFrame
+from pipecat.processors.frame_processor import FrameProcessorSetup
+from pipecat.services.openai.realtime import events
+from pipecat.services.openai.realtime.context import OpenAIRealtimeLLMContext
+from pipecat.utils.asyncio.task_manager import TaskManager, TaskManagerParams
+from websockets.exceptions import ConnectionClosedOK
+
+from pipecat_extension.services.openai_realtime_conversation import ConversationStore
+from pipecat_extension.services.openai_realtime_llm_service import OpenAIRealtimeLLMServiceExt
+from pipecat_extension.services.openai_realtime_worker import current_rss_bytes
+
+MIXES = ("audio", "transcript", "tool")
+
+# 20 ms of 24 kHz, 16-bit mono PCM, as emitted by the realtime API.
+_AUDIO_CHUNK = base64.b64encode(os.urandom(960)).decode()
+
+
+class _Turn:
+    """Builds the serialized server events of one synthetic turn."""
+
+    def __init__(self, index: int):
+        self.index = index
+        self.messages: list[str] = []
+        self._response_id = f"resp_{index}"
+
+    def add(self, event: events.ServerEvent):
+        self.messages.append(event.model_dump_json(exclude_none=True))
+
+    def event_id(self) -> str:
+        return f"event_{self.index}_{len(self.messages)}"
+
+    def response(self, status: str, output=()) -> events.Response:
+        return events.Response(
+            id=self._response_id,
+            object="realtime.response",
+            status=status,
+            status_details={},
+            output=list(output),
+            usage=events.Usage(
+                total_tokens=120,
+                input_tokens=100,
+                output_tokens=20,
+                input_token_details=events.TokenDetails(),
+                output_token_details=events.TokenDetails(),
+            ),
+        )
+
+    def user_item(self, transcript_deltas: list[str]) -> events.ConversationItem:
+        item = events.ConversationItem(
+            id=f"item_user_{self.index}",
+            type="message",
+            role="user",
+            content=[events.ItemContent(type="input_audio")],
+        )
+        self.add(
+            events.ConversationItemAdded(
+                event_id=self.event_id(),
+                type="conversation.item.added",
+                previous_item_id=f"item_assistant_{self.index - 1}" if self.index else None,
+                item=item,
+            )
+        )
+        for delta in transcript_deltas:
+            self.add(
+                events.ConversationItemInputAudioTranscriptionDelta(
+                    event_id=self.event_id(),
+                    type="conversation.item.input_audio_transcription.delta",
+                    item_id=item.id,
+                    content_index=0,
+                    delta=delta,
+                )
+            )
+        self.add(
+            events.ConversationItemInputAudioTranscriptionCompleted(
+                event_id=self.event_id(),
+                type="conversation.item.input_audio_transcription.completed",
+                item_id=item.id,
+                content_index=0,
+                transcript="".join(transcript_deltas),
+            )
+        )
+        return item
+
+    def assistant_item(self, item_type: str = "message", **fields) -> events.ConversationItem:
+        item = events.ConversationItem(
+            id=f"item_assistant_{self.index}",
+            type=item_type,
+            role="assistant" if item_type == "message" else None,
+            **fields,
+        )
+        self.add(events.ResponseCreated(
+            event_id=self.event_id(), type="response.created", response=self.response("in_progress")
+        ))
+        self.add(
+            events.ConversationItemAdded(
+                event_id=self.event_id(),
+                type="conversation.item.added",
+                previous_item_id=f"item_user_{self.index}",
+                item=item,
+            )
+        )
+        return item
+
+    def done(self, item: events.ConversationItem):
+        self.add(events.ConversationItemDone(
+            event_id=self.event_id(), type="conversation.item.done", item=item
+        ))
+        self.add(events.ResponseDone(
+            event_id=self.event_id(), type="response.done", response=self.response("completed", [item])
+        ))
+
+    def delta(self, event_class, event_type: str, item_id: str, **fields):
+        self.add(
+            event_class(
+                event_id=self.event_id(),
+                type=event_type,
+                response_id=self._response_id,
+                item_id=item_id,
+                output_index=0,
+                content_index=0,
+                **fields,
+            )
+        )
+
+
+def audio_turn(index: int) -> list[str]:
+    """A spoken turn: 2 s of output audio with a transcript delta every 100 ms."""
+    turn = _Turn(index)
+    turn.user_item(["What is the ", "weather like?"])
+    item = turn.assistant_item(content=[events.ItemContent(type="output_audio")])
+    for i in range(100):
+        turn.delta(events.ResponseAudioDelta, "response.output_audio.delta", item.id,
+                   delta=_AUDIO_CHUNK)
+        if i % 5 == 0:
+            turn.delta(events.ResponseAudioTranscriptDelta,
+                       "response.output_audio_transcript.delta", item.id, delta="sunny ")
+    turn.delta(events.ResponseAudioDone, "response.output_audio.done", item.id)
+    turn.done(item)
+    return turn.messages
+
+
+def transcript_turn(index: int) -> list[str]:
+    """A text-heavy turn with many small input and output transcript deltas."""
+    turn = _Turn(index)
+    turn.user_item([f"word{i} " for i in range(20)])
+    item = turn.assistant_item(content=[events.ItemContent(type="output_text")])
+    for i in range(40):
+        turn.delta(events.ResponseAudioTranscriptDelta,
+                   "response.output_audio_transcript.delta", item.id, delta=f"token{i} ")
+        turn.delta(events.ResponseTextDelta, "response.output_text.delta", item.id,
+                   delta=f"token{i} ")
+    turn.done(item)
+    return turn.messages
+
+
+def tool_turn(index: int) -> list[str]:
+    """A short turn whose response is an asynchronous tool call."""
+    turn = _Turn(index)
+    turn.user_item(["Look that up."])
+    call_id = f"call_{index}"
+    item = turn.assistant_item(
+        "function_call", call_id=call_id, name="lookup", arguments='{"query": "weather"}'
+    )
+    turn.add(
+        events.ResponseFunctionCallArgumentsDone(
+            event_id=turn.event_id(),
+            type="response.function_call_arguments.done",
+            response_id=f"resp_{index}",
+            item_id=item.id,
+            output_index=0,
+            call_id=call_id,
+            arguments=item.arguments,
+        )
+    )
+    turn.done(item)
+    return turn.messages
+
+
+TURN_BUILDERS = {"audio": audio_turn, "transcript": transcript_turn, "tool": tool_turn}
+
+
+def make_stream(mix: str, turns: int) -> list[bytes]:
+    """Build the raw websocket frames of a synthetic session."""
+    builder = TURN_BUILDERS[mix]
+    return [message.encode() for i in range(turns) for message in builder(i)]
+
+
+class _MemoryWebSocket:
+    """Replays pre-built frames through both websocket APIs the receive loop uses."""
+
+    def __init__(self, frames: list[bytes]):
+        self._frames = iter(frames)
+        self.sent = 0
+
+    async def send(self, message, text=None):
+        self.sent += 1
+
+    async def recv(self, decode=None):
+        frame = next(self._frames, None)
+        if frame is None:
+            raise ConnectionClosedOK(None, None)
+        return frame if decode is False else frame.decode()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        frame = next(self._frames, None)
+        if frame is None:
+            raise StopAsyncIteration
+        return frame.decode()
+
+
+class _BenchService(OpenAIRealtimeLLMServiceExt):
+    """Service with frames sent to a counting sink and optional per-event instrumentation.
+
+    Function call results are handed straight back to the service, as the context aggregator
+    would do in a pipeline, so the tool mix exercises the whole asynchronous tool path.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.frames_pushed = 0
+        self.latencies_ns: list[int] = []
+        self.peak_bytes: list[int] = []
+        self.measure_latency = False
+        self.measure_peak_memory = False
+
+    async def push_frame(self, frame, direction=None):
+        self.frames_pushed += 1
+        if isinstance(frame, FunctionCallResultFrame):
+            await self._handle_function_call_result(frame)
+
+    async def _dispatch_server_event(self, evt) -> bool:
+        if self.measure_peak_memory:
+            tracemalloc.reset_peak()
+            before = tracemalloc.get_traced_memory()[0]
+            result = await super()._dispatch_server_event(evt)
+            self.peak_bytes.append(tracemalloc.get_traced_memory()[1] - before)
+            return result
+        if self.measure_latency:
+            start = time.perf_counter_ns()
+            result = await super()._dispatch_server_event(evt)
+            self.latencies_ns.append(time.perf_counter_ns() - start)
+            return result
+        return await super()._dispatch_server_event(evt)
+
+
+async def lookup(params):
+    return {"forecast": "sunny"}
+
+
+async def create_service(args, task_manager: TaskManager) -> _BenchService:
+    service = _BenchService(
+        api_key="benchmark",
+        fast_audio_delta_parsing=args.fast_audio_delta_parsing,
+        conversation_store=ConversationStore(max_audio_items=20),
+    )
+    await service.setup(FrameProcessorSetup(clock=SystemClock(), task_manager=task_manager))
+    # Let the input task start so cleanup() can cancel it.
+    await asyncio.sleep(0)
+    service._context = OpenAIRealtimeLLMContext()
+    service.register_async_function("lookup", lookup)
+    return service
+
+
+async def run_session(service: _BenchService, frames: list[bytes]):
+    service._websocket = _MemoryWebSocket(frames)
+    await service._receive_task_handler()
+
+
+def percentile(values: list[int], pct: float) -> float:
+    return statistics.quantiles(values, n=100, method="inclusive")[int(pct) - 1]
+
+
+async def bench_mix(args, mix: str, task_manager: TaskManager):
+    frames = make_stream(mix, args.turns)
+    service = await create_service(args, task_manager)
+
+    # Warm-up, then throughput without instrumentation.
+    await run_session(service, frames)
+    best = float("inf")
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        await run_session(service, frames)
+        best = min(best, time.perf_counter() - start)
+
+    service.measure_latency = True
+    await run_session(service, frames)
+    service.measure_latency = False
+
+    tracemalloc.start()
+    service.measure_peak_memory = True
+    await run_session(service, frames)
+    service.measure_peak_memory = False
+    tracemalloc.stop()
+    await service.cleanup()
+
+    latencies = service.latencies_ns
+    peak = service.peak_bytes
+    print(
+        f"{mix:<11} {len(frames):>7} {len(frames) / best:>11,.0f}"
+        f" {percentile(latencies, 50) / 1000:>8.1f} {percentile(latencies, 99) / 1000:>8.1f}"
+        f" {statistics.fmean(peak):>11,.0f}"
+    )
+
+
+async def bench_sessions(args, mix: str, task_manager: TaskManager):
+    frames = make_stream(mix, args.turns)
+    gc.collect()
+    baseline = current_rss_bytes()
+    services = []
+    for count in args.sessions:
+        new = [await create_service(args, task_manager) for _ in range(count - len(services))]
+        await asyncio.gather(*(run_session(service, frames) for service in new))
+        services.extend(new)
+        gc.collect()
+        rss = current_rss_bytes() - baseline
+        print(f"{mix:<11} {count:>8} {rss / 2**20:>9.1f} {rss / count / 2**10:>12,.0f}")
+    for service in services:
+        await service.cleanup()
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--mix", default=",".join(MIXES), help="comma-separated event mixes")
+    parser.add_argument("--turns", type=int, default=50, help="turns per synthetic session")
+    parser.add_argument("--repeat", type=int, default=5, help="throughput measurements per mix")
+    parser.add_argument(
+        "--sessions", default="1,10,50,100", help="comma-separated concurrent session counts"
+    )
+    parser.add_argument(
+        "--fast-audio-delta-parsing", action="store_true", help="enable the audio delta fast path"
+    )
+    args = parser.parse_args()
+    args.sessions = sorted(int(count) for count in args.sessions.split(","))
+    mixes = args.mix.split(",")
+
+    logger.remove()
+    task_manager = TaskManager()
+    task_manager.setup(TaskManagerParams(loop=asyncio.get_running_loop()))
+
+    print(f"{'mix':<11} {'events':>7} {'events/s':>11} {'p50 us':>8} {'p99 us':>8} {'peak B/evt':>11}")
+    for mix in mixes:
+        await bench_mix(args, mix, task_manager)
+
+    print(f"\n{'mix':<11} {'sessions':>8} {'RSS MiB':>9} {'KiB/session':>12}")
+    for mix in mixes:
+        await bench_sessions(args, mix, task_manager)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,80 @@
+"""Benchmark the telephony μ-law and resampling stage for many concurrent calls.
+
+Compares pipecat's per-call path (audioop plus a SOXR stream resampler per call) with the
+NumPy lookup-table codec and polyphase resampler, per call and in bulk across calls. Each
+round converts one 20 ms packet of every call inbound (8 kHz μ-law to 16 kHz PCM) and
+outbound (24 kHz PCM to 8 kHz μ-law).
+
+Usage:
+    python benchmarks/bench_telephony_codec.py [--calls 100] [--rounds 200]
+"""
+
+import argparse
+import asyncio
+import time
+
+import numpy as np
+from pipecat.audio.resamplers.soxr_stream_resampler import SOXRStreamAudioResampler
+from pipecat.audio.utils import pcm_to_ulaw, ulaw_to_pcm
+
+from pipecat_extension.audio.mulaw import ulaw_decode, ulaw_encode
+from pipecat_extension.audio.polyphase_resampler import PolyphaseResampler
+from pipecat_extension.audio.telephony_codec import pcm_to_ulaw_many, ulaw_to_pcm_many
+
+
+async def per_call(make_resampler, calls: int, rounds: int, inbound, outbound) -> float:
+    resamplers = [(make_resampler(), make_resampler()) for _ in range(calls)]
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for input_resampler, output_resampler in resamplers:
+            await ulaw_to_pcm(inbound, 8000, 16000, input_resampler)
+            await pcm_to_ulaw(outbound, 24000, 8000, output_resampler)
+    return time.perf_counter() - start
+
+
+async def per_call_numpy(calls: int, rounds: int, inbound, outbound) -> float:
+    resamplers = [(PolyphaseResampler(), PolyphaseResampler()) for _ in range(calls)]
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for input_resampler, output_resampler in resamplers:
+            samples = np.frombuffer(outbound, dtype=np.int16)
+            input_resampler.resample_samples(ulaw_decode(inbound), 8000, 16000).tobytes()
+            ulaw_encode(output_resampler.resample_samples(samples, 24000, 8000)).tobytes()
+    return time.perf_counter() - start
+
+
+def bulk(calls: int, rounds: int, inbound, outbound) -> float:
+    input_resamplers = [PolyphaseResampler() for _ in range(calls)]
+    output_resamplers = [PolyphaseResampler() for _ in range(calls)]
+    start = time.perf_counter()
+    for _ in range(rounds):
+        ulaw_to_pcm_many([inbound] * calls, 8000, 16000, input_resamplers)
+        pcm_to_ulaw_many([outbound] * calls, 24000, 8000, output_resamplers)
+    return time.perf_counter() - start
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=100, help="concurrent calls")
+    parser.add_argument("--rounds", type=int, default=200, help="20 ms packets per call")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    inbound = rng.integers(0, 256, 160, dtype=np.uint8).tobytes()
+    outbound = (rng.standard_normal(480) * 3000).astype(np.int16).tobytes()
+    packets = args.calls * args.rounds
+
+    results = {
+        "audioop + soxr": await per_call(
+            SOXRStreamAudioResampler, args.calls, args.rounds, inbound, outbound
+        ),
+        "numpy per call": await per_call_numpy(args.calls, args.rounds, inbound, outbound),
+        "numpy bulk": bulk(args.calls, args.rounds, inbound, outbound),
+    }
+    print(f"{args.calls} calls, {args.rounds} packets each way per call")
+    for name, elapsed in results.items():
+        print(f"{name:>15}: {elapsed / packets * 1e6:6.1f} us per call per 20 ms")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
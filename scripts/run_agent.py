@@ -12,9 +12,11 @@ from pipecat.services.openai.realtime.events import SessionProperties
 from pipecat.adapters.schemas.function_schema import FunctionSchema
 from pipecat.services.llm_service import FunctionCallParams
 from pipecat.adapters.schemas.tools_schema import ToolsSchema
-import pipecat.services.openai.realtime.events as events
 
 from pipecat_extension.services.openai_realtime_llm_service import OpenAIRealtimeLLMServiceExt
+from pipecat_extension.services.openai_realtime_conversation import ConversationStore
+from pipecat_extension.services.openai_realtime_reconnect import ReconnectParams
+from pipecat_extension.services.openai_realtime_sender import ClientEventSenderParams
 
 load_dotenv()
 
@@ -37,9 +39,10 @@ get_users_name_function = FunctionSchema(
 )
 
 async def get_users_name(params: FunctionCallParams):
-    await params.result_callback(
-        {"status": "PENDING"}
-    )
+    # Simulate a slow lookup. The model is told the call is PENDING straight away and the
+    # result is delivered in a <tool_result> item once it is ready.
+    await asyncio.sleep(3)
+    return "James Bower"
 
 
 
@@ -73,31 +76,15 @@ async def run_agent():
         api_key=os.getenv("OPENAI_API_KEY"),
         model="gpt-realtime-mini",
         session_properties=session_properties,
+        conversation_store=ConversationStore(max_audio_items=20),
+        client_event_sender_params=ClientEventSenderParams(),
+        reconnect_params=ReconnectParams(),
     )
-    llm.register_function("get_users_name", get_users_name)
+    llm.register_async_function("get_users_name", get_users_name, timeout=10)
 
     context = OpenAILLMContext()
     context_aggregator = llm.create_context_aggregator(context=context)
 
-    @llm.event_handler("after_function_call_output_sent")
-    async def after_function_call_output_sent_handler(processor: OpenAIRealtimeLLMServiceExt, frame):
-        await processor.send_client_event(
-            events.ConversationItemCreateEvent(
-                item=events.ConversationItem(
-                    type="message",
-                    role="user",
-                    content=[
-                        events.ItemContent(
-                            type="input_text",
-                            text="<tool_result>{\"tool_name\": \"get_users_name\", \"result\": \"James Bower\"}</tool_result>"
-                        )
-                    ]
-                )
-            )
-        )
-
-    
-
     pipeline = Pipeline(
         [
             transport.input(),
@@ -107,26 +94,10 @@ async def run_agent():
         ]
     )
 
-    conversation = {
-        "items": {}
-    }
-
     # Create and run the pipeline task
     task = PipelineTask(pipeline)
     runner = PipelineRunner()
 
-    @llm.event_handler("on_conversation_item_created")
-    async def on_conversation_item_created_handler(processor: OpenAIRealtimeLLMServiceExt, item_id: str, item: events.ConversationItem):
-        conversation["items"][item_id] = item
-
-    @llm.event_handler("on_conversation_item_updated")
-    async def on_conversation_item_updated_handler(processor: OpenAIRealtimeLLMServiceExt, item_id: str, item: events.ConversationItem):
-        conversation["items"][item_id] = item
-
-    @llm.event_handler("on_conversation_item_deleted")
-    async def on_conversation_item_deleted_handler(processor: OpenAIRealtimeLLMServiceExt, item_id: str):
-        del conversation["items"][item_id]
-
     @transport.event_handler("on_client_connected")
     async def on_client_connected_handler(tranport, client):
         await task.queue_frame(
@@ -139,7 +110,7 @@ async def run_agent():
     print("Starting agent... Press Ctrl+C to stop.")
     await runner.run(task)
 
-    for item in conversation["items"].values():
+    for item in llm.conversation.snapshot():
         print("--------------------------------")
         print(item)
         print("--------------------------------")
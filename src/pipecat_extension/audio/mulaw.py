@@ -0,0 +1,61 @@
+"""G.711 μ-law (PCMU) codec using NumPy lookup tables.
+
+Encoding and decoding are a single table lookup per sample and match ``audioop.lin2ulaw``
+and ``audioop.ulaw2lin`` bit for bit. Both functions take frames of any length, so the
+frames of many calls can be concatenated and converted in one call.
+"""
+
+import numpy as np
+
+_BIAS = 0x84
+_CLIP = 8159
+_SEGMENT_ENDS = np.array([0x3F, 0x7F, 0xFF, 0x1FF, 0x3FF, 0x7FF, 0xFFF, 0x1FFF])
+
+
+def _decode_table() -> np.ndarray:
+    u = ~np.arange(256, dtype=np.int32) & 0xFF
+    t = (((u & 0x0F) << 3) + _BIAS) << ((u & 0x70) >> 4)
+    return np.where(u & 0x80, _BIAS - t, t - _BIAS).astype(np.int16)
+
+
+def _encode_table() -> np.ndarray:
+    # Indexed by the top 14 bits of a 16-bit sample, as audioop drops the lowest two.
+    value = np.arange(16384, dtype=np.int32)
+    value = np.where(value >= 8192, value - 16384, value)
+    mask = np.where(value < 0, 0x7F, 0xFF)
+    value = np.minimum(np.abs(value), _CLIP) + (_BIAS >> 2)
+    segment = np.searchsorted(_SEGMENT_ENDS, value)
+    ulaw = np.where(segment < 8, (segment << 4) | ((value >> (segment + 1)) & 0x0F), 0x7F)
+    return ((ulaw ^ mask) & 0xFF).astype(np.uint8)
+
+
+ULAW_DECODE_TABLE = _decode_table()
+ULAW_ENCODE_TABLE = _encode_table()
+
+
+def ulaw_decode(data: bytes | np.ndarray) -> np.ndarray:
+    """Decode μ-law bytes to 16-bit PCM samples.
+
+    Args:
+        data: μ-law encoded audio as bytes or a uint8 array.
+
+    Returns:
+        An int16 array with one sample per input byte.
+    """
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        data = np.frombuffer(data, dtype=np.uint8)
+    return ULAW_DECODE_TABLE[data]
+
+
+def ulaw_encode(samples: bytes | np.ndarray) -> np.ndarray:
+    """Encode 16-bit PCM samples to μ-law.
+
+    Args:
+        samples: 16-bit signed PCM audio as bytes or an int16 array.
+
+    Returns:
+        A uint8 array with one μ-law byte per sample.
+    """
+    if isinstance(samples, (bytes, bytearray, memoryview)):
+        samples = np.frombuffer(samples, dtype=np.int16)
+    return ULAW_ENCODE_TABLE[(samples >> 2) & 0x3FFF]
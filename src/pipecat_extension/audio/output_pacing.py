@@ -0,0 +1,114 @@
+"""Pacing of the bot's audio at the output transport: send jitter and caller-side underruns.
+
+The output transport sends the bot's audio to the caller in chunks, at about the rate it
+plays. When the pipeline falls behind, because the TTS service is slow or the event loop is
+busy with other calls, chunks go out late and the caller's playout buffer runs dry, which
+the caller hears as a gap. :class:`AudioPacingObserver` watches the audio frames the output
+transport passes on after sending them, models the caller's playout buffer, and counts the
+underruns and the jitter of the send intervals.
+"""
+
+import math
+from dataclasses import dataclass
+from typing import Optional
+
+from pipecat.frames.frames import (
+    BotStoppedSpeakingFrame,
+    InterruptionFrame,
+    OutputAudioRawFrame,
+)
+from pipecat.observers.base_observer import BaseObserver, FramePushed
+from pipecat.processors.frame_processor import FrameDirection, FrameProcessor
+
+
+@dataclass
+class AudioPacingStats:
+    """Pacing of the audio sent by an output transport.
+
+    Parameters:
+        chunks: Audio chunks sent.
+        audio_secs: Seconds of audio sent.
+        underruns: Times the caller's playout buffer ran dry mid-utterance.
+        underrun_secs: Seconds of silence the underruns inserted.
+        jitter_secs: Standard deviation of the intervals between chunks of an utterance.
+        max_interval_secs: Longest interval between chunks of an utterance.
+    """
+
+    chunks: int = 0
+    audio_secs: float = 0.0
+    underruns: int = 0
+    underrun_secs: float = 0.0
+    jitter_secs: float = 0.0
+    max_interval_secs: float = 0.0
+
+
+class AudioPacingObserver(BaseObserver):
+    """Observer measuring how evenly an output transport sends the bot's audio.
+
+    The caller starts playing an utterance ``prebuffer_ms`` after its first chunk arrives
+    and plays the chunks back to back. A chunk sent after the previous ones have finished
+    playing is an underrun. An utterance ends when the transport reports that the bot
+    stopped speaking, or on an interruption.
+    """
+
+    def __init__(self, output: FrameProcessor, *, prebuffer_ms: float = 40, **kwargs):
+        """Initialize the observer.
+
+        Args:
+            output: The output transport, ``transport.output()``.
+            prebuffer_ms: Audio the caller buffers before playing an utterance. Defaults
+                to 40, one chunk, so that scheduling noise of a fraction of a millisecond
+                is not counted as an underrun.
+            **kwargs: Additional arguments passed to BaseObserver.
+        """
+        super().__init__(**kwargs)
+        self._output = output
+        self._prebuffer_secs = prebuffer_ms / 1000
+        self._stats = AudioPacingStats()
+        self._playout_end: Optional[float] = None
+        self._last_sent: Optional[float] = None
+        # Running mean and sum of squared deviations of the intervals (Welford).
+        self._intervals = 0
+        self._interval_mean = 0.0
+        self._interval_m2 = 0.0
+
+    @property
+    def stats(self) -> AudioPacingStats:
+        """Pacing of the audio sent so far."""
+        if self._intervals > 1:
+            self._stats.jitter_secs = math.sqrt(self._interval_m2 / (self._intervals - 1))
+        return self._stats
+
+    async def on_push_frame(self, data: FramePushed):
+        """Track the audio chunks and utterance ends passed on by the output transport."""
+        if data.source is not self._output or data.direction != FrameDirection.DOWNSTREAM:
+            return
+        frame = data.frame
+        if isinstance(frame, (BotStoppedSpeakingFrame, InterruptionFrame)):
+            self._playout_end = None
+            self._last_sent = None
+        elif isinstance(frame, OutputAudioRawFrame) and frame.audio:
+            duration = len(frame.audio) / (2 * frame.num_channels * frame.sample_rate)
+            self._on_chunk(data.timestamp / 1e9, duration)
+
+    def _on_chunk(self, sent: float, duration: float):
+        self._stats.chunks += 1
+        self._stats.audio_secs += duration
+
+        if self._playout_end is None:
+            self._playout_end = sent + self._prebuffer_secs + duration
+        elif sent > self._playout_end:
+            self._stats.underruns += 1
+            self._stats.underrun_secs += sent - self._playout_end
+            self._playout_end = sent + duration
+        else:
+            self._playout_end += duration
+
+        if self._last_sent is not None:
+            interval = sent - self._last_sent
+            self._intervals += 1
+            delta = interval - self._interval_mean
+            self._interval_mean += delta / self._intervals
+            self._interval_m2 += delta * (interval - self._interval_mean)
+            self._stats.max_interval_secs = max(self._stats.max_interval_secs, interval)
+        self._last_sent = sent
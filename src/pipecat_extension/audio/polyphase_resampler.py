@@ -0,0 +1,176 @@
+"""Streaming polyphase resampler for telephony rates, with state kept per call."""
+
+import math
+from functools import lru_cache
+from typing import Optional, Sequence
+
+import numpy as np
+
+from pipecat.audio.resamplers.base_audio_resampler import BaseAudioResampler
+
+
+@lru_cache(maxsize=None)
+def _design_filter(up: int, down: int, taps_per_phase: int) -> np.ndarray:
+    """Kaiser-windowed sinc low-pass split into ``up`` phases of ``taps_per_phase`` taps.
+
+    Row ``p`` holds the taps for output samples landing on phase ``p`` of the upsampled
+    grid, reversed so that each output is a dot product with a forward slice of the input.
+    """
+    length = up * taps_per_phase
+    cutoff = 0.95 / max(up, down)
+    n = np.arange(length) - (length - 1) / 2
+    taps = cutoff * np.sinc(cutoff * n) * np.kaiser(length, 8.0) * up
+    phases = taps.reshape(taps_per_phase, up).T
+    return np.ascontiguousarray(phases[:, ::-1], dtype=np.float32)
+
+
+@lru_cache(maxsize=256)
+def _resampling_matrix(
+    up: int, down: int, taps_per_phase: int, length: int, phase: int
+) -> tuple[np.ndarray, int]:
+    """Matrix mapping history plus a chunk of ``length`` samples to the output samples.
+
+    Returns the matrix and the number of outputs. Streams of fixed-size frames only ever
+    reach a few (length, phase) pairs, so each is built once and the chunk is converted
+    with a single matrix product, which also handles a stack of calls at once.
+    """
+    history = taps_per_phase - 1
+    outputs = max(0, -(-((history + length) * up - phase) // down))
+    positions = phase + down * np.arange(outputs)
+    starts = positions // up - history
+    matrix = np.zeros((history + length, outputs), dtype=np.float32)
+    rows = starts[:, None] + np.arange(taps_per_phase)
+    matrix[rows, np.arange(outputs)[:, None]] = _design_filter(up, down, taps_per_phase)[
+        positions % up
+    ]
+    return matrix, outputs
+
+
+class PolyphaseResampler(BaseAudioResampler):
+    """Rational-ratio polyphase FIR resampler that streams chunks of one call.
+
+    Keeps the last input samples and the output phase between chunks, so consecutive 20 ms
+    frames join without clicks, like SOXRStreamAudioResampler. Only the filter taps that
+    land on real input samples are used for each output sample, and each chunk is
+    converted with one matrix product. Filters are shared by every resampler with the same
+    rates. ``resample_many`` converts a chunk from each of many calls at once.
+
+    Notes:
+        - Only supports mono audio (1 channel).
+        - Input must be 16-bit signed PCM audio as raw bytes.
+    """
+
+    def __init__(self, *, width: int = 32, **kwargs):
+        """Initialize the resampler.
+
+        Args:
+            width: Filter length in samples at the lower of the two rates. Higher values
+                give a sharper cutoff at a proportional CPU cost. Defaults to 32.
+            **kwargs: Additional keyword arguments (currently unused).
+        """
+        self._width = width
+        self._taps_per_phase = width
+        self._in_rate: Optional[int] = None
+        self._out_rate: Optional[int] = None
+        self._up = 1
+        self._down = 1
+        self._history = np.zeros(0, dtype=np.float32)
+        self._phase = 0
+
+    def reset(self):
+        """Forget the previous input, as at the start of a new stream."""
+        self._history = np.zeros(self._taps_per_phase - 1, dtype=np.float32)
+        self._phase = (self._taps_per_phase - 1) * self._up
+
+    async def resample(self, audio: bytes, in_rate: int, out_rate: int) -> bytes:
+        """Resample a chunk of the stream.
+
+        Args:
+            audio: Input audio data as raw bytes (16-bit signed integers).
+            in_rate: Original sample rate in Hz.
+            out_rate: Target sample rate in Hz.
+
+        Returns:
+            Resampled audio data as raw bytes (16-bit signed integers).
+        """
+        if in_rate == out_rate:
+            return audio
+        samples = np.frombuffer(audio, dtype=np.int16)
+        return self.resample_samples(samples, in_rate, out_rate).tobytes()
+
+    def resample_samples(self, samples: np.ndarray, in_rate: int, out_rate: int) -> np.ndarray:
+        """Resample a chunk of int16 samples and return the resampled int16 samples."""
+        if in_rate == out_rate:
+            return samples
+        self._prepare(in_rate, out_rate)
+        buffer = np.concatenate((self._history, samples.astype(np.float32)))
+        return self._convert(buffer[None], len(samples))[0]
+
+    def _prepare(self, in_rate: int, out_rate: int):
+        if self._in_rate is None:
+            divisor = math.gcd(in_rate, out_rate)
+            self._in_rate = in_rate
+            self._out_rate = out_rate
+            self._up = out_rate // divisor
+            self._down = in_rate // divisor
+            self._taps_per_phase = self._width * -(-self._down // self._up)
+            self.reset()
+        elif self._in_rate != in_rate or self._out_rate != out_rate:
+            raise ValueError(
+                f"PolyphaseResampler cannot be reused with different sample rates: "
+                f"expected {self._in_rate}->{self._out_rate}, got {in_rate}->{out_rate}"
+            )
+
+    def _convert(self, buffers: np.ndarray, length: int) -> np.ndarray:
+        """Filter a stack of (history + chunk) rows sharing this resampler's state."""
+        matrix, outputs = _resampling_matrix(
+            self._up, self._down, self._taps_per_phase, length, self._phase
+        )
+        samples = np.clip(np.rint(buffers @ matrix), -32768, 32767).astype(np.int16)
+        self._history = buffers[0, -len(self._history) :].copy()
+        self._phase += outputs * self._down - length * self._up
+        return samples
+
+
+def resample_many(
+    resamplers: Sequence[PolyphaseResampler],
+    chunks: Sequence[np.ndarray],
+    in_rate: int,
+    out_rate: int,
+) -> list[np.ndarray]:
+    """Resample one chunk of int16 samples for each of many calls.
+
+    Calls whose chunks have the same length and whose streams are at the same phase, as
+    with 20 ms frames through resamplers of the same width, are stacked and converted
+    with one matrix product.
+
+    Args:
+        resamplers: One resampler per call, each used for a single stream.
+        chunks: The next int16 chunk of each call's stream.
+        in_rate: Original sample rate in Hz.
+        out_rate: Target sample rate in Hz.
+
+    Returns:
+        The resampled int16 chunk of each call, in order.
+    """
+    groups: dict[tuple[int, int, int], list[int]] = {}
+    for i, (resampler, chunk) in enumerate(zip(resamplers, chunks)):
+        resampler._prepare(in_rate, out_rate)
+        key = (len(chunk), resampler._phase, resampler._taps_per_phase)
+        groups.setdefault(key, []).append(i)
+
+    results: list[np.ndarray] = [None] * len(resamplers)
+    for (length, _, history), indices in groups.items():
+        history -= 1
+        buffers = np.empty((len(indices), history + length), dtype=np.float32)
+        for row, i in enumerate(indices):
+            buffers[row, :history] = resamplers[i]._history
+            buffers[row, history:] = chunks[i]
+
+        samples = resamplers[indices[0]]._convert(buffers, length)
+        for row, i in enumerate(indices[1:], start=1):
+            resamplers[i]._history = buffers[row, -history:].copy()
+            resamplers[i]._phase = resamplers[indices[0]]._phase
+        for row, i in enumerate(indices):
+            results[i] = samples[row]
+    return results
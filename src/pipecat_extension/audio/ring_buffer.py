@@ -0,0 +1,81 @@
+"""Fixed-size audio ring buffer with contiguous views of its most recent samples."""
+
+from typing import Optional
+
+import numpy as np
+
+
+class AudioRingBuffer:
+    """Preallocated ring buffer keeping the most recent ``capacity`` samples.
+
+    Every sample is written twice, ``capacity`` apart, so the last ``n`` samples are always a
+    contiguous slice of the backing array and can be returned as a view without copying,
+    whatever the write position. Appending costs one copy of the chunk into each half;
+    memory stays at ``2 * capacity`` samples however long the stream runs.
+    """
+
+    def __init__(self, capacity: int, dtype=np.float32):
+        """Initialize the buffer.
+
+        Args:
+            capacity: Number of samples kept.
+            dtype: Sample type. Defaults to float32.
+        """
+        self._capacity = capacity
+        self._data = np.zeros(2 * capacity, dtype=dtype)
+        self._position = 0
+        self._length = 0
+        self._total = 0
+
+    @property
+    def capacity(self) -> int:
+        """Number of samples the buffer keeps."""
+        return self._capacity
+
+    @property
+    def nbytes(self) -> int:
+        """Memory allocated for samples, in bytes."""
+        return self._data.nbytes
+
+    @property
+    def total_written(self) -> int:
+        """Number of samples appended since the buffer was created or cleared."""
+        return self._total
+
+    def __len__(self) -> int:
+        """Number of samples currently held."""
+        return self._length
+
+    def append(self, samples: np.ndarray):
+        """Append samples, overwriting the oldest ones once the buffer is full."""
+        self._total += len(samples)
+        samples = samples[-self._capacity :]
+        count = len(samples)
+        first = min(count, self._capacity - self._position)
+        self._write(self._position, samples[:first])
+        self._write(0, samples[first:])
+        self._position = (self._position + count) % self._capacity
+        self._length = min(self._length + count, self._capacity)
+
+    def view(self, count: Optional[int] = None) -> np.ndarray:
+        """Return a read-only view of the most recent ``count`` samples (all held by default).
+
+        The view is only valid until the next ``append``, which may overwrite its oldest
+        samples. Copy it before handing it to another thread.
+        """
+        count = self._length if count is None else min(count, self._length)
+        end = self._position + self._capacity
+        view = self._data[end - count : end]
+        view.flags.writeable = False
+        return view
+
+    def clear(self):
+        """Drop all samples. The memory stays allocated."""
+        self._position = 0
+        self._length = 0
+        self._total = 0
+
+    def _write(self, start: int, samples: np.ndarray):
+        if len(samples):
+            self._data[start : start + len(samples)] = samples
+            self._data[start + self._capacity : start + self._capacity + len(samples)] = samples
@@ -0,0 +1,67 @@
+"""Bulk μ-law and resampling stage for the telephony audio of many calls.
+
+The per-call equivalents are pipecat's ``ulaw_to_pcm`` and ``pcm_to_ulaw``. Those run one
+C call per packet, which is hard to beat for a single call; these functions convert one
+packet from each of many calls together, so the per-packet NumPy overhead is paid once
+per batch instead of once per call.
+"""
+
+from typing import Sequence
+
+import numpy as np
+
+from pipecat_extension.audio.mulaw import ulaw_decode, ulaw_encode
+from pipecat_extension.audio.polyphase_resampler import PolyphaseResampler, resample_many
+
+
+def ulaw_to_pcm_many(
+    payloads: Sequence[bytes],
+    in_rate: int,
+    out_rate: int,
+    resamplers: Sequence[PolyphaseResampler],
+) -> list[bytes]:
+    """Decode and resample one μ-law packet from each of many calls.
+
+    Args:
+        payloads: The next μ-law packet of each call.
+        in_rate: Sample rate of the μ-law audio in Hz.
+        out_rate: Desired output sample rate in Hz.
+        resamplers: The input resampler of each call, in the same order.
+
+    Returns:
+        16-bit PCM audio of each call at ``out_rate``, in order.
+    """
+    if not payloads:
+        return []
+    samples = ulaw_decode(b"".join(payloads))
+    chunks = np.split(samples, np.cumsum([len(payload) for payload in payloads[:-1]]))
+    if in_rate != out_rate:
+        chunks = resample_many(resamplers, chunks, in_rate, out_rate)
+    return [chunk.tobytes() for chunk in chunks]
+
+
+def pcm_to_ulaw_many(
+    pcm: Sequence[bytes],
+    in_rate: int,
+    out_rate: int,
+    resamplers: Sequence[PolyphaseResampler],
+) -> list[bytes]:
+    """Resample and encode one 16-bit PCM chunk from each of many calls.
+
+    Args:
+        pcm: The next 16-bit PCM chunk of each call.
+        in_rate: Sample rate of the PCM audio in Hz.
+        out_rate: Desired μ-law sample rate in Hz.
+        resamplers: The output resampler of each call, in the same order.
+
+    Returns:
+        μ-law audio of each call at ``out_rate``, in order.
+    """
+    if not pcm:
+        return []
+    chunks = [np.frombuffer(data, dtype=np.int16) for data in pcm]
+    if in_rate != out_rate:
+        chunks = resample_many(resamplers, chunks, in_rate, out_rate)
+    encoded = ulaw_encode(np.concatenate(chunks)).tobytes()
+    offsets = np.cumsum([0] + [len(chunk) for chunk in chunks])
+    return [encoded[start:end] for start, end in zip(offsets[:-1], offsets[1:])]
@@ -0,0 +1,297 @@
+"""Smart-turn analysis with a model and inference threads shared by every call in the process."""
+
+import asyncio
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import numpy as np
+from loguru import logger
+
+from pipecat.audio.turn.base_turn_analyzer import EndOfTurnState
+from pipecat.audio.turn.smart_turn.base_smart_turn import BaseSmartTurn, SmartTurnParams
+from pipecat.metrics.metrics import MetricsData, SmartTurnMetricsData
+
+from pipecat_extension.audio.ring_buffer import AudioRingBuffer
+
+Predictor = Callable[[np.ndarray], Dict[str, Any]]
+
+
+class SmartTurnInferencePool:
+    """One smart-turn model and a pool of threads running it, shared by many analyzers.
+
+    LocalSmartTurnAnalyzerV3 loads its own ONNX session and starts its own thread for every
+    call. The pool loads the model once and bounds the number of concurrent inferences across
+    all calls in the process. ONNX Runtime releases the GIL while it runs, so threads give real
+    parallelism without copying audio to another process.
+    """
+
+    def __init__(
+        self,
+        *,
+        smart_turn_model_path: Optional[str] = None,
+        max_workers: Optional[int] = None,
+        predict: Optional[Predictor] = None,
+    ):
+        """Initialize the pool.
+
+        Args:
+            smart_turn_model_path: Path to the smart-turn-v3 ONNX model. If None, the model
+                bundled with pipecat is used.
+            max_workers: Number of inference threads. Defaults to the number of CPUs.
+            predict: Function mapping 16 kHz float32 audio to a prediction dict, used instead
+                of loading the smart-turn-v3 model.
+        """
+        if predict is None:
+            from pipecat.audio.turn.smart_turn.local_smart_turn_v3 import LocalSmartTurnAnalyzerV3
+
+            model = LocalSmartTurnAnalyzerV3(smart_turn_model_path=smart_turn_model_path)
+            predict = model._predict_endpoint
+        self._predict = predict
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers or os.cpu_count() or 1, thread_name_prefix="smart-turn"
+        )
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """The executor inference runs on."""
+        return self._executor
+
+    def run_model(self, audio: np.ndarray) -> Dict[str, Any]:
+        """Run the model on ``audio`` in the calling thread, timing the inference."""
+        start = time.perf_counter()
+        result = self._predict(audio)
+        return {**result, "metrics": {"inference_time": time.perf_counter() - start}}
+
+    async def predict(self, audio: np.ndarray) -> Dict[str, Any]:
+        """Run the model on ``audio`` in the pool's threads without blocking the event loop."""
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, self.run_model, audio
+        )
+
+    def shutdown(self):
+        """Stop the inference threads, dropping evaluations that have not started."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+class PooledSmartTurnMetricsData(SmartTurnMetricsData):
+    """Smart turn prediction metrics with the analyzer's audio memory.
+
+    Parameters:
+        audio_buffer_bytes: Memory allocated for the turn audio of the call.
+        segment_ms: Duration of the audio evaluated.
+    """
+
+    audio_buffer_bytes: int
+    segment_ms: float
+
+
+class PooledSmartTurnParams(SmartTurnParams):
+    """Configuration parameters for PooledSmartTurnAnalyzer.
+
+    Parameters:
+        reevaluation_interval_ms: While a turn the model judged incomplete is followed by
+            silence, the model is run again every this many milliseconds of audio, so a turn
+            can complete before ``stop_secs``. None only evaluates when the VAD reports the
+            user stopped speaking. Defaults to 200.
+    """
+
+    reevaluation_interval_ms: Optional[float] = 200
+
+
+class PooledSmartTurnAnalyzer(BaseSmartTurn):
+    """Smart-turn analyzer that runs inference on a shared SmartTurnInferencePool.
+
+    When the transport's VAD reports the user stopped speaking, the turn is evaluated as with
+    any smart-turn analyzer. If the model judges it incomplete, the audio is kept and the turn
+    is evaluated again in the background every ``reevaluation_interval_ms`` of silence; a
+    complete result is reported by the next ``append_audio`` call, which the transport handles
+    like a ``stop_secs`` timeout. New speech cancels any evaluation still pending, since its
+    audio no longer ends the turn.
+
+    Turn audio is kept in a preallocated AudioRingBuffer holding ``max_duration_secs``, the
+    most the model is ever given, so memory and inference cost per call stay bounded however
+    long the caller speaks. Each prediction's metrics report the buffer's size.
+    """
+
+    def __init__(
+        self,
+        pool: SmartTurnInferencePool,
+        *,
+        sample_rate: Optional[int] = None,
+        params: Optional[PooledSmartTurnParams] = None,
+    ):
+        """Initialize the analyzer.
+
+        Args:
+            pool: The shared model and inference threads.
+            sample_rate: Optional sample rate for audio processing.
+            params: Configuration parameters. If None, uses default PooledSmartTurnParams.
+        """
+        super().__init__(sample_rate=sample_rate, params=params or PooledSmartTurnParams())
+        self._pool = pool
+        self._awaiting_end_of_turn = False
+        self._silence_since_evaluation_ms = 0.0
+        self._evaluation: Optional[asyncio.Task] = None
+        self._evaluation_complete = False
+        self._ring: Optional[AudioRingBuffer] = None
+        self._speech_start_sample: Optional[int] = None
+
+    @property
+    def audio_buffer_bytes(self) -> int:
+        """Memory allocated for turn audio, in bytes."""
+        return self._ring.nbytes if self._ring is not None else 0
+
+    def set_sample_rate(self, sample_rate: int):
+        """Set the sample rate and allocate the turn audio buffer for it.
+
+        Args:
+            sample_rate: The sample rate to set.
+        """
+        super().set_sample_rate(sample_rate)
+        capacity = int(self._params.max_duration_secs * self.sample_rate)
+        if self._ring is None or self._ring.capacity != capacity:
+            self._ring = AudioRingBuffer(capacity)
+
+    def append_audio(self, buffer: bytes, is_speech: bool) -> EndOfTurnState:
+        """Append audio, scheduling re-evaluations and reporting their results.
+
+        Args:
+            buffer: Raw audio data bytes to append for analysis.
+            is_speech: Whether the audio buffer contains detected speech.
+
+        Returns:
+            COMPLETE if ``stop_secs`` of silence elapsed or a background evaluation found the
+            turn complete, INCOMPLETE otherwise.
+        """
+        if self._ring is None:
+            self.set_sample_rate(self._sample_rate)
+        audio = np.frombuffer(buffer, dtype=np.int16).astype(np.float32)
+        audio *= 1 / 32768
+        self._ring.append(audio)
+        chunk_ms = len(audio) / (self.sample_rate / 1000)
+
+        if is_speech:
+            self._cancel_evaluation()
+            self._awaiting_end_of_turn = False
+            self._silence_ms = 0
+            self._speech_triggered = True
+            if self._speech_start_sample is None:
+                self._speech_start_sample = self._ring.total_written - len(audio)
+        elif self._speech_triggered:
+            self._silence_ms += chunk_ms
+            if self._silence_ms >= self._stop_ms:
+                logger.debug(
+                    f"End of Turn complete due to stop_secs. Silence in ms: {self._silence_ms}"
+                )
+                self._clear(EndOfTurnState.COMPLETE)
+                self._reset_evaluation()
+                return EndOfTurnState.COMPLETE
+
+        if self._evaluation_complete:
+            self._clear(EndOfTurnState.COMPLETE)
+            self._reset_evaluation()
+            return EndOfTurnState.COMPLETE
+
+        interval = self._params.reevaluation_interval_ms
+        if self._awaiting_end_of_turn and interval is not None:
+            self._silence_since_evaluation_ms += chunk_ms
+            if self._silence_since_evaluation_ms >= interval and not self._evaluation:
+                self._silence_since_evaluation_ms = 0.0
+                self._start_evaluation()
+        return EndOfTurnState.INCOMPLETE
+
+    async def analyze_end_of_turn(self) -> Tuple[EndOfTurnState, Optional[MetricsData]]:
+        """Evaluate the turn on the shared pool.
+
+        Returns:
+            Tuple containing the end-of-turn state and the model's metrics data.
+        """
+        self._cancel_evaluation()
+        state, result = await self._evaluate(self._speech_segment())
+        if state == EndOfTurnState.COMPLETE:
+            self._clear(state)
+            self._reset_evaluation()
+        else:
+            self._awaiting_end_of_turn = True
+            self._silence_since_evaluation_ms = 0.0
+        logger.debug(f"End of Turn result: {state}")
+        return state, result
+
+    def clear(self):
+        """Reset the analyzer, cancelling any pending evaluation."""
+        super().clear()
+        self._reset_evaluation()
+
+    def _clear(self, turn_state: EndOfTurnState):
+        """Clear the turn state, dropping the audio once the turn is complete."""
+        super()._clear(turn_state)
+        self._speech_start_sample = None
+        if self._ring is not None and turn_state == EndOfTurnState.COMPLETE:
+            self._ring.clear()
+
+    def _predict_endpoint(self, audio_array: np.ndarray) -> Dict[str, Any]:
+        """Predict end-of-turn with the pool's model in the calling thread."""
+        return self._pool.run_model(audio_array)
+
+    def _speech_segment(self) -> Optional[np.ndarray]:
+        """Return a view of the turn's audio, from ``pre_speech_ms`` before speech started."""
+        if self._ring is None or not len(self._ring):
+            return None
+        count = None
+        if self._speech_start_sample is not None:
+            pre_speech = int(self._params.pre_speech_ms / 1000 * self.sample_rate)
+            count = self._ring.total_written - self._speech_start_sample + pre_speech
+        return self._ring.view(count)
+
+    async def _evaluate(
+        self, segment: Optional[np.ndarray]
+    ) -> Tuple[EndOfTurnState, Optional[MetricsData]]:
+        if segment is None or not len(segment):
+            return EndOfTurnState.INCOMPLETE, None
+        start_time = time.perf_counter()
+        # The ring keeps being written while the pool runs, so the pool gets its own copy.
+        result = await self._pool.predict(segment.copy())
+        metrics = result.get("metrics", {})
+        is_complete = result["prediction"] == 1
+        state = EndOfTurnState.COMPLETE if is_complete else EndOfTurnState.INCOMPLETE
+        return state, PooledSmartTurnMetricsData(
+            processor="PooledSmartTurnAnalyzer",
+            is_complete=is_complete,
+            probability=result["probability"],
+            inference_time_ms=metrics.get("inference_time", 0) * 1000,
+            server_total_time_ms=0,
+            e2e_processing_time_ms=(time.perf_counter() - start_time) * 1000,
+            audio_buffer_bytes=self.audio_buffer_bytes,
+            segment_ms=len(segment) / (self.sample_rate / 1000),
+        )
+
+    def _start_evaluation(self):
+        evaluation = asyncio.create_task(self._evaluate(self._speech_segment()))
+        evaluation.add_done_callback(self._on_evaluation_done)
+        self._evaluation = evaluation
+
+    def _on_evaluation_done(self, evaluation: asyncio.Task):
+        if evaluation is not self._evaluation:
+            return  # superseded by new speech or a new turn
+        self._evaluation = None
+        if evaluation.cancelled():
+            return
+        if evaluation.exception():
+            logger.error(f"Smart turn evaluation failed: {evaluation.exception()}")
+            return
+        state, _ = evaluation.result()
+        logger.debug(f"End of Turn re-evaluation result: {state}")
+        self._evaluation_complete = state == EndOfTurnState.COMPLETE
+
+    def _cancel_evaluation(self):
+        if self._evaluation:
+            self._evaluation.cancel()
+            self._evaluation = None
+        self._evaluation_complete = False
+        self._silence_since_evaluation_ms = 0.0
+
+    def _reset_evaluation(self):
+        self._cancel_evaluation()
+        self._awaiting_end_of_turn = False
@@ -0,0 +1,242 @@
+"""Silero VAD with one model per process and batched inference across calls."""
+
+import asyncio
+import os
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from importlib import resources
+from typing import Optional
+
+import numpy as np
+from loguru import logger
+
+from pipecat.audio.vad.vad_analyzer import VADAnalyzer, VADParams, VADState
+
+# How often each call's recurrent state is reset, as SileroVADAnalyzer does.
+_MODEL_RESET_STATES_TIME = 5.0
+
+
+class SileroVADPool:
+    """One Silero VAD ONNX session shared by every call in the process.
+
+    SileroVADAnalyzer loads its own session for every call. The pool loads the model once
+    and runs the windows of all calls waiting for a result as one batch: while a batch runs,
+    new windows queue up and form the next one, so batches grow with load without adding a
+    wait when the pool is idle. The recurrent state stays with each call's analyzer.
+    """
+
+    def __init__(
+        self,
+        *,
+        model_path: Optional[str] = None,
+        max_batch_size: int = 256,
+        max_workers: Optional[int] = None,
+    ):
+        """Initialize the pool.
+
+        Args:
+            model_path: Path to the Silero VAD ONNX model. If None, the model bundled with
+                pipecat is used.
+            max_batch_size: Maximum number of windows run together. Defaults to 256.
+            max_workers: Threads running inference and the analyzers' volume and state
+                updates. Defaults to the number of CPUs.
+        """
+        import onnxruntime
+
+        if not model_path:
+            model_path = str(resources.files("pipecat.audio.vad.data").joinpath("silero_vad.onnx"))
+        opts = onnxruntime.SessionOptions()
+        opts.inter_op_num_threads = 1
+        opts.intra_op_num_threads = 1
+        self._session = onnxruntime.InferenceSession(
+            model_path, providers=["CPUExecutionProvider"], sess_options=opts
+        )
+        self._max_batch_size = max_batch_size
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers or os.cpu_count() or 1, thread_name_prefix="silero-vad"
+        )
+        self._requests: Optional[asyncio.Queue] = None
+        self._batch_task: Optional[asyncio.Task] = None
+        self._batches = 0
+        self._windows = 0
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """The executor inference and analyzer bookkeeping run on."""
+        return self._executor
+
+    @property
+    def average_batch_size(self) -> float:
+        """Mean number of windows per batch run so far."""
+        return self._windows / self._batches if self._batches else 0.0
+
+    async def voice_confidence(
+        self, analyzer: "SharedSileroVADAnalyzer", window: np.ndarray
+    ) -> float:
+        """Return the voice confidence of one window, advancing the analyzer's state."""
+        if not self._batch_task:
+            self._requests = asyncio.Queue()
+            self._batch_task = asyncio.get_running_loop().create_task(self._batch_task_handler())
+        future = asyncio.get_running_loop().create_future()
+        self._requests.put_nowait((analyzer, window, future))
+        return await future
+
+    def shutdown(self):
+        """Stop batching and the worker threads."""
+        if self._batch_task:
+            self._batch_task.cancel()
+            self._batch_task = None
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    async def _batch_task_handler(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._requests.get()]
+            while len(batch) < self._max_batch_size and not self._requests.empty():
+                batch.append(self._requests.get_nowait())
+            batch = [request for request in batch if not request[2].done()]
+            if not batch:
+                continue
+            try:
+                confidences = await loop.run_in_executor(self._executor, self._run_batch, batch)
+            except Exception as e:
+                for _, _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+            for (_, _, future), confidence in zip(batch, confidences):
+                if not future.done():
+                    future.set_result(confidence)
+
+    def _run_batch(self, batch: list) -> list[float]:
+        confidences = [0.0] * len(batch)
+        by_sample_rate: dict[int, list[int]] = {}
+        for i, (analyzer, _, _) in enumerate(batch):
+            by_sample_rate.setdefault(analyzer.sample_rate, []).append(i)
+        for sample_rate, indices in by_sample_rate.items():
+            analyzers = [batch[i][0] for i in indices]
+            x = np.concatenate(
+                [np.concatenate((a._context, batch[i][1]))[None] for a, i in zip(analyzers, indices)]
+            )
+            state = np.concatenate([a._state for a in analyzers], axis=1)
+            out, state = self._session.run(
+                None, {"input": x, "state": state, "sr": np.array(sample_rate, dtype=np.int64)}
+            )
+            context_size = len(analyzers[0]._context)
+            for j, (analyzer, i) in enumerate(zip(analyzers, indices)):
+                analyzer._state = state[:, j : j + 1].copy()
+                analyzer._context = x[j, -context_size:].copy()
+                confidences[i] = float(out[j, 0])
+        self._batches += 1
+        self._windows += len(batch)
+        return confidences
+
+
+class SharedSileroVADAnalyzer(VADAnalyzer):
+    """Silero VAD analyzer running on a shared SileroVADPool.
+
+    Behaves like SileroVADAnalyzer, but the model lives in the pool and only this call's
+    recurrent state lives here. ``last_latency_ms`` and ``max_latency_ms`` report how long
+    ``analyze_audio`` took, including the wait for a batch.
+    """
+
+    def __init__(
+        self,
+        pool: SileroVADPool,
+        *,
+        sample_rate: Optional[int] = None,
+        params: Optional[VADParams] = None,
+    ):
+        """Initialize the analyzer.
+
+        Args:
+            pool: The shared model.
+            sample_rate: Audio sample rate (8000 or 16000 Hz). If None, will be set later.
+            params: VAD parameters for detection thresholds and timing.
+        """
+        super().__init__(sample_rate=sample_rate, params=params)
+        self._pool = pool
+        self._state = np.zeros((2, 1, 128), dtype=np.float32)
+        self._context = np.zeros(0, dtype=np.float32)
+        self._last_reset_time = 0.0
+        self._confidences: deque[float] = deque()
+        self._last_latency_ms = 0.0
+        self._max_latency_ms = 0.0
+
+    @property
+    def last_latency_ms(self) -> float:
+        """Duration of the last ``analyze_audio`` call in milliseconds."""
+        return self._last_latency_ms
+
+    @property
+    def max_latency_ms(self) -> float:
+        """Longest ``analyze_audio`` call so far in milliseconds."""
+        return self._max_latency_ms
+
+    def set_sample_rate(self, sample_rate: int):
+        """Set the sample rate and reset the recurrent state.
+
+        Args:
+            sample_rate: Audio sample rate (must be 8000 or 16000 Hz).
+
+        Raises:
+            ValueError: If sample rate is not 8000 or 16000 Hz.
+        """
+        if sample_rate != 16000 and sample_rate != 8000:
+            raise ValueError(
+                f"Silero VAD sample rate needs to be 16000 or 8000 (sample rate: {sample_rate})"
+            )
+        super().set_sample_rate(sample_rate)
+        self._reset_states()
+
+    def num_frames_required(self) -> int:
+        """Get the number of audio frames required for VAD analysis.
+
+        Returns:
+            Number of frames required (512 for 16kHz, 256 for 8kHz).
+        """
+        return 512 if self.sample_rate == 16000 else 256
+
+    def voice_confidence(self, buffer) -> float:
+        """Return the confidence computed for this window by ``analyze_audio``."""
+        return self._confidences.popleft()
+
+    async def analyze_audio(self, buffer: bytes) -> VADState:
+        """Analyze an audio buffer and return the current VAD state.
+
+        The windows completed by ``buffer`` are evaluated on the pool first; the base state
+        machine then runs on the pool's threads with those confidences.
+
+        Args:
+            buffer: Audio buffer to analyze.
+
+        Returns:
+            Current VAD state after processing the buffer.
+        """
+        start = time.perf_counter()
+        window_bytes = self._vad_frames_num_bytes
+        pending = self._vad_buffer + buffer
+        for offset in range(0, len(pending) - window_bytes + 1, window_bytes):
+            if start - self._last_reset_time >= _MODEL_RESET_STATES_TIME:
+                self._reset_states()
+                self._last_reset_time = start
+            window = np.frombuffer(pending, np.int16, window_bytes // 2, offset)
+            window = window.astype(np.float32) / 32768.0
+            try:
+                confidence = await self._pool.voice_confidence(self, window)
+            except Exception as e:
+                logger.error(f"Error analyzing audio with Silero VAD: {e}")
+                confidence = 0.0
+            self._confidences.append(confidence)
+
+        loop = asyncio.get_running_loop()
+        state = await loop.run_in_executor(self._pool.executor, self._run_analyzer, buffer)
+        self._last_latency_ms = (time.perf_counter() - start) * 1000
+        self._max_latency_ms = max(self._max_latency_ms, self._last_latency_ms)
+        return state
+
+    def _reset_states(self):
+        context_size = 64 if self.sample_rate == 16000 else 32
+        self._state = np.zeros((2, 1, 128), dtype=np.float32)
+        self._context = np.zeros(context_size, dtype=np.float32)
@@ -0,0 +1,169 @@
+"""Sliding-window compaction of an LLMContext, run in the background between turns.
+
+A call's context grows by a few messages every turn, and every turn sends all of them, so
+time to first token grows with the length of the call. :class:`ContextCompactor` keeps the
+leading prefix messages (the system prompt) and the most recent turns verbatim and replaces
+the turns in between with a single digest message.
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, List, Mapping, Optional
+from xml.sax.saxutils import escape
+
+from loguru import logger
+from pydantic import BaseModel
+
+from pipecat.frames.frames import Frame, LLMContextAssistantTimestampFrame
+from pipecat.processors.aggregators.llm_context import LLMContext, LLMContextMessage
+from pipecat.processors.frame_processor import FrameDirection, FrameProcessor
+
+Digest = Callable[[List[LLMContextMessage]], Awaitable[LLMContextMessage]]
+
+
+def form_state_digest(questionnaire: Mapping[str, Mapping[str, Any]]) -> Digest:
+    """Return a digest that replaces folded turns with the answers recorded so far.
+
+    The folded turns of a form-filling call mostly collect answers, which the questionnaire
+    already holds, so the digest is built from the questionnaire rather than the messages.
+
+    Args:
+        questionnaire: The call's questions by id, each with its ``answer`` (None if not
+            answered yet). Read when the digest runs, so it reflects the latest answers.
+    """
+
+    async def digest(folded: List[LLMContextMessage]) -> LLMContextMessage:
+        answers = "".join(
+            f"<answer><question_id>{escape(question_id)}</question_id>"
+            f"<value>{escape(question['answer'])}</value></answer>\n"
+            for question_id, question in questionnaire.items()
+            if question.get("answer") is not None
+        )
+        return {
+            "role": "user",
+            "content": (
+                "<system>Earlier turns of this call were removed to keep the conversation "
+                "short. The answers recorded so far are below; questions not listed are "
+                f"still unanswered.\n<form_state>\n{answers}</form_state></system>"
+            ),
+        }
+
+    return digest
+
+
+class ContextCompactionParams(BaseModel):
+    """Configuration parameters for ContextCompactor.
+
+    Parameters:
+        keep_prefix_messages: Leading messages never folded. Defaults to 1 (the system
+            message).
+        max_turns: Turns, counted by user messages, the context may hold before older ones
+            are folded. Defaults to 12.
+        keep_turns: Most recent turns kept verbatim when folding. Defaults to 6. The gap to
+            ``max_turns`` keeps the digest, and so the provider's prompt cache up to it,
+            unchanged for several turns.
+    """
+
+    keep_prefix_messages: int = 1
+    max_turns: int = 12
+    keep_turns: int = 6
+
+
+class ContextCompactor(FrameProcessor):
+    """Processor folding old turns of an LLMContext into a digest in the background.
+
+    Place it after the assistant context aggregator. When the assistant's turn has been
+    added to the context, and the context holds more than ``max_turns`` turns, the turns
+    before the last ``keep_turns`` are handed to ``digest`` in a background task. The
+    digest then replaces them, unless the context was rewritten in the meantime. Folding
+    starts at a user message, so function calls stay together with their results.
+    Previous digests are folded again and passed to ``digest`` with the turns.
+    """
+
+    def __init__(
+        self,
+        context: LLMContext,
+        digest: Digest,
+        *,
+        params: Optional[ContextCompactionParams] = None,
+        **kwargs,
+    ):
+        """Initialize the compactor.
+
+        Args:
+            context: The context shared with the aggregators.
+            digest: Coroutine function mapping the folded messages to the message that
+                replaces them.
+            params: Compaction parameters.
+            **kwargs: Additional arguments passed to FrameProcessor.
+        """
+        super().__init__(**kwargs)
+        self._context = context
+        self._digest = digest
+        self._params = params or ContextCompactionParams()
+        self._task: Optional[asyncio.Task] = None
+        self._digest_message: Optional[LLMContextMessage] = None
+        self._compactions = 0
+        self._folded_messages = 0
+
+    @property
+    def compactions(self) -> int:
+        """Number of times old turns were folded."""
+        return self._compactions
+
+    @property
+    def folded_messages(self) -> int:
+        """Total number of messages replaced by digests."""
+        return self._folded_messages
+
+    async def process_frame(self, frame: Frame, direction: FrameDirection):
+        """Pass frames through and start compaction after each assistant turn."""
+        await super().process_frame(frame, direction)
+        await self.push_frame(frame, direction)
+        if isinstance(frame, LLMContextAssistantTimestampFrame) and not self._task:
+            self._maybe_compact()
+
+    async def cleanup(self):
+        """Cancel a compaction still running."""
+        await super().cleanup()
+        if self._task:
+            await self.cancel_task(self._task)
+            self._task = None
+
+    def _maybe_compact(self):
+        messages = self._context.messages
+        prefix = self._params.keep_prefix_messages
+        turns = [
+            i
+            for i, message in enumerate(messages)
+            if i >= prefix
+            and message is not self._digest_message
+            and isinstance(message, dict)
+            and message.get("role") == "user"
+        ]
+        if len(turns) <= self._params.max_turns:
+            return
+        split = turns[-self._params.keep_turns]
+        self._task = self.create_task(self._compact(messages[prefix:split], split))
+
+    async def _compact(self, folded: List[LLMContextMessage], split: int):
+        try:
+            digest = await self._digest(list(folded))
+        except Exception as e:
+            logger.warning(f"{self} failed to build a context digest: {e}")
+            return
+        finally:
+            self._task = None
+
+        messages = self._context.messages
+        prefix = self._params.keep_prefix_messages
+        current = messages[prefix:split]
+        if len(current) != len(folded) or any(a is not b for a, b in zip(current, folded)):
+            logger.debug(f"{self}: context changed while compacting, skipping")
+            return
+        self._context.set_messages(messages[:prefix] + [digest] + messages[split:])
+        self._digest_message = digest
+        self._compactions += 1
+        self._folded_messages += len(folded)
+        logger.debug(
+            f"{self}: folded {len(folded)} messages, {len(self._context.messages)} remain"
+        )
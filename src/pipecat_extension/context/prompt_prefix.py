@@ -0,0 +1,166 @@
+"""Static prompt prefixes that stay byte-identical across turns and calls, for prompt caching.
+
+LLM providers cache the longest prompt prefix they have seen recently. OpenAI caches prompts
+of 1024 tokens and more, in 128-token steps, and only while the tools and the start of the
+messages are byte-identical. :class:`StaticPromptPrefix` renders the system message once and
+hands every call the same text, along with a ``prompt_cache_key`` that routes requests
+sharing it to the same cache. Everything that changes during a call (form answers,
+instructions for the next turn) belongs in later messages. :class:`PromptCacheObserver`
+reports how many prompt tokens each turn read from the cache.
+"""
+
+import copy
+import hashlib
+import json
+from dataclasses import dataclass
+from typing import Any, Dict, List, Mapping, Optional, Sequence
+from xml.sax.saxutils import escape
+
+from loguru import logger
+
+from pipecat.adapters.schemas.tools_schema import ToolsSchema
+from pipecat.frames.frames import MetricsFrame
+from pipecat.metrics.metrics import LLMUsageMetricsData
+from pipecat.observers.base_observer import BaseObserver, FramePushed
+from pipecat.processors.aggregators.llm_context import (
+    NOT_GIVEN,
+    LLMContext,
+    LLMContextMessage,
+)
+
+
+def render_form(questionnaire: Mapping[str, Mapping[str, Any]]) -> str:
+    """Render the form section of the system prompt from the questionnaire.
+
+    Only the question ids, texts and spelling flags are rendered. Answers change during the
+    call and are left out, so the section is the same for every call.
+
+    Args:
+        questionnaire: Questions by id, each with ``question_text`` and
+            ``spelling_sensitive``.
+
+    Returns:
+        The ``# Form`` section with one ``<question>`` element per question, in order.
+    """
+    lines = ["# Form", "<form>"]
+    for question_id, question in questionnaire.items():
+        lines.append(
+            f"<question><question_id>{escape(question_id)}</question_id>"
+            f"<question_text>{escape(question['question_text'])}</question_text>"
+            f"<spelling_sensitive>{str(bool(question['spelling_sensitive'])).lower()}"
+            f"</spelling_sensitive></question>"
+        )
+    lines.append("</form>")
+    return "\n".join(lines)
+
+
+class StaticPromptPrefix:
+    """The system message and tools every call of a bot starts with.
+
+    Both are rendered once, when the prefix is created, and a bot should create it once per
+    process, so every call of every turn sends the same bytes. ``cache_key`` is derived
+    from those bytes, so it only changes when the prompt does.
+    """
+
+    def __init__(self, sections: Sequence[str], *, tools: Optional[ToolsSchema] = None):
+        """Initialize the prefix.
+
+        Args:
+            sections: Text blocks of the system message, in order.
+            tools: Tools offered to the model on every turn.
+        """
+        self._system_message = {
+            "role": "system",
+            "content": [{"type": "text", "text": section} for section in sections],
+        }
+        self._tools = tools
+        tool_dicts = [tool.to_default_dict() for tool in tools.standard_tools] if tools else []
+        encoded = json.dumps([self._system_message, tool_dicts], sort_keys=True)
+        self._cache_key = hashlib.sha256(encoded.encode()).hexdigest()[:32]
+
+    @property
+    def cache_key(self) -> str:
+        """Key identifying this prefix, for the provider's ``prompt_cache_key``."""
+        return self._cache_key
+
+    @property
+    def tools(self) -> Optional[ToolsSchema]:
+        """Tools offered to the model on every turn."""
+        return self._tools
+
+    def system_message(self) -> Dict[str, Any]:
+        """Return a copy of the system message."""
+        return copy.deepcopy(self._system_message)
+
+    def create_context(self, messages: Sequence[LLMContextMessage] = ()) -> LLMContext:
+        """Create a call's context: the static prefix followed by ``messages``.
+
+        Args:
+            messages: The call's first messages after the system message.
+        """
+        return LLMContext(
+            messages=[self.system_message(), *messages],
+            tools=self._tools if self._tools else NOT_GIVEN,
+        )
+
+
+@dataclass
+class PromptCacheUsage:
+    """Prompt tokens of one turn and how many were read from the provider's cache.
+
+    Parameters:
+        prompt_tokens: Tokens in the prompt.
+        cached_tokens: Prompt tokens read from the cache.
+    """
+
+    prompt_tokens: int
+    cached_tokens: int
+
+
+class PromptCacheObserver(BaseObserver):
+    """Observer recording the prompt tokens each LLM turn reused from the provider's cache.
+
+    Reads the LLMUsageMetricsData the LLM service pushes when usage metrics are enabled
+    (``PipelineParams(enable_usage_metrics=True)``).
+    """
+
+    def __init__(self, **kwargs):
+        """Initialize the observer.
+
+        Args:
+            **kwargs: Additional arguments passed to BaseObserver.
+        """
+        super().__init__(**kwargs)
+        self._seen: set[int] = set()
+        self._turns: List[PromptCacheUsage] = []
+
+    @property
+    def turns(self) -> List[PromptCacheUsage]:
+        """Usage of every turn seen so far, in order."""
+        return self._turns
+
+    @property
+    def hit_ratio(self) -> float:
+        """Fraction of all prompt tokens so far that were read from the cache."""
+        prompt_tokens = sum(turn.prompt_tokens for turn in self._turns)
+        cached_tokens = sum(turn.cached_tokens for turn in self._turns)
+        return cached_tokens / prompt_tokens if prompt_tokens else 0.0
+
+    async def on_push_frame(self, data: FramePushed):
+        """Record the token usage carried by metrics frames, once per frame."""
+        frame = data.frame
+        if not isinstance(frame, MetricsFrame) or frame.id in self._seen:
+            return
+        self._seen.add(frame.id)
+        for metrics in frame.data:
+            if isinstance(metrics, LLMUsageMetricsData):
+                usage = metrics.value
+                turn = PromptCacheUsage(
+                    prompt_tokens=usage.prompt_tokens,
+                    cached_tokens=usage.cache_read_input_tokens or 0,
+                )
+                self._turns.append(turn)
+                logger.debug(
+                    f"{metrics.processor}: {turn.cached_tokens} of {turn.prompt_tokens} "
+                    f"prompt tokens read from cache"
+                )
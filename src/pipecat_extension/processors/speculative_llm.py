@@ -0,0 +1,254 @@
+"""Speculative LLM responses, started when the user pauses and released when the turn ends.
+
+With a turn analyzer the LLM only runs once the analyzer decides the user's turn is over,
+after the VAD pause and the analyzer's inference, or after its ``stop_secs`` of silence
+when it is unsure. :class:`SpeculativeLLM` starts the response as soon as the VAD reports
+a pause, from the interim transcript at that moment, and holds its output until the turn
+is confirmed. If the final transcript matches, the held response is released; if the user
+resumes speaking or the final transcript differs, it is cancelled with an interruption and
+the turn runs as usual.
+"""
+
+import asyncio
+import re
+from typing import Awaitable, Callable, List, Optional, Tuple
+
+from loguru import logger
+
+from pipecat.frames.frames import (
+    Frame,
+    FunctionCallCancelFrame,
+    FunctionCallInProgressFrame,
+    FunctionCallResultFrame,
+    FunctionCallsStartedFrame,
+    InterimTranscriptionFrame,
+    InterruptionFrame,
+    LLMContextFrame,
+    SystemFrame,
+    TranscriptionFrame,
+    UserStartedSpeakingFrame,
+    UserStoppedSpeakingFrame,
+    VADUserStartedSpeakingFrame,
+    VADUserStoppedSpeakingFrame,
+)
+from pipecat.processors.aggregators.llm_context import LLMContext
+from pipecat.processors.frame_processor import FrameDirection, FrameProcessor
+from pipecat.services.llm_service import FunctionCallParams
+
+FunctionCallHandler = Callable[[FunctionCallParams], Awaitable[None]]
+
+# System frames carrying a response's function calls, held with the rest of the response.
+_FUNCTION_CALL_FRAMES = (
+    FunctionCallsStartedFrame,
+    FunctionCallInProgressFrame,
+    FunctionCallCancelFrame,
+    FunctionCallResultFrame,
+)
+
+
+def _normalize(text: str) -> str:
+    """Lower-case words of a transcript, without punctuation."""
+    return " ".join(re.findall(r"[\w']+", text.lower()))
+
+
+class SpeculativeLLM:
+    """Speculative LLM responses for one call.
+
+    Place :meth:`input` between the STT service and the user context aggregator, and
+    :meth:`output` after the LLM service, or after the TTS service to synthesize the
+    speculative response too. The STT service must push interim transcripts while the user
+    pauses and one final transcript per turn, after the turn ends, as segmented STT
+    services do. Register function handlers through :meth:`defer` so that their side
+    effects wait for the response to be confirmed.
+    """
+
+    def __init__(self, context: LLMContext):
+        """Initialize the speculative responses.
+
+        Args:
+            context: The context shared with the aggregators.
+        """
+        self._context = context
+        self._input = SpeculativeLLMInput(self)
+        self._output = SpeculativeLLMOutput()
+        self._pending: Optional[asyncio.Future] = None
+        self._speculations = 0
+        self._confirmed = 0
+
+    @property
+    def speculations(self) -> int:
+        """Number of speculative responses started."""
+        return self._speculations
+
+    @property
+    def confirmed(self) -> int:
+        """Number of speculative responses released to the caller."""
+        return self._confirmed
+
+    def input(self) -> "SpeculativeLLMInput":
+        """Get the processor starting speculative responses."""
+        return self._input
+
+    def output(self) -> "SpeculativeLLMOutput":
+        """Get the processor holding speculative responses until the turn ends."""
+        return self._output
+
+    def defer(self, handler: FunctionCallHandler) -> FunctionCallHandler:
+        """Wrap a function handler so it waits for a speculative response to be confirmed.
+
+        The handler runs right away outside a speculative response. A call from a
+        speculative response that is cancelled never runs.
+
+        Args:
+            handler: The function handler to register with the LLM service.
+        """
+
+        async def deferred(params: FunctionCallParams):
+            pending = self._pending
+            if pending is not None and not await asyncio.shield(pending):
+                return
+            await handler(params)
+
+        return deferred
+
+    def _start(self, text: str) -> LLMContext:
+        self._pending = asyncio.get_running_loop().create_future()
+        self._speculations += 1
+        self._output._hold()
+        return LLMContext(
+            messages=[*self._context.messages, {"role": "user", "content": text}],
+            tools=self._context.tools,
+            tool_choice=self._context.tool_choice,
+        )
+
+    async def _confirm(self, text: str):
+        self._context.add_message({"role": "user", "content": text})
+        self._confirmed += 1
+        await self._output._release()
+        self._settle(True)
+
+    def _cancel(self):
+        self._settle(False)
+
+    def _settle(self, confirmed: bool):
+        if self._pending and not self._pending.done():
+            self._pending.set_result(confirmed)
+        self._pending = None
+
+
+class SpeculativeLLMInput(FrameProcessor):
+    """Processor starting a speculative response when the user pauses mid-turn.
+
+    On the first interim transcript after the VAD reports a pause, it pushes the context
+    with that transcript as the user's message to the LLM. When the final transcript
+    matches, ignoring case and punctuation, it adds the final transcript to the context
+    itself and consumes it, so the user aggregator doesn't run the LLM again. Otherwise it
+    pushes an InterruptionFrame, cancelling the speculative response.
+
+    Interim transcripts are consumed too. The user aggregator only uses them to wait for
+    the final transcript, and a consumed final transcript would leave it waiting.
+    """
+
+    def __init__(self, speculation: SpeculativeLLM, **kwargs):
+        """Initialize the processor.
+
+        Args:
+            speculation: The speculative responses this processor starts.
+            **kwargs: Additional arguments passed to FrameProcessor.
+        """
+        super().__init__(**kwargs)
+        self._speculation = speculation
+        self._user_turn = False
+        self._paused = False
+        self._text: Optional[str] = None
+
+    async def process_frame(self, frame: Frame, direction: FrameDirection):
+        """Start, confirm or cancel speculative responses from the user's turn frames."""
+        await super().process_frame(frame, direction)
+
+        if direction == FrameDirection.DOWNSTREAM:
+            if isinstance(frame, UserStartedSpeakingFrame) and not frame.emulated:
+                await self._cancel()
+                self._user_turn = True
+                self._paused = False
+            elif isinstance(frame, UserStoppedSpeakingFrame) and not frame.emulated:
+                self._user_turn = False
+            elif isinstance(frame, VADUserStartedSpeakingFrame):
+                self._paused = False
+                await self._cancel()
+            elif isinstance(frame, VADUserStoppedSpeakingFrame):
+                self._paused = self._user_turn
+            elif isinstance(frame, TranscriptionFrame) and self._text is not None:
+                if _normalize(frame.text) == _normalize(self._text):
+                    self._text = None
+                    await self._speculation._confirm(frame.text)
+                    return
+                await self._cancel()
+            elif isinstance(frame, InterimTranscriptionFrame):
+                if self._paused and self._text is None and frame.text.strip():
+                    await self._speculate(frame.text)
+                return
+
+        await self.push_frame(frame, direction)
+
+    async def _speculate(self, text: str):
+        logger.debug(f"{self}: starting speculative response to [{text}]")
+        self._text = text
+        await self.push_frame(LLMContextFrame(self._speculation._start(text)))
+
+    async def _cancel(self):
+        if self._text is None:
+            return
+        logger.debug(f"{self}: cancelling speculative response to [{self._text}]")
+        self._text = None
+        self._speculation._cancel()
+        await self.push_frame(InterruptionFrame())
+
+
+class SpeculativeLLMOutput(FrameProcessor):
+    """Processor holding a speculative response until its turn is confirmed.
+
+    While a response is held, downstream data and control frames and the response's
+    function call frames are queued; other system frames pass. An InterruptionFrame drops
+    the queued frames.
+    """
+
+    def __init__(self, **kwargs):
+        """Initialize the processor.
+
+        Args:
+            **kwargs: Additional arguments passed to FrameProcessor.
+        """
+        super().__init__(**kwargs)
+        self._holding = False
+        self._held: List[Tuple[Frame, FrameDirection]] = []
+        self._lock = asyncio.Lock()
+
+    async def process_frame(self, frame: Frame, direction: FrameDirection):
+        """Hold the response's frames while it is speculative."""
+        await super().process_frame(frame, direction)
+
+        if isinstance(frame, InterruptionFrame):
+            self._holding = False
+            self._held.clear()
+        elif direction == FrameDirection.DOWNSTREAM and (
+            not isinstance(frame, SystemFrame) or isinstance(frame, _FUNCTION_CALL_FRAMES)
+        ):
+            async with self._lock:
+                if self._holding:
+                    self._held.append((frame, direction))
+                else:
+                    await self.push_frame(frame, direction)
+            return
+
+        await self.push_frame(frame, direction)
+
+    def _hold(self):
+        self._holding = True
+
+    async def _release(self):
+        async with self._lock:
+            self._holding = False
+            held, self._held = self._held, []
+            for frame, direction in held:
+                await self.push_frame(frame, direction)
@@ -0,0 +1,278 @@
+"""Clause-level text splitting and a shared phrase cache in front of a TTS service.
+
+pipecat's TTS services aggregate LLM tokens into whole sentences before synthesizing, so the
+first audio waits for the first full stop. :class:`TTSFrontend` sends the first clause of
+each response as soon as it is complete and every later sentence as soon as it is complete,
+so the TTS service always has the next text queued while the current one plays. Phrases the
+bot says on every call, like its greeting, are served from a :class:`PhraseCache` shared by
+the calls of a process instead of being synthesized again.
+"""
+
+import re
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+from loguru import logger
+
+from pipecat.frames.frames import (
+    Frame,
+    InterimTranscriptionFrame,
+    InterruptionFrame,
+    LLMFullResponseEndFrame,
+    LLMFullResponseStartFrame,
+    TextFrame,
+    TranscriptionFrame,
+    TTSAudioRawFrame,
+    TTSStartedFrame,
+    TTSStoppedFrame,
+    TTSTextFrame,
+)
+from pipecat.processors.frame_processor import FrameDirection, FrameProcessor
+
+# Punctuation ending a sentence, or a clause, followed by whitespace. The whitespace
+# keeps "3.5" or a spelled out "J-A-M-E-S-@-E-X-A-M-P-L-E-.C-O-M" in one piece.
+_SENTENCE_END = re.compile(r"[.!?]+[\"')\]]*\s")
+_CLAUSE_END = re.compile(r"[.!?,;:]+[\"')\]]*\s|\s[-–—]\s")
+
+
+@dataclass
+class CachedPhrase:
+    """Synthesized audio of a phrase.
+
+    Parameters:
+        audio: 16-bit mono PCM audio.
+        sample_rate: Sample rate of the audio in Hz.
+    """
+
+    audio: bytes
+    sample_rate: int
+
+
+class PhraseCache:
+    """Least-recently-used cache of synthesized phrases, keyed by voice and text.
+
+    Create one per process and share it between calls, like the inference pools.
+    """
+
+    def __init__(self, max_bytes: int = 32 * 1024 * 1024):
+        """Initialize the cache.
+
+        Args:
+            max_bytes: Audio bytes kept before the least recently used phrases are
+                evicted. Defaults to 32 MiB, about 11 minutes of 24 kHz audio.
+        """
+        self._max_bytes = max_bytes
+        self._phrases: OrderedDict[Tuple[str, str], CachedPhrase] = OrderedDict()
+        self._size = 0
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def hits(self) -> int:
+        """Number of lookups served from the cache."""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """Number of lookups not found in the cache."""
+        return self._misses
+
+    def __len__(self) -> int:
+        """Number of cached phrases."""
+        return len(self._phrases)
+
+    def get(self, voice: str, text: str) -> Optional[CachedPhrase]:
+        """Return the audio of ``text`` spoken with ``voice``, if cached."""
+        key = (voice, text.strip())
+        phrase = self._phrases.get(key)
+        if phrase is None:
+            self._misses += 1
+            return None
+        self._phrases.move_to_end(key)
+        self._hits += 1
+        return phrase
+
+    def put(self, voice: str, text: str, phrase: CachedPhrase):
+        """Cache the audio of ``text`` spoken with ``voice``."""
+        if len(phrase.audio) > self._max_bytes:
+            return
+        key = (voice, text.strip())
+        previous = self._phrases.pop(key, None)
+        if previous:
+            self._size -= len(previous.audio)
+        self._phrases[key] = phrase
+        self._size += len(phrase.audio)
+        while self._size > self._max_bytes:
+            _, evicted = self._phrases.popitem(last=False)
+            self._size -= len(evicted.audio)
+
+
+class TTSFrontend:
+    """Clause splitting and phrase caching around one call's TTS service.
+
+    Place :meth:`input` right before the TTS service, created with
+    ``aggregate_sentences=False`` since the input does the splitting, and :meth:`output`
+    right after it.
+    """
+
+    def __init__(
+        self,
+        *,
+        voice: str,
+        cache: Optional[PhraseCache] = None,
+        first_clause_min_chars: int = 4,
+    ):
+        """Initialize the front-end.
+
+        Args:
+            voice: The TTS service's voice, part of the cache key.
+            cache: Cache of synthesized phrases. None disables caching.
+            first_clause_min_chars: Shortest first clause of a response sent on its own.
+                Defaults to 4, so "Hi," waits for more but "Sure," does not.
+        """
+        self._input = TTSFrontendInput(
+            voice=voice, cache=cache, first_clause_min_chars=first_clause_min_chars
+        )
+        self._output = TTSFrontendOutput(voice=voice, cache=cache)
+
+    def input(self) -> "TTSFrontendInput":
+        """Get the processor splitting text for the TTS service."""
+        return self._input
+
+    def output(self) -> "TTSFrontendOutput":
+        """Get the processor caching the TTS service's audio."""
+        return self._output
+
+
+class TTSFrontendInput(FrameProcessor):
+    """Processor splitting LLM text into clauses and answering cached ones itself.
+
+    The first chunk of a response ends at the first clause or sentence boundary at least
+    ``first_clause_min_chars`` long; later chunks end at sentence boundaries, and the rest
+    is sent when the response ends. A chunk found in the cache is pushed as TTS audio and
+    a TTSTextFrame, which the TTS service passes on, instead of as text to synthesize.
+    """
+
+    def __init__(
+        self,
+        *,
+        voice: str,
+        cache: Optional[PhraseCache] = None,
+        first_clause_min_chars: int = 4,
+        **kwargs,
+    ):
+        """Initialize the processor.
+
+        Args:
+            voice: The TTS service's voice, part of the cache key.
+            cache: Cache of synthesized phrases. None disables caching.
+            first_clause_min_chars: Shortest first clause of a response sent on its own.
+            **kwargs: Additional arguments passed to FrameProcessor.
+        """
+        super().__init__(**kwargs)
+        self._voice = voice
+        self._cache = cache
+        self._first_clause_min_chars = first_clause_min_chars
+        self._buffer = ""
+        self._first_chunk = True
+
+    async def process_frame(self, frame: Frame, direction: FrameDirection):
+        """Split text frames into chunks and flush the rest at the end of a response."""
+        await super().process_frame(frame, direction)
+
+        if isinstance(frame, InterruptionFrame):
+            self._buffer = ""
+            self._first_chunk = True
+        elif isinstance(frame, LLMFullResponseStartFrame):
+            self._first_chunk = True
+        elif isinstance(frame, LLMFullResponseEndFrame):
+            await self._push_chunk(self._buffer)
+            self._buffer = ""
+        elif (
+            isinstance(frame, TextFrame)
+            and not isinstance(frame, (InterimTranscriptionFrame, TranscriptionFrame))
+            and not frame.skip_tts
+            and direction == FrameDirection.DOWNSTREAM
+        ):
+            self._buffer += frame.text
+            while chunk := self._next_chunk():
+                await self._push_chunk(chunk)
+            return
+
+        await self.push_frame(frame, direction)
+
+    def _next_chunk(self) -> Optional[str]:
+        if self._first_chunk:
+            pattern, min_chars = _CLAUSE_END, self._first_clause_min_chars
+        else:
+            pattern, min_chars = _SENTENCE_END, 0
+        for match in pattern.finditer(self._buffer):
+            if len(self._buffer[: match.start()].strip()) >= min_chars:
+                chunk, self._buffer = self._buffer[: match.end()], self._buffer[match.end() :]
+                self._first_chunk = False
+                return chunk
+        return None
+
+    async def _push_chunk(self, chunk: str):
+        text = chunk.strip()
+        if not text:
+            return
+        phrase = self._cache.get(self._voice, text) if self._cache is not None else None
+        if phrase is None:
+            await self.push_frame(TextFrame(text))
+            return
+        logger.debug(f"{self}: speaking cached phrase [{text}]")
+        await self.push_frame(TTSStartedFrame())
+        await self.push_frame(TTSAudioRawFrame(phrase.audio, phrase.sample_rate, 1))
+        await self.push_frame(TTSStoppedFrame())
+        # The TTS service would synthesize the text frame again without skip_tts.
+        text_frame = TTSTextFrame(text)
+        text_frame.skip_tts = True
+        await self.push_frame(text_frame)
+
+
+class TTSFrontendOutput(FrameProcessor):
+    """Processor caching the audio the TTS service synthesizes for each chunk.
+
+    The TTS service pushes a chunk's audio between a TTSStartedFrame and a TTSStoppedFrame,
+    then its text as a TTSTextFrame. Audio cut short by an interruption is not cached.
+    """
+
+    def __init__(self, *, voice: str, cache: Optional[PhraseCache] = None, **kwargs):
+        """Initialize the processor.
+
+        Args:
+            voice: The TTS service's voice, part of the cache key.
+            cache: Cache of synthesized phrases. None disables caching.
+            **kwargs: Additional arguments passed to FrameProcessor.
+        """
+        super().__init__(**kwargs)
+        self._voice = voice
+        self._cache = cache
+        self._audio: List[bytes] = []
+        self._sample_rate = 0
+        self._complete = False
+
+    async def process_frame(self, frame: Frame, direction: FrameDirection):
+        """Collect each chunk's audio and cache it once its text arrives."""
+        await super().process_frame(frame, direction)
+        await self.push_frame(frame, direction)
+
+        if self._cache is None or direction != FrameDirection.DOWNSTREAM:
+            return
+        if isinstance(frame, (TTSStartedFrame, InterruptionFrame)):
+            self._audio = []
+            self._complete = False
+        elif isinstance(frame, TTSAudioRawFrame):
+            self._audio.append(frame.audio)
+            self._sample_rate = frame.sample_rate
+        elif isinstance(frame, TTSStoppedFrame):
+            self._complete = True
+        elif isinstance(frame, TTSTextFrame):
+            if self._complete and self._audio and not frame.skip_tts:
+                self._cache.put(
+                    self._voice, frame.text, CachedPhrase(b"".join(self._audio), self._sample_rate)
+                )
+            self._audio = []
+            self._complete = False
@@ -0,0 +1,160 @@
+"""Deterministic local speech synthesis, standing in for a remote TTS service in load tests.
+
+:class:`LocalTTSService` renders text as crude formant-synthesized vowels, noise-burst
+consonants and pauses on the CPU, without network access. The same text always gives the
+same audio, so runs are repeatable. Its :class:`LocalTTSParams` set the time to first
+byte and the synthesis speed; :data:`TTS_PROFILES` has presets mimicking an instant, a
+cloud and a slow TTS service.
+"""
+
+import asyncio
+import time
+from functools import lru_cache
+from typing import AsyncGenerator, Dict, Optional
+
+import numpy as np
+from loguru import logger
+from pydantic import BaseModel
+
+from pipecat.frames.frames import Frame, TTSAudioRawFrame, TTSStartedFrame, TTSStoppedFrame
+from pipecat.services.tts_service import TTSService
+
+# First and second formants, in Hz, of the vowels.
+_FORMANTS = {
+    "a": (730, 1090),
+    "e": (530, 1840),
+    "i": (270, 2290),
+    "o": (570, 840),
+    "u": (300, 870),
+    "y": (440, 1020),
+}
+_PITCH_HZ = 120
+_FADE_SECS = 0.005
+
+
+@lru_cache(maxsize=1024)
+def _segment(char: str, sample_rate: int, samples: int) -> np.ndarray:
+    """Audio of one character: a vowel, a consonant, a digit or a pause."""
+    t = np.arange(samples) / sample_rate
+    lower = char.lower()
+    if lower in _FORMANTS:
+        f1, f2 = _FORMANTS[lower]
+        voicing = 0.5 + 0.5 * np.sin(2 * np.pi * _PITCH_HZ * t)
+        signal = voicing * (0.6 * np.sin(2 * np.pi * f1 * t) + 0.3 * np.sin(2 * np.pi * f2 * t))
+    elif lower.isalpha():
+        rng = np.random.default_rng(ord(lower))
+        signal = 0.15 * rng.standard_normal(samples)
+    elif lower.isdigit():
+        signal = 0.5 * np.sin(2 * np.pi * (200 + 50 * int(lower)) * t)
+    else:
+        return np.zeros(samples, dtype=np.int16)
+    fade = min(int(_FADE_SECS * sample_rate), samples // 2)
+    if fade:
+        ramp = np.linspace(0.0, 1.0, fade)
+        signal[:fade] *= ramp
+        signal[-fade:] *= ramp[::-1]
+    return (np.clip(signal, -1.0, 1.0) * 16000).astype(np.int16)
+
+
+def synthesize(text: str, sample_rate: int, chars_per_second: float = 14.0) -> np.ndarray:
+    """Render ``text`` as 16-bit mono audio, the same for the same arguments.
+
+    Every character takes ``1 / chars_per_second`` seconds; sentence and clause
+    punctuation take twice as long, as a pause.
+
+    Args:
+        text: The text to render.
+        sample_rate: Sample rate of the audio in Hz.
+        chars_per_second: Speaking rate.
+
+    Returns:
+        The audio samples.
+    """
+    samples = int(sample_rate / chars_per_second)
+    segments = [
+        _segment(char, sample_rate, samples * 2 if char in ".,;:!?" else samples)
+        for char in text
+    ]
+    return np.concatenate(segments) if segments else np.zeros(0, dtype=np.int16)
+
+
+class LocalTTSParams(BaseModel):
+    """Configuration parameters for LocalTTSService.
+
+    Parameters:
+        ttfb_ms: Milliseconds before the first audio chunk of each text. Defaults to 0.
+        real_time_factor: Seconds of synthesis per second of audio after the first chunk;
+            0 produces the audio as fast as possible. Defaults to 0.
+        chunk_ms: Milliseconds of audio per frame. Defaults to 40.
+        chars_per_second: Speaking rate. Defaults to 14.
+    """
+
+    ttfb_ms: float = 0
+    real_time_factor: float = 0
+    chunk_ms: float = 40
+    chars_per_second: float = 14.0
+
+
+TTS_PROFILES: Dict[str, LocalTTSParams] = {
+    "instant": LocalTTSParams(),
+    # A streaming HTTP TTS in the same region.
+    "cloud": LocalTTSParams(ttfb_ms=250, real_time_factor=0.1),
+    # A TTS barely keeping up with playback, like a local model on a busy CPU.
+    "slow": LocalTTSParams(ttfb_ms=600, real_time_factor=0.9),
+}
+
+
+class LocalTTSService(TTSService):
+    """TTS service synthesizing deterministic placeholder speech locally.
+
+    Stands in for a remote TTS service when load testing a pipeline: the audio carries no
+    words, but it is as long as speech of the text would be and arrives on the schedule
+    set by its parameters.
+    """
+
+    def __init__(self, *, params: Optional[LocalTTSParams] = None, **kwargs):
+        """Initialize the service.
+
+        Args:
+            params: Latency and throughput of the synthesis.
+            **kwargs: Additional arguments passed to TTSService.
+        """
+        super().__init__(**kwargs)
+        self._params = params or LocalTTSParams()
+
+    def can_generate_metrics(self) -> bool:
+        """Check if the service can generate metrics.
+
+        Returns:
+            True, as this service supports metrics generation.
+        """
+        return True
+
+    async def run_tts(self, text: str) -> AsyncGenerator[Frame, None]:
+        """Synthesize ``text`` on the schedule set by the parameters.
+
+        Args:
+            text: The text to synthesize.
+
+        Yields:
+            Frame: A TTSStartedFrame, the audio in ``chunk_ms`` frames, a TTSStoppedFrame.
+        """
+        logger.debug(f"{self}: Generating TTS [{text}]")
+        await self.start_ttfb_metrics()
+        audio = synthesize(text, self.sample_rate, self._params.chars_per_second).tobytes()
+        await asyncio.sleep(self._params.ttfb_ms / 1000)
+
+        await self.start_tts_usage_metrics(text)
+        yield TTSStartedFrame()
+        chunk_size = int(self.sample_rate * self._params.chunk_ms / 1000) * 2
+        start = time.monotonic()
+        for offset in range(0, len(audio), chunk_size):
+            if offset == 0:
+                await self.stop_ttfb_metrics()
+            elif self._params.real_time_factor:
+                produced_secs = offset / 2 / self.sample_rate
+                delay = start + produced_secs * self._params.real_time_factor - time.monotonic()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            yield TTSAudioRawFrame(audio[offset : offset + chunk_size], self.sample_rate, 1)
+        yield TTSStoppedFrame()
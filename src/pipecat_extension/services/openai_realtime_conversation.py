@@ -0,0 +1,186 @@
+"""Local mirror of the server-side conversation of an OpenAI Realtime session."""
+
+from collections import OrderedDict
+from typing import Iterator, Optional
+
+from pipecat.services.openai.realtime import events
+
+
+class _Node:
+    __slots__ = ("item", "prev", "next")
+
+    def __init__(self, item: Optional[events.ConversationItem]):
+        self.item = item
+        self.prev: Optional[_Node] = None
+        self.next: Optional[_Node] = None
+
+
+class ConversationStore:
+    """Indexed, ordered store of the items in a realtime conversation.
+
+    Items are kept in a doubly linked list ordered by the server's ``previous_item_id`` and
+    indexed by item id, so lookups, inserts, updates and deletes are all O(1). Snapshots are
+    immutable tuples that are cached until the next mutation.
+
+    Long calls can bound memory by keeping the audio and transcript payloads of only the most
+    recently added items, and by dropping the oldest items altogether. Items whose payloads are
+    evicted are replaced by copies, so objects already handed out are never mutated.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_items: Optional[int] = None,
+        max_audio_items: Optional[int] = None,
+        max_transcript_items: Optional[int] = None,
+    ):
+        """Initialize the conversation store.
+
+        Args:
+            max_items: Maximum number of items to keep. The oldest items are dropped first.
+                Defaults to None (unbounded).
+            max_audio_items: Number of most recently added items that keep their base64 audio
+                payloads. Defaults to None (all items keep their audio).
+            max_transcript_items: Number of most recently added items that keep their audio
+                transcripts. Defaults to None (all items keep their transcripts).
+        """
+        self._max_items = max_items
+        self._max_audio_items = max_audio_items
+        self._max_transcript_items = max_transcript_items
+        self._nodes: dict[str, _Node] = {}
+        self._head = _Node(None)
+        self._tail = _Node(None)
+        self._head.next = self._tail
+        self._tail.prev = self._head
+        # Ids of the items still holding payloads, oldest first, used as ordered sets.
+        self._audio_ids: OrderedDict[str, None] = OrderedDict()
+        self._transcript_ids: OrderedDict[str, None] = OrderedDict()
+        self._snapshot: Optional[tuple[events.ConversationItem, ...]] = None
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def __contains__(self, item_id: str) -> bool:
+        return item_id in self._nodes
+
+    def __iter__(self) -> Iterator[events.ConversationItem]:
+        node = self._head.next
+        while node is not self._tail:
+            yield node.item
+            node = node.next
+
+    def get(self, item_id: str) -> Optional[events.ConversationItem]:
+        """Return the item with the given id, or None if it is not in the store."""
+        node = self._nodes.get(item_id)
+        return node.item if node else None
+
+    def previous_item_id(self, item_id: str) -> Optional[str]:
+        """Return the id of the item preceding ``item_id``, or None if it is the first item."""
+        node = self._nodes[item_id]
+        return node.prev.item.id if node.prev is not self._head else None
+
+    def add(self, item: events.ConversationItem, previous_item_id: Optional[str] = None):
+        """Add an item after ``previous_item_id``.
+
+        A None ``previous_item_id`` inserts the item at the start of the conversation. If the
+        previous item is not in the store (for example because it was evicted) the item is
+        appended. Adding an item that is already in the store updates it in place.
+        """
+        if item.id in self._nodes:
+            self.update(item)
+            return
+        if previous_item_id is None:
+            prev = self._head
+        else:
+            prev = self._nodes.get(previous_item_id, self._tail.prev)
+        node = _Node(item)
+        node.prev = prev
+        node.next = prev.next
+        prev.next.prev = node
+        prev.next = node
+        self._nodes[item.id] = node
+        self._snapshot = None
+        self._track_payloads(item.id)
+        if self._max_items is not None and len(self._nodes) > self._max_items:
+            self.delete(self._head.next.item.id)
+
+    def update(self, item: events.ConversationItem):
+        """Replace an item keeping its position, appending it if it is not in the store."""
+        node = self._nodes.get(item.id)
+        if node is None:
+            self.add(item, self._tail.prev.item.id if self._tail.prev is not self._head else None)
+            return
+        node.item = item
+        self._snapshot = None
+        self._strip_evicted_payloads(item.id)
+
+    def set_transcript(self, item_id: str, content_index: int, transcript: str):
+        """Set the transcript of one content part of an item, if the item is in the store."""
+        node = self._nodes.get(item_id)
+        if node is None or not node.item.content or content_index >= len(node.item.content):
+            return
+        content = list(node.item.content)
+        content[content_index] = content[content_index].model_copy(
+            update={"transcript": transcript}
+        )
+        node.item = node.item.model_copy(update={"content": content})
+        self._snapshot = None
+        self._strip_evicted_payloads(item_id)
+
+    def delete(self, item_id: str) -> bool:
+        """Remove an item. Returns False if it was not in the store."""
+        node = self._nodes.pop(item_id, None)
+        if node is None:
+            return False
+        node.prev.next = node.next
+        node.next.prev = node.prev
+        self._audio_ids.pop(item_id, None)
+        self._transcript_ids.pop(item_id, None)
+        self._snapshot = None
+        return True
+
+    def clear(self):
+        """Remove all items."""
+        self._nodes.clear()
+        self._head.next = self._tail
+        self._tail.prev = self._head
+        self._audio_ids.clear()
+        self._transcript_ids.clear()
+        self._snapshot = None
+
+    def snapshot(self) -> tuple[events.ConversationItem, ...]:
+        """Return the items in conversation order as an immutable tuple.
+
+        The tuple is cached until the store is next modified, so repeated snapshots of an
+        unchanged conversation are free.
+        """
+        if self._snapshot is None:
+            self._snapshot = tuple(self)
+        return self._snapshot
+
+    def _track_payloads(self, item_id: str):
+        if self._max_audio_items is not None:
+            self._audio_ids[item_id] = None
+            while len(self._audio_ids) > self._max_audio_items:
+                self._strip_payload(self._audio_ids.popitem(last=False)[0], "audio")
+        if self._max_transcript_items is not None:
+            self._transcript_ids[item_id] = None
+            while len(self._transcript_ids) > self._max_transcript_items:
+                self._strip_payload(self._transcript_ids.popitem(last=False)[0], "transcript")
+
+    def _strip_evicted_payloads(self, item_id: str):
+        # Updates of an item whose payloads were already evicted must not bring them back.
+        if self._max_audio_items is not None and item_id not in self._audio_ids:
+            self._strip_payload(item_id, "audio")
+        if self._max_transcript_items is not None and item_id not in self._transcript_ids:
+            self._strip_payload(item_id, "transcript")
+
+    def _strip_payload(self, item_id: str, field: str):
+        node = self._nodes.get(item_id)
+        if node is None or not node.item.content:
+            return
+        if not any(getattr(content, field) is not None for content in node.item.content):
+            return
+        content = [content.model_copy(update={field: None}) for content in node.item.content]
+        node.item = node.item.model_copy(update={"content": content})
+        self._snapshot = None
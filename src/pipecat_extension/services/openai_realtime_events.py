@@ -0,0 +1,100 @@
+"""Fast-path parsing of OpenAI Realtime server events.
+
+Audio deltas make up most of the inbound traffic of a realtime session and carry little more
+than a large base64 payload. :func:`parse_server_event` recognizes audio deltas from the start
+of the message and decodes them straight to PCM bytes without building a pydantic model. Every
+other event (and any audio delta that does not have the compact shape emitted by the API) goes
+through the full ``events.parse_server_event`` validation.
+"""
+
+import binascii
+import json
+from dataclasses import dataclass
+from typing import Optional, Union
+
+from pipecat.services.openai.realtime import events
+
+AUDIO_DELTA_EVENT_TYPE = "response.output_audio.delta"
+
+# The API emits compact JSON with "type" as the first key, so an audio delta is recognized
+# from the first few bytes of the message without scanning the payload.
+_AUDIO_DELTA_PREFIX = '{"type":"response.output_audio.delta"'
+_AUDIO_DELTA_PREFIX_BYTES = _AUDIO_DELTA_PREFIX.encode()
+_DELTA_KEY = '"delta":"'
+_DELTA_KEY_BYTES = _DELTA_KEY.encode()
+
+Message = Union[str, bytes, bytearray]
+
+
+@dataclass(slots=True)
+class AudioDeltaEvent:
+    """A response.output_audio.delta event decoded by the fast path.
+
+    Parameters:
+        event_id: Unique identifier for the event.
+        response_id: ID of the response.
+        item_id: ID of the conversation item.
+        output_index: Index of the output item.
+        content_index: Index of the content part.
+        audio: Decoded PCM audio.
+        type: Event type, always "response.output_audio.delta".
+    """
+
+    event_id: str
+    response_id: str
+    item_id: str
+    output_index: int
+    content_index: int
+    audio: bytes
+    type: str = AUDIO_DELTA_EVENT_TYPE
+
+
+def parse_audio_delta(message: Message) -> Optional[AudioDeltaEvent]:
+    """Decode a raw response.output_audio.delta message.
+
+    When ``message`` is a raw (undecoded) websocket frame the base64 payload is decoded from a
+    memoryview of the frame, so the only allocation is the resulting PCM bytes. Returns None if
+    the message is not an audio delta in the compact form emitted by the API.
+    """
+    if isinstance(message, str):
+        prefix, delta_key, payload = _AUDIO_DELTA_PREFIX, _DELTA_KEY, message
+    else:
+        prefix, delta_key, payload = _AUDIO_DELTA_PREFIX_BYTES, _DELTA_KEY_BYTES, memoryview(message)
+
+    if not message.startswith(prefix):
+        return None
+    start = message.find(delta_key)
+    if start < 0:
+        return None
+    start += len(delta_key)
+    end = message.find(delta_key[-1:], start)
+    if end < 0:
+        return None
+
+    try:
+        # Only the small envelope around the payload is JSON-decoded; the payload is spliced
+        # out so the decoder never copies it.
+        header = json.loads(message[:start] + message[end:])
+        return AudioDeltaEvent(
+            event_id=header["event_id"],
+            response_id=header["response_id"],
+            item_id=header["item_id"],
+            output_index=header["output_index"],
+            content_index=header["content_index"],
+            audio=binascii.a2b_base64(payload[start:end]),
+        )
+    except (KeyError, ValueError):
+        return None
+
+
+def parse_server_event(message: Message):
+    """Parse a server event, decoding audio deltas on the fast path.
+
+    Returns an :class:`AudioDeltaEvent` for audio deltas and the pydantic event from
+    ``events.parse_server_event`` for everything else.
+    """
+    evt = parse_audio_delta(message)
+    if evt is not None:
+        return evt
+    return events.parse_server_event(message)
+
@@ -0,0 +1,111 @@
+"""Execution policies for event handlers of OpenAI Realtime sessions."""
+
+import asyncio
+from collections import deque
+from typing import Any, Awaitable, Callable, Literal, Optional
+
+from loguru import logger
+from pydantic import BaseModel
+
+
+class HandlerExecutionPolicy(BaseModel):
+    """How the handlers of one event are run relative to the receive loop.
+
+    Parameters:
+        mode: "inline" awaits the handlers before the next server event is processed, "task"
+            runs each call in its own task, and "queue" runs calls one at a time, in order, on a
+            worker task fed by a bounded queue. Defaults to "inline".
+        max_queue_size: Number of calls the queue holds in "queue" mode. Defaults to 100.
+        overflow: What to do with a call that arrives while the queue is full. "drop" discards
+            it; "coalesce" replaces the most recently queued call with it, so the worker catches
+            up with the latest state. Defaults to "drop".
+    """
+
+    mode: Literal["inline", "task", "queue"] = "inline"
+    max_queue_size: int = 100
+    overflow: Literal["drop", "coalesce"] = "drop"
+
+
+class HandlerExecutor:
+    """Runs the calls of one event according to a HandlerExecutionPolicy.
+
+    Calls that do not run inline are isolated from the caller: their exceptions are logged and
+    their return values are discarded.
+    """
+
+    def __init__(self, name: str, policy: HandlerExecutionPolicy):
+        """Initialize the executor.
+
+        Args:
+            name: Name of the event, used in log messages.
+            policy: How calls are run.
+        """
+        self._name = name
+        self._policy = policy
+        self._queue: deque[tuple[Callable[..., Awaitable[Any]], tuple, dict]] = deque()
+        self._worker: Optional[asyncio.Task] = None
+        self._tasks: set[asyncio.Task] = set()
+        self._overflow_count = 0
+
+    @property
+    def overflow_count(self) -> int:
+        """Number of calls dropped or coalesced because the queue was full."""
+        return self._overflow_count
+
+    @property
+    def pending(self) -> int:
+        """Number of calls queued or running in the background."""
+        return len(self._queue) + len(self._tasks) + (1 if self._worker else 0)
+
+    async def submit(self, func: Callable[..., Awaitable[Any]], *args, **kwargs) -> Any:
+        """Run ``func(*args, **kwargs)`` according to the policy.
+
+        Returns:
+            The result of ``func`` in "inline" mode, None otherwise.
+        """
+        mode = self._policy.mode
+        if mode == "inline":
+            return await func(*args, **kwargs)
+        if mode == "task":
+            task = asyncio.create_task(self._run(func, args, kwargs))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+            return None
+        if len(self._queue) >= self._policy.max_queue_size:
+            self._overflow_count += 1
+            if self._policy.overflow == "coalesce" and self._queue:
+                self._queue[-1] = (func, args, kwargs)
+        else:
+            self._queue.append((func, args, kwargs))
+        if not self._worker:
+            self._worker = asyncio.create_task(self._work())
+        return None
+
+    async def drain(self):
+        """Wait until every queued and running call has finished."""
+        while self._worker or self._tasks:
+            await asyncio.wait([task for task in (self._worker, *self._tasks) if task])
+
+    def cancel(self):
+        """Cancel running calls and drop queued ones."""
+        self._queue.clear()
+        for task in (self._worker, *self._tasks):
+            if task:
+                task.cancel()
+        # A worker cancelled before it started never reaches its finally clause.
+        self._worker = None
+
+    async def _work(self):
+        try:
+            while self._queue:
+                func, args, kwargs = self._queue.popleft()
+                await self._run(func, args, kwargs)
+        finally:
+            if self._worker is asyncio.current_task():
+                self._worker = None
+
+    async def _run(self, func, args, kwargs):
+        try:
+            await func(*args, **kwargs)
+        except Exception as e:
+            logger.exception(f"Exception in {self._name} handler: {e}")
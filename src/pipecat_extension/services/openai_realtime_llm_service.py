@@ -1,65 +1,602 @@
-from pipecat.services.openai.realtime.llm import OpenAIRealtimeLLMService
+import asyncio
+import json
+import ssl
+import time
+from collections import Counter
+from functools import partial
+from typing import Optional
+
+from loguru import logger
+
+from pipecat.frames.frames import CancelFrame, ErrorFrame, TTSAudioRawFrame, TTSStartedFrame
+from pipecat.services.openai.realtime.llm import CurrentAudioResponse, OpenAIRealtimeLLMService
 from pipecat.services.openai.realtime import events
+from websockets.asyncio.client import connect as websocket_connect
+from websockets.exceptions import ConnectionClosed, ConnectionClosedError, ConnectionClosedOK
+
+from pipecat_extension.services import openai_realtime_events
+from pipecat_extension.services.openai_realtime_conversation import ConversationStore
+from pipecat_extension.services.openai_realtime_handlers import (
+    HandlerExecutionPolicy,
+    HandlerExecutor,
+)
+from pipecat_extension.services.openai_realtime_metrics import RealtimeMetricsSink
+from pipecat_extension.services.openai_realtime_reconnect import (
+    ReconnectParams,
+    classify_realtime_error,
+    conversation_replay_events,
+)
+from pipecat_extension.services.openai_realtime_replay import RealtimeSessionRecorder
+from pipecat_extension.services.openai_realtime_sender import (
+    ClientEventSender,
+    ClientEventSenderParams,
+    encode_client_event,
+)
+from pipecat_extension.services.openai_realtime_session_cache import (
+    SessionFields,
+    SessionUpdateCache,
+    changed_session_fields,
+    session_fields,
+)
+from pipecat_extension.services.openai_realtime_tools import (
+    AsyncToolCallEngine,
+    AsyncToolCallParams,
+    AsyncToolResult,
+)
+from pipecat_extension.services.openai_realtime_events import AudioDeltaEvent
 
 
 class OpenAIRealtimeLLMServiceExt(OpenAIRealtimeLLMService):
     """Extended OpenAI Realtime LLM Service that registers additional event handlers."""
 
-    def __init__(self, *args, **kwargs):
-        """Initialize the extended service and register the after_function_call_output_sent and on_conversation_item_deleted handlers."""
+    # Maps server event types to the name of the method that handles them. Subclasses add,
+    # override or remove (by mapping to None) entries by declaring their own table; the tables
+    # along the MRO are merged once per class in __init_subclass__. The merged table keeps the
+    # None entries, so a removal also holds for subclasses of the class that removed it.
+    _server_event_handlers = {
+        "response.output_audio.delta": "_handle_evt_audio_delta",
+        "response.output_audio_transcript.delta": "_handle_evt_audio_transcript_delta",
+        "response.output_text.delta": "_handle_evt_text_delta",
+        "conversation.item.input_audio_transcription.delta": "_handle_evt_input_audio_transcription_delta",
+        "response.output_audio.done": "_handle_evt_audio_done",
+        "conversation.item.added": "_handle_evt_conversation_item_added",
+        "conversation.item.done": "_handle_evt_conversation_item_done",
+        "conversation.item.input_audio_transcription.completed": "handle_evt_input_audio_transcription_completed",
+        "conversation.item.retrieved": "_handle_conversation_item_retrieved",
+        "conversation.item.deleted": "_handle_evt_conversation_item_deleted",
+        "response.created": "_handle_evt_response_created",
+        "response.done": "_handle_evt_response_done",
+        "response.function_call_arguments.done": "_handle_evt_function_call_arguments_done",
+        "input_audio_buffer.speech_started": "_handle_evt_speech_started",
+        "input_audio_buffer.speech_stopped": "_handle_evt_speech_stopped",
+        "session.created": "_handle_evt_session_created",
+        "session.updated": "_handle_evt_session_updated",
+        "error": "_handle_evt_error_or_stop",
+    }
+
+    # Server events whose handlers stop the receive loop by returning False. Their handlers
+    # must run inline, since a handler run in the background cannot return the stop signal.
+    _loop_control_server_events = frozenset({"error"})
+
+    # Encoded session.update payloads, shared by every instance so sessions with the same
+    # configuration reuse one payload.
+    _session_update_cache = SessionUpdateCache()
+
+    def __init_subclass__(cls, **kwargs):
+        """Merge the server event handler tables declared along the MRO."""
+        super().__init_subclass__(**kwargs)
+        handlers = {}
+        for klass in reversed(cls.__mro__):
+            handlers.update(klass.__dict__.get("_server_event_handlers", {}))
+        cls._server_event_handlers = handlers
+
+    def __init__(
+        self,
+        *args,
+        fast_audio_delta_parsing: bool = False,
+        conversation_store: Optional[ConversationStore] = None,
+        client_event_sender_params: Optional[ClientEventSenderParams] = None,
+        async_tool_params: Optional[AsyncToolCallParams] = None,
+        session_recorder: Optional[RealtimeSessionRecorder] = None,
+        metrics_sink: Optional[RealtimeMetricsSink] = None,
+        event_handler_policies: Optional[dict[str, HandlerExecutionPolicy]] = None,
+        reconnect_params: Optional[ReconnectParams] = None,
+        ssl_context: Optional[ssl.SSLContext] = None,
+        **kwargs,
+    ):
+        """Initialize the extended service and register the after_function_call_output_sent and on_conversation_item_deleted handlers.
+
+        Args:
+            fast_audio_delta_parsing: Whether to read raw websocket frames and decode
+                response.output_audio.delta events without pydantic validation. Defaults to False.
+            conversation_store: Store mirroring the server-side conversation. If None, uses an
+                unbounded ConversationStore.
+            client_event_sender_params: If given, client events and input audio go through a
+                batched, coalescing ClientEventSender configured with these parameters instead
+                of being written to the websocket one by one.
+            async_tool_params: Configuration for tools registered with register_async_function.
+                If None, uses default AsyncToolCallParams.
+            session_recorder: If given, every raw server event received is recorded to it so the
+                session can be replayed later with RealtimeReplayServer.
+            metrics_sink: If given, parse and dispatch times of every server event, the depth of
+                the inbound websocket queue and the run time of every registered event handler
+                are reported to it. Defaults to None (no instrumentation).
+            event_handler_policies: Execution policy by registered event name (e.g.
+                ``after_function_call_output_sent``) or server event type. A policy overrides
+                the ``sync`` flag the event was registered with. Events without a policy keep
+                their default behavior. Server events that can stop the receive loop, like
+                ``error``, only accept the "inline" mode.
+            reconnect_params: If given, a dropped connection or a recoverable ``error`` event
+                reconnects with backoff, re-sends the last session.update and replays the
+                tracked conversation, and errors that only affect one client event no longer
+                end the session. Defaults to None (errors and disconnects are fatal).
+            ssl_context: SSL context for the websocket connection. Sessions sharing one context
+                skip loading the CA certificates on every connect. If None, websockets creates
+                a default context per connection.
+        """
         super().__init__(*args, **kwargs)
+        self._fast_audio_delta_parsing = fast_audio_delta_parsing
+        self._conversation = conversation_store or ConversationStore()
+        self._client_event_sender = (
+            ClientEventSender(self._ws_send_payload, client_event_sender_params)
+            if client_event_sender_params
+            else None
+        )
+        self._client_event_sender_task = None
+        self._async_tools = AsyncToolCallEngine(self._deliver_async_tool_results, async_tool_params)
+        self._response_in_progress = False
+        self._create_response_when_done = False
+        self._session_recorder = session_recorder
+        self._reconnect_params = reconnect_params
+        self._ssl_context = ssl_context
+        self._reconnect_requested = False
+        self._resuming = False
+        self._last_session_update: Optional[events.SessionUpdateEvent] = None
+        self._sent_session_fields: Optional[SessionFields] = None
+        self._metrics_sink = metrics_sink
+        for name, policy in (event_handler_policies or {}).items():
+            if name in self._loop_control_server_events and policy.mode != "inline":
+                raise ValueError(
+                    f"The {name} server event handler can stop the receive loop and must run "
+                    f'inline, not in "{policy.mode}" mode'
+                )
+        self._handler_executors = {
+            name: HandlerExecutor(name, policy)
+            for name, policy in (event_handler_policies or {}).items()
+        }
         self._register_event_handler("after_function_call_output_sent", sync=True)
         self._register_event_handler("on_conversation_item_deleted")
         self._register_event_handler("on_session_updated")
+        self._register_event_handler("on_reconnected")
+        # Handlers are bound once per instance so dispatch is a single dict lookup.
+        self._server_event_dispatch = {}
+        for event_type, name in self._server_event_handlers.items():
+            if name is not None:
+                self._bind_server_event_handler(event_type, getattr(self, name))
+        self._unhandled_server_event_counts = Counter()
+
+    @property
+    def conversation(self) -> ConversationStore:
+        """The local mirror of the server-side conversation."""
+        return self._conversation
+
+    def register_async_function(
+        self,
+        function_name: str,
+        handler,
+        *,
+        timeout: Optional[float] = None,
+        cancel_on_interruption: bool = True,
+    ):
+        """Register a long-running tool that answers PENDING and delivers its result later.
+
+        The handler receives the FunctionCallParams and returns the result instead of calling
+        ``result_callback``. It runs in the background; when it completes, its result is
+        injected into the conversation as a user item of ``<tool_result>`` blocks (batched with
+        any other results completing at the same time) and a new response is requested.
+
+        Args:
+            function_name: The name of the tool.
+            handler: Coroutine function (or plain function, run in a thread) returning the result.
+            timeout: Timeout in seconds. If None, uses the engine's default timeout.
+            cancel_on_interruption: Whether to cancel the call when the user interrupts.
+        """
+        self.register_function(
+            function_name,
+            self._async_tools.function(
+                handler, timeout=timeout, cancel_on_interruption=cancel_on_interruption
+            ),
+            cancel_on_interruption=False,
+        )
+
+    def register_server_event_handler(self, event_type: str, handler):
+        """Register a handler for a server event type on this instance.
+
+        The handler is called as ``handler(service, evt)`` and replaces any handler already
+        dispatched for ``event_type``. Returning ``False`` stops the receive loop.
+        """
+        self._bind_server_event_handler(event_type, partial(handler, self))
+
+    def get_event_handler_overflow_counts(self) -> dict[str, int]:
+        """Return the number of calls dropped or coalesced by each queued event handler."""
+        return {name: executor.overflow_count for name, executor in self._handler_executors.items()}
+
+    def get_unhandled_server_event_counts(self) -> dict[str, int]:
+        """Return the number of received server events that had no handler, by event type."""
+        return dict(self._unhandled_server_event_counts)
+
+    async def send_client_event(self, event: events.ClientEvent):
+        """Send a client event, through the batched sender if one is configured.
+
+        A session.update is sent from the shared payload cache and, once the session has been
+        configured, only carries the fields that changed since the last one. An update that
+        changes nothing is not sent.
+        """
+        await self.send_client_events([event])
+
+    async def send_client_events(self, client_events: list[events.ClientEvent]):
+        """Send several client events, flushing them together when the batched sender is used."""
+        payloads = []
+        for event in client_events:
+            if isinstance(event, events.SessionUpdateEvent):
+                payload = self._encode_session_update(event)
+                if payload is not None:
+                    payloads.append(payload)
+            else:
+                payloads.append(encode_client_event(event))
+        if self._client_event_sender:
+            await self._client_event_sender.send_encoded(payloads)
+        else:
+            for payload in payloads:
+                await self._ws_send_payload(payload)
+
+    def _encode_session_update(self, event: events.SessionUpdateEvent) -> Optional[bytes]:
+        """Encode a session.update as a diff against the last one sent in this session."""
+        self._last_session_update = event
+        fields = session_fields(event.session)
+        previous = self._sent_session_fields
+        if previous is None:
+            payload = self._session_update_cache.encode(event.session, fields)
+        elif fields == previous:
+            return None
+        else:
+            only = changed_session_fields(previous, fields)
+            payload = self._session_update_cache.encode(event.session, fields, only)
+        self._sent_session_fields = fields
+        return payload
+
+    async def _send_user_audio(self, frame):
+        """Send user audio, coalescing it in the batched sender if one is configured.
+
+        Audio is dropped while reconnecting, until the new session has been sent the resumed
+        session.update, so it never reaches a session still on the server defaults.
+        """
+        if self._resuming:
+            return
+        if self._client_event_sender:
+            await self._client_event_sender.append_audio(frame.audio)
+        else:
+            await super()._send_user_audio(frame)
+
+    async def cancel(self, frame: CancelFrame):
+        """Drop event handler calls queued or running in the background, then cancel."""
+        for executor in self._handler_executors.values():
+            executor.cancel()
+        await super().cancel(frame)
+
+    async def cleanup(self):
+        """Wait for event handlers running in the background, then clean up."""
+        for executor in self._handler_executors.values():
+            await executor.drain()
+        await super().cleanup()
+
+    async def _connect(self):
+        """Connect and start the batched sender's writer task."""
+        if self._ssl_context and not self._websocket:
+            await self._connect_with_ssl_context()
+        else:
+            await super()._connect()
+        if self._client_event_sender and self._websocket and not self._client_event_sender_task:
+            self._client_event_sender_task = self.create_task(self._client_event_sender.run())
+
+    async def _connect_with_ssl_context(self):
+        """Open the websocket like the base service, but with the shared SSL context."""
+        try:
+            self._websocket = await websocket_connect(
+                uri=self.base_url,
+                additional_headers={"Authorization": f"Bearer {self.api_key}"},
+                ssl=self._ssl_context,
+            )
+            self._receive_task = self.create_task(self._receive_task_handler())
+        except Exception as e:
+            logger.error(f"{self} initialization error: {e}")
+            self._websocket = None
+
+    async def _disconnect(self):
+        """Cancel background tools, stop the batched sender dropping unsent events, and disconnect."""
+        self._async_tools.cancel_all()
+        if self._client_event_sender_task:
+            await self.cancel_task(self._client_event_sender_task)
+            self._client_event_sender_task = None
+            self._client_event_sender.clear()
+        await super()._disconnect()
+
+    async def _ws_send_payload(self, payload: bytes):
+        """Write an already serialized client event to the websocket.
+
+        With reconnect enabled, an event sent on a connection that has already dropped is
+        discarded: the receive loop notices the drop and reconnects, and the reconnect resends
+        the session and the conversation.
+        """
+        try:
+            if self._websocket:
+                await self._websocket.send(payload, text=True)
+        except Exception as e:
+            if self._disconnecting:
+                return
+            if self._reconnect_params and isinstance(e, ConnectionClosed):
+                logger.warning(f"Realtime connection lost, dropping client event: {e}")
+                return
+            logger.error(f"Error sending message to websocket: {e}")
+            await self.push_error(ErrorFrame(error=f"Error sending client event: {e}", fatal=True))
 
     async def _handle_function_call_result(self, frame):
         """Handle function call result and trigger the after_function_call_output_sent event handler."""
         await super()._handle_function_call_result(frame)
+        self._async_tools.acknowledge(frame.tool_call_id)
         await self._call_event_handler("after_function_call_output_sent", frame)
 
     async def _receive_task_handler(self):
-        """Override to handle conversation.item.deleted events."""
-        async for message in self._websocket:
-            evt = events.parse_server_event(message)
-            if evt.type == "session.created":
-                await self._handle_evt_session_created(evt)
-            elif evt.type == "session.updated":
-                await self._handle_evt_session_updated(evt)
-            elif evt.type == "response.output_audio.delta":
-                await self._handle_evt_audio_delta(evt)
-            elif evt.type == "response.output_audio.done":
-                await self._handle_evt_audio_done(evt)
-            elif evt.type == "conversation.item.added":
-                await self._handle_evt_conversation_item_added(evt)
-            elif evt.type == "conversation.item.done":
-                await self._handle_evt_conversation_item_done(evt)
-            elif evt.type == "conversation.item.input_audio_transcription.delta":
-                await self._handle_evt_input_audio_transcription_delta(evt)
-            elif evt.type == "conversation.item.input_audio_transcription.completed":
-                await self.handle_evt_input_audio_transcription_completed(evt)
-            elif evt.type == "conversation.item.retrieved":
-                await self._handle_conversation_item_retrieved(evt)
-            elif evt.type == "conversation.item.deleted":
-                await self._handle_evt_conversation_item_deleted(evt)
-            elif evt.type == "response.done":
-                await self._handle_evt_response_done(evt)
-            elif evt.type == "input_audio_buffer.speech_started":
-                await self._handle_evt_speech_started(evt)
-            elif evt.type == "input_audio_buffer.speech_stopped":
-                await self._handle_evt_speech_stopped(evt)
-            elif evt.type == "response.output_text.delta":
-                await self._handle_evt_text_delta(evt)
-            elif evt.type == "response.output_audio_transcript.delta":
-                await self._handle_evt_audio_transcript_delta(evt)
-            elif evt.type == "response.function_call_arguments.done":
-                await self._handle_evt_function_call_arguments_done(evt)
-            elif evt.type == "error":
-                if not await self._maybe_handle_evt_retrieve_conversation_item_error(evt):
-                    await self._handle_evt_error(evt)
-                    # errors are fatal, so exit the receive loop
-                    return
+        """Receive server events, reconnecting when the session is lost if reconnect is enabled."""
+        try:
+            connection_closed = await self._receive_server_events()
+        except ConnectionClosedError as e:
+            if not self._reconnect_params or self._disconnecting:
+                raise
+            logger.warning(f"Realtime connection lost: {e}")
+            connection_closed = True
+        if connection_closed:
+            if not self._reconnect_params or self._disconnecting:
+                return
+        elif not self._reconnect_requested:
+            return
+        await self._reconnect()
+
+    async def _receive_server_events(self) -> bool:
+        """Dispatch server events until the connection closes (returns True) or a handler stops
+        the loop (returns False)."""
+        if self._fast_audio_delta_parsing:
+            messages, parse = self._iter_raw_messages(), openai_realtime_events.parse_server_event
+        else:
+            messages, parse = self._websocket, events.parse_server_event
+        if self._metrics_sink:
+            return await self._receive_instrumented(messages, parse, self._metrics_sink)
+        recorder = self._session_recorder
+        async for message in messages:
+            if recorder:
+                recorder.record(message)
+            evt = parse(message)
+            if not await self._dispatch_server_event(evt):
+                return False
+        return True
+
+    async def _receive_instrumented(self, messages, parse, sink: RealtimeMetricsSink) -> bool:
+        """Receive loop that reports per-event timings to the metrics sink."""
+        recorder = self._session_recorder
+        clock = time.perf_counter
+        async for message in messages:
+            queue_depth_frames = self._receive_queue_depth_frames()
+            if recorder:
+                recorder.record(message)
+            start = clock()
+            evt = parse(message)
+            parsed = clock()
+            keep_receiving = await self._dispatch_server_event(evt)
+            sink.observe_server_event(evt.type, parsed - start, clock() - parsed, queue_depth_frames)
+            if not keep_receiving:
+                return False
+        return True
+
+    def _receive_queue_depth_frames(self) -> Optional[int]:
+        """Number of frames buffered by the websocket, if it exposes its receive queue."""
+        try:
+            return len(self._websocket.recv_messages.frames)
+        except (AttributeError, TypeError):
+            return None
+
+    def _bind_server_event_handler(self, event_type: str, handler):
+        executor = self._handler_executors.get(event_type)
+        self._server_event_dispatch[event_type] = (
+            partial(executor.submit, handler) if executor else handler
+        )
+
+    async def _call_event_handler(self, event_name: str, *args, **kwargs):
+        """Call the handlers of an event, following its execution policy if it has one."""
+        executor = self._handler_executors.get(event_name)
+        if executor is None:
+            await super()._call_event_handler(event_name, *args, **kwargs)
+            return
+        await executor.submit(self._run_event_handlers, event_name, *args, **kwargs)
+
+    async def _run_event_handlers(self, event_name: str, *args, **kwargs):
+        event_handler = self._event_handlers.get(event_name)
+        if event_handler:
+            for handler in event_handler.handlers:
+                await self._run_handler(event_name, handler, *args, **kwargs)
+
+    async def _run_handler(self, event_name: str, handler, *args, **kwargs):
+        """Run a registered event handler, timing it when a metrics sink is configured."""
+        if not self._metrics_sink:
+            await super()._run_handler(event_name, handler, *args, **kwargs)
+            return
+        start = time.perf_counter()
+        await super()._run_handler(event_name, handler, *args, **kwargs)
+        self._metrics_sink.observe_event_handler(event_name, time.perf_counter() - start)
+
+    async def _iter_raw_messages(self):
+        """Iterate over inbound messages without decoding text frames to str."""
+        try:
+            while True:
+                yield await self._websocket.recv(decode=False)
+        except ConnectionClosedOK:
+            return
+
+    async def _dispatch_server_event(self, evt) -> bool:
+        """Dispatch a parsed server event. Returns False when the receive loop should stop."""
+        handler = self._server_event_dispatch.get(evt.type)
+        if handler is None:
+            self._unhandled_server_event_counts[evt.type] += 1
+            return True
+        return await handler(evt) is not False
+
+    async def _handle_evt_audio_delta(self, evt):
+        """Handle an audio delta, including those already decoded by the fast path."""
+        if not isinstance(evt, AudioDeltaEvent):
+            await super()._handle_evt_audio_delta(evt)
+            return
+        await self.stop_ttfb_metrics()
+        if not self._current_audio_response:
+            self._current_audio_response = CurrentAudioResponse(
+                item_id=evt.item_id,
+                content_index=evt.content_index,
+                start_time_ms=int(time.time() * 1000),
+            )
+            await self.push_frame(TTSStartedFrame())
+        self._current_audio_response.total_size += len(evt.audio)
+        await self.push_frame(TTSAudioRawFrame(audio=evt.audio, sample_rate=24000, num_channels=1))
+
+    async def _handle_interruption(self):
+        """Cancel interruptible background tools, then handle the interruption."""
+        self._async_tools.cancel_interruptible()
+        await super()._handle_interruption()
+
+    async def _deliver_async_tool_results(self, results: list[AsyncToolResult]):
+        """Inject completed background tool results and request a response."""
+        text = "".join(
+            "<tool_result>"
+            + json.dumps({"tool_name": result.function_name, "result": result.result})
+            + "</tool_result>"
+            for result in results
+        )
+        item = events.ConversationItem(
+            type="message",
+            role="user",
+            content=[events.ItemContent(type="input_text", text=text)],
+        )
+        self._messages_added_manually[item.id] = True
+        client_events = [events.ConversationItemCreateEvent(item=item)]
+        if not all(result.cancelled for result in results):
+            if self._response_in_progress:
+                self._create_response_when_done = True
+            else:
+                client_events.append(self._response_create_event())
+        await self.send_client_events(client_events)
+
+    def _response_create_event(self) -> events.ResponseCreateEvent:
+        return events.ResponseCreateEvent(
+            response=events.ResponseProperties(output_modalities=self._get_enabled_modalities())
+        )
+
+    async def _handle_evt_response_created(self, evt):
+        """Track that a response is in progress."""
+        self._response_in_progress = True
+
+    async def _handle_evt_response_done(self, evt):
+        """Handle response.done and request any response deferred while this one was active."""
+        self._response_in_progress = False
+        await super()._handle_evt_response_done(evt)
+        if self._create_response_when_done:
+            self._create_response_when_done = False
+            await self.send_client_event(self._response_create_event())
+
+    async def _handle_evt_error_or_stop(self, evt) -> bool:
+        """Handle an error event. Returns False if the error is fatal."""
+        if await self._maybe_handle_evt_retrieve_conversation_item_error(evt):
+            return True
+        if self._reconnect_params:
+            action = classify_realtime_error(evt.error)
+            if action == "ignore":
+                logger.warning(f"Realtime client event failed: {evt.error.message}")
+                await self.push_error(ErrorFrame(error=f"Error: {evt}", fatal=False))
+                return True
+            if action == "reconnect":
+                logger.warning(f"Realtime session lost, reconnecting: {evt.error.message}")
+                self._reconnect_requested = True
+                return False
+        await self._handle_evt_error(evt)
+        # errors are fatal, so exit the receive loop
+        return False
+
+    async def _reconnect(self):
+        """Open a new connection with backoff. The new session is resumed on session.created."""
+        self._reconnect_requested = False
+        websocket, self._websocket = self._websocket, None
+        if websocket:
+            try:
+                await websocket.close()
+            except Exception:
+                pass
+        self._api_session_ready = False
+        self._response_in_progress = False
+        self._current_audio_response = None
+        self._resuming = True
+        if self._client_event_sender:
+            # Audio and events queued for the lost session must not reach the new one first.
+            self._client_event_sender.clear()
+        attempt = 0
+        for attempt, delay in enumerate(self._reconnect_params.backoff_delays(), 1):
+            await asyncio.sleep(delay)
+            await self._connect()
+            if self._websocket:
+                logger.info(f"Realtime connection re-established after {attempt} attempt(s)")
+                await self._call_event_handler("on_reconnected", attempt)
+                return
+        self._resuming = False
+        await self.push_error(
+            ErrorFrame(error=f"Realtime reconnect failed after {attempt} attempts", fatal=True)
+        )
+
+    async def _handle_evt_session_created(self, evt):
+        """Configure a new session, resuming the previous one after a reconnect."""
+        # The new session starts from the server defaults, so the next update is sent in full.
+        self._sent_session_fields = None
+        if not self._resuming:
+            await super()._handle_evt_session_created(evt)
+            return
+        if self._last_session_update:
+            client_events = [self._last_session_update]
+        else:
+            await super()._handle_evt_session_created(evt)
+            client_events = []
+        if self._reconnect_params.replay_conversation:
+            replay = conversation_replay_events(self._conversation.snapshot())
+            for event in replay:
+                self._messages_added_manually[event.item.id] = True
+            client_events += replay
+        await self.send_client_events(client_events)
+        self._resuming = False
+
+    async def _handle_evt_session_updated(self, evt):
+        """Handle session.updated and trigger the on_session_updated event handler."""
+        await super()._handle_evt_session_updated(evt)
+        await self._call_event_handler("on_session_updated", evt.session)
+
+    async def _handle_evt_conversation_item_added(self, evt):
+        """Track the added item in the conversation store before handling it."""
+        self._conversation.add(evt.item, evt.previous_item_id)
+        await super()._handle_evt_conversation_item_added(evt)
+
+    async def _handle_evt_conversation_item_done(self, evt):
+        """Track the completed item in the conversation store before handling it."""
+        self._conversation.update(evt.item)
+        await super()._handle_evt_conversation_item_done(evt)
+
+    async def handle_evt_input_audio_transcription_completed(self, evt):
+        """Track the transcript in the conversation store before handling it."""
+        self._conversation.set_transcript(evt.item_id, evt.content_index, evt.transcript)
+        await super().handle_evt_input_audio_transcription_completed(evt)
 
     async def _handle_evt_conversation_item_deleted(self, evt):
         """Handle conversation.item.deleted event and trigger the on_conversation_item_deleted event handler."""
+        self._conversation.delete(evt.item_id)
         await self._call_event_handler("on_conversation_item_deleted", evt.item_id)
-
@@ -0,0 +1,277 @@
+"""Hot-path metrics for OpenAI Realtime sessions.
+
+An instrumented ``OpenAIRealtimeLLMServiceExt`` reports, for every server event, the time spent
+parsing it and dispatching it to its handler along with the number of websocket frames still
+buffered behind it, and for every registered event handler (``after_function_call_output_sent``,
+``on_conversation_item_deleted``, ...) the time it ran for. Measurements go to a
+:class:`RealtimeMetricsSink`; :class:`InMemoryMetricsSink` aggregates them into histograms that
+can be read with :meth:`InMemoryMetricsSink.snapshot`, and :class:`PrometheusMetricsSink` also
+renders them in the Prometheus text exposition format.
+"""
+
+from bisect import bisect_left
+from dataclasses import dataclass
+from typing import Optional
+
+# Histogram bucket upper bounds in seconds, from 10 us to 10 s.
+DEFAULT_BUCKETS = (
+    0.00001,
+    0.000025,
+    0.00005,
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+
+class RealtimeMetricsSink:
+    """Receives measurements from an instrumented realtime service.
+
+    The default implementation discards everything. Subclass it to export measurements to
+    another system.
+    """
+
+    def observe_server_event(
+        self,
+        event_type: str,
+        parse_time: float,
+        dispatch_time: float,
+        queue_depth_frames: Optional[int],
+    ):
+        """Record the handling of one server event.
+
+        Args:
+            event_type: Type of the server event.
+            parse_time: Seconds spent parsing the message.
+            dispatch_time: Seconds spent dispatching the event, including its handler.
+            queue_depth_frames: Number of websocket frames still buffered when the event was
+                read, or None if the websocket does not expose its receive queue. This is a
+                count, not a time: the websocket does not timestamp frames, so how long the
+                event waited is not known.
+        """
+
+    def observe_event_handler(self, event_name: str, handler_time: float):
+        """Record one run of a registered event handler.
+
+        Args:
+            event_name: Name of the event, e.g. ``on_conversation_item_deleted``.
+            handler_time: Seconds the handler ran for.
+        """
+
+
+@dataclass
+class MetricStats:
+    """Summary of a histogram.
+
+    Parameters:
+        count: Number of observations.
+        total: Sum of the observations in seconds.
+        max: Largest observation in seconds.
+        p50: Upper bound of the bucket holding the median.
+        p99: Upper bound of the bucket holding the 99th percentile.
+    """
+
+    count: int
+    total: float
+    max: float
+    p50: float
+    p99: float
+
+
+class _Histogram:
+    __slots__ = ("bounds", "counts", "count", "total", "max")
+
+    def __init__(self, bounds: tuple[float, ...]):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float):
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+    def quantile(self, q: float) -> float:
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(self.bounds, self.counts):
+            seen += count
+            if seen >= rank:
+                return bound
+        return self.max
+
+    def stats(self) -> MetricStats:
+        return MetricStats(
+            count=self.count,
+            total=self.total,
+            max=self.max,
+            p50=self.quantile(0.5),
+            p99=self.quantile(0.99),
+        )
+
+
+class InMemoryMetricsSink(RealtimeMetricsSink):
+    """Aggregates measurements into in-memory histograms."""
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS):
+        """Initialize the sink.
+
+        Args:
+            buckets: Histogram bucket upper bounds in seconds. Defaults to DEFAULT_BUCKETS.
+        """
+        self._buckets = tuple(sorted(buckets))
+        self._parse: dict[str, _Histogram] = {}
+        self._dispatch: dict[str, _Histogram] = {}
+        self._handlers: dict[str, _Histogram] = {}
+        self._queue_depth = 0
+        self._max_queue_depth = 0
+
+    def observe_server_event(
+        self,
+        event_type: str,
+        parse_time: float,
+        dispatch_time: float,
+        queue_depth_frames: Optional[int],
+    ):
+        """Add the server event timings to the histograms of its event type."""
+        parse = self._parse.get(event_type)
+        if parse is None:
+            parse = self._parse[event_type] = _Histogram(self._buckets)
+            self._dispatch[event_type] = _Histogram(self._buckets)
+        parse.observe(parse_time)
+        self._dispatch[event_type].observe(dispatch_time)
+        if queue_depth_frames is not None:
+            self._queue_depth = queue_depth_frames
+            if queue_depth_frames > self._max_queue_depth:
+                self._max_queue_depth = queue_depth_frames
+
+    def observe_event_handler(self, event_name: str, handler_time: float):
+        """Add the handler run time to the histogram of its event."""
+        handler = self._handlers.get(event_name)
+        if handler is None:
+            handler = self._handlers[event_name] = _Histogram(self._buckets)
+        handler.observe(handler_time)
+
+    def snapshot(self) -> dict:
+        """Return a summary of everything recorded so far.
+
+        Returns:
+            A dict with ``server_events`` mapping each event type to its ``parse`` and
+            ``dispatch`` MetricStats, ``event_handlers`` mapping each event name to its
+            MetricStats, and the last and largest observed receive queue depths in frames,
+            ``queue_depth_frames`` and ``max_queue_depth_frames``.
+        """
+        return {
+            "server_events": {
+                event_type: {
+                    "parse": parse.stats(),
+                    "dispatch": self._dispatch[event_type].stats(),
+                }
+                for event_type, parse in self._parse.items()
+            },
+            "event_handlers": {
+                event_name: handler.stats() for event_name, handler in self._handlers.items()
+            },
+            "queue_depth_frames": self._queue_depth,
+            "max_queue_depth_frames": self._max_queue_depth,
+        }
+
+    def reset(self):
+        """Discard everything recorded so far."""
+        self._parse.clear()
+        self._dispatch.clear()
+        self._handlers.clear()
+        self._queue_depth = 0
+        self._max_queue_depth = 0
+
+
+class PrometheusMetricsSink(InMemoryMetricsSink):
+    """In-memory sink that renders its histograms in the Prometheus text exposition format."""
+
+    def __init__(
+        self,
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+        *,
+        namespace: str = "pipecat_realtime",
+        labels: Optional[dict[str, str]] = None,
+    ):
+        """Initialize the sink.
+
+        Args:
+            buckets: Histogram bucket upper bounds in seconds. Defaults to DEFAULT_BUCKETS.
+            namespace: Prefix of the metric names. Defaults to "pipecat_realtime".
+            labels: Constant labels added to every sample, e.g. a session id.
+        """
+        super().__init__(buckets)
+        self._namespace = namespace
+        self._labels = labels or {}
+
+    def render(self) -> str:
+        """Render the metrics in the Prometheus text exposition format."""
+        ns = self._namespace
+        lines = [
+            f"# HELP {ns}_server_event_seconds Time spent handling server events, by stage.",
+            f"# TYPE {ns}_server_event_seconds histogram",
+        ]
+        for stage, histograms in (("parse", self._parse), ("dispatch", self._dispatch)):
+            for event_type, histogram in histograms.items():
+                self._render_histogram(
+                    lines,
+                    f"{ns}_server_event_seconds",
+                    {"event_type": event_type, "stage": stage},
+                    histogram,
+                )
+        lines += [
+            f"# HELP {ns}_event_handler_seconds Time spent running registered event handlers.",
+            f"# TYPE {ns}_event_handler_seconds histogram",
+        ]
+        for event_name, histogram in self._handlers.items():
+            self._render_histogram(
+                lines, f"{ns}_event_handler_seconds", {"event_name": event_name}, histogram
+            )
+        lines += [
+            f"# HELP {ns}_receive_queue_depth_frames Websocket frames buffered at the last read.",
+            f"# TYPE {ns}_receive_queue_depth_frames gauge",
+            f"{ns}_receive_queue_depth_frames{self._format_labels({})} {self._queue_depth}",
+            f"# HELP {ns}_receive_queue_depth_frames_max Most buffered websocket frames seen.",
+            f"# TYPE {ns}_receive_queue_depth_frames_max gauge",
+            f"{ns}_receive_queue_depth_frames_max{self._format_labels({})} {self._max_queue_depth}",
+        ]
+        return "\n".join(lines) + "\n"
+
+    def _render_histogram(self, lines: list, name: str, labels: dict, histogram: _Histogram):
+        cumulative = 0
+        for bound, count in zip(histogram.bounds, histogram.counts):
+            cumulative += count
+            lines.append(f"{name}_bucket{self._format_labels(labels, le=repr(bound))} {cumulative}")
+        lines.append(f"{name}_bucket{self._format_labels(labels, le='+Inf')} {histogram.count}")
+        lines.append(f"{name}_sum{self._format_labels(labels)} {histogram.total!r}")
+        lines.append(f"{name}_count{self._format_labels(labels)} {histogram.count}")
+
+    def _format_labels(self, labels: dict, **extra) -> str:
+        merged = {**self._labels, **labels, **extra}
+        if not merged:
+            return ""
+        pairs = ",".join(f'{key}="{_escape(value)}"' for key, value in merged.items())
+        return "{" + pairs + "}"
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
@@ -0,0 +1,121 @@
+"""Reconnect and session resume support for OpenAI Realtime sessions."""
+
+import random
+from typing import Iterator, Literal, Optional
+
+from pipecat.services.openai.realtime import events
+from pydantic import BaseModel
+
+ErrorAction = Literal["ignore", "reconnect", "fatal"]
+
+# Errors caused by a single client event. The session is still usable.
+_IGNORABLE_CODES = {
+    "conversation_already_has_active_response",
+    "response_cancel_not_active",
+    "input_audio_buffer_commit_empty",
+    "item_truncate_invalid_item_id",
+    "invalid_value",
+    "unknown_parameter",
+    "missing_required_parameter",
+}
+
+# Errors that end the session but are fixed by opening a new one.
+_RECONNECT_CODES = {"session_expired"}
+_RECONNECT_TYPES = {"server_error"}
+
+# Errors that a new connection would hit again.
+_FATAL_CODES = {"invalid_api_key", "insufficient_quota", "model_not_found"}
+_FATAL_TYPES = {"authentication_error", "permission_error"}
+
+
+def classify_realtime_error(error: events.RealtimeError) -> ErrorAction:
+    """Decide how to react to an ``error`` server event.
+
+    Returns:
+        "ignore" if only the client event that caused the error failed, "reconnect" if the
+        session is gone but a new connection would work, and "fatal" otherwise.
+    """
+    if error.code in _FATAL_CODES or error.type in _FATAL_TYPES:
+        return "fatal"
+    if error.code in _RECONNECT_CODES or error.type in _RECONNECT_TYPES:
+        return "reconnect"
+    if error.code in _IGNORABLE_CODES or error.type == "invalid_request_error":
+        return "ignore"
+    return "fatal"
+
+
+class ReconnectParams(BaseModel):
+    """Configuration for automatic reconnection.
+
+    Parameters:
+        max_attempts: Number of connection attempts before giving up. None retries forever.
+            Defaults to 5.
+        initial_backoff: Delay in seconds before the first attempt. Defaults to 0.5.
+        max_backoff: Upper bound on the delay between attempts in seconds. Defaults to 10.
+        backoff_multiplier: Factor applied to the delay after each failed attempt.
+            Defaults to 2.
+        jitter: Fraction of each delay that is randomized, so many sessions dropped at once do
+            not reconnect in lockstep. Defaults to 0.2.
+        replay_conversation: Whether to recreate the locally tracked conversation in the new
+            session. Defaults to True.
+    """
+
+    max_attempts: Optional[int] = 5
+    initial_backoff: float = 0.5
+    max_backoff: float = 10.0
+    backoff_multiplier: float = 2.0
+    jitter: float = 0.2
+    replay_conversation: bool = True
+
+    def backoff_delays(self) -> Iterator[float]:
+        """Yield the delay before each connection attempt."""
+        delay = self.initial_backoff
+        attempt = 0
+        while self.max_attempts is None or attempt < self.max_attempts:
+            yield delay * (1 - self.jitter * random.random())
+            delay = min(delay * self.backoff_multiplier, self.max_backoff)
+            attempt += 1
+
+
+def conversation_replay_events(
+    items: tuple[events.ConversationItem, ...],
+) -> list[events.ConversationItemCreateEvent]:
+    """Build the client events that recreate a conversation in a new session.
+
+    Audio is never resent: audio content is replaced by its transcript and dropped when there
+    is none, and only the fields the server needs are kept. Items keep their ids, so the
+    server's ``conversation.item.added`` events can be matched to the local items.
+    """
+    client_events = []
+    for item in items:
+        if item.type == "message":
+            content = _text_content(item)
+            if not content:
+                continue
+            replay = events.ConversationItem(
+                id=item.id, type="message", role=item.role, content=content
+            )
+        elif item.type == "function_call":
+            replay = events.ConversationItem(
+                id=item.id,
+                type="function_call",
+                call_id=item.call_id,
+                name=item.name,
+                arguments=item.arguments,
+            )
+        else:
+            replay = events.ConversationItem(
+                id=item.id, type="function_call_output", call_id=item.call_id, output=item.output
+            )
+        client_events.append(events.ConversationItemCreateEvent(item=replay))
+    return client_events
+
+
+def _text_content(item: events.ConversationItem) -> list[events.ItemContent]:
+    text_type = "output_text" if item.role == "assistant" else "input_text"
+    content = []
+    for part in item.content or ():
+        text = part.text if part.text is not None else part.transcript
+        if text:
+            content.append(events.ItemContent(type=text_type, text=text))
+    return content
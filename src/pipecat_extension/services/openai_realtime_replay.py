@@ -0,0 +1,190 @@
+"""Record and replay OpenAI Realtime sessions.
+
+A :class:`RealtimeSessionRecorder` captures every server event a session receives, with its
+arrival time. Recordings are stored as gzip-compressed text, one event per line prefixed by its
+offset in seconds from the start of the session::
+
+    # openai-realtime-recording v1
+    0.000000<TAB>{"type":"session.created",...}
+    0.153201<TAB>{"type":"session.updated",...}
+
+:class:`RealtimeReplayServer` is a local websocket server that replays a recording to every
+client that connects, at real or accelerated speed, so the receive path of
+``OpenAIRealtimeLLMServiceExt`` can be load- and regression-tested without network access.
+"""
+
+import asyncio
+import gzip
+import json
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional, Union
+
+from loguru import logger
+from websockets.asyncio.server import ServerConnection, serve
+from websockets.exceptions import ConnectionClosed
+
+_HEADER = "# openai-realtime-recording v1"
+
+
+@dataclass
+class RealtimeRecording:
+    """Server events of a realtime session with their offsets from the start of the session.
+
+    Parameters:
+        events: List of ``(offset_seconds, message)`` tuples in arrival order.
+    """
+
+    events: list[tuple[float, str]] = field(default_factory=list)
+
+    @property
+    def duration(self) -> float:
+        """Offset of the last event in seconds."""
+        return self.events[-1][0] if self.events else 0.0
+
+    def save(self, path: Union[str, Path]):
+        """Write the recording to ``path``."""
+        with gzip.open(path, "wt", encoding="utf-8") as f:
+            f.write(_HEADER + "\n")
+            for offset, message in self.events:
+                f.write(f"{offset:.6f}\t{message}\n")
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "RealtimeRecording":
+        """Read a recording written by :meth:`save`."""
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            header = f.readline().rstrip("\n")
+            if header != _HEADER:
+                raise ValueError(f"Not a realtime recording: {path}")
+            events = []
+            for line in f:
+                offset, message = line.rstrip("\n").split("\t", 1)
+                events.append((float(offset), message))
+        return cls(events=events)
+
+
+class RealtimeSessionRecorder:
+    """Captures the server events received by a realtime session."""
+
+    def __init__(self):
+        """Initialize the recorder. Offsets are measured from the first recorded event."""
+        self._recording = RealtimeRecording()
+        self._start: Optional[float] = None
+
+    @property
+    def recording(self) -> RealtimeRecording:
+        """The events recorded so far."""
+        return self._recording
+
+    def record(self, message: Union[str, bytes]):
+        """Record a raw server message."""
+        now = time.monotonic()
+        if self._start is None:
+            self._start = now
+        if isinstance(message, (bytes, bytearray)):
+            message = message.decode()
+        if "\n" in message:
+            # Keep one event per line; the API itself sends compact JSON.
+            message = json.dumps(json.loads(message), separators=(",", ":"))
+        self._recording.events.append((now - self._start, message))
+
+    def save(self, path: Union[str, Path]):
+        """Write the events recorded so far to ``path``."""
+        self._recording.save(path)
+
+
+class RealtimeReplayServer:
+    """Local websocket server that replays a recording to each client that connects.
+
+    Use it as an async context manager and point the service at :attr:`url`::
+
+        async with RealtimeReplayServer(recording, speed=10) as server:
+            llm = OpenAIRealtimeLLMServiceExt(api_key="test", base_url=server.url)
+
+    Client events received from each connection are kept in :attr:`client_events`.
+    """
+
+    def __init__(
+        self,
+        recording: RealtimeRecording,
+        *,
+        speed: Optional[float] = 1.0,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        close_when_done: bool = True,
+    ):
+        """Initialize the replay server.
+
+        Args:
+            recording: The recording to replay.
+            speed: Playback speed relative to the recording. None replays as fast as possible.
+                Defaults to 1.0 (real time).
+            host: Interface to listen on. Defaults to "127.0.0.1".
+            port: Port to listen on. Defaults to 0 (any free port).
+            close_when_done: Whether to close each connection once the recording has been
+                replayed. Defaults to True.
+        """
+        self._recording = recording
+        self._speed = speed
+        self._host = host
+        self._port = port
+        self._close_when_done = close_when_done
+        self._server = None
+        self.client_events: list[list[dict]] = []
+
+    @property
+    def url(self) -> str:
+        """The websocket URL of the running server."""
+        host, port = self._server.sockets[0].getsockname()[:2]
+        return f"ws://{host}:{port}"
+
+    async def start(self):
+        """Start listening for connections."""
+        self._server = await serve(self._handle_connection, self._host, self._port)
+
+    async def stop(self):
+        """Close every connection and stop the server."""
+        if self._server:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def __aenter__(self) -> "RealtimeReplayServer":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.stop()
+
+    async def _handle_connection(self, websocket: ServerConnection):
+        client_events = []
+        self.client_events.append(client_events)
+        reader = asyncio.create_task(self._read_client_events(websocket, client_events))
+        try:
+            await self._replay(websocket)
+            if self._close_when_done:
+                await websocket.close()
+            else:
+                await websocket.wait_closed()
+        except ConnectionClosed:
+            logger.debug("Replay client disconnected before the recording ended")
+        finally:
+            reader.cancel()
+
+    async def _replay(self, websocket: ServerConnection):
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        for offset, message in self._recording.events:
+            if self._speed:
+                delay = start + offset / self._speed - loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            await websocket.send(message)
+
+    async def _read_client_events(self, websocket: ServerConnection, client_events: list):
+        try:
+            async for message in websocket:
+                client_events.append(json.loads(message))
+        except ConnectionClosed:
+            pass
@@ -0,0 +1,191 @@
+"""Batched, coalescing sender for OpenAI Realtime client events."""
+
+import asyncio
+import binascii
+import uuid
+from collections import deque
+from typing import Awaitable, Callable, Iterable, Optional
+
+from pipecat.services.openai.realtime import events
+from pydantic import BaseModel
+from pydantic_core import to_json
+
+
+class ClientEventSenderParams(BaseModel):
+    """Configuration for a ClientEventSender.
+
+    Parameters:
+        max_audio_bytes: Buffered input audio is sent as soon as it reaches this size.
+            Defaults to 9600 bytes (200 ms of 24 kHz, 16-bit mono PCM).
+        max_audio_delay: Maximum time in seconds input audio is held back for coalescing.
+            Defaults to 0.04.
+        max_pending_bytes: Producers wait while this many serialized bytes are queued or
+            being written. Defaults to 1 MiB.
+    """
+
+    max_audio_bytes: int = 9600
+    max_audio_delay: float = 0.04
+    max_pending_bytes: int = 1 << 20
+
+
+class ClientEventSender:
+    """Outbound queue for realtime client events.
+
+    Events are serialized straight to JSON bytes and written by a single writer loop, which
+    flushes everything queued since its last pass in one go. Consecutive input audio is
+    coalesced into a single ``input_audio_buffer.append`` event up to a size or time budget and
+    is always flushed ahead of the next control event, so ordering is preserved. Producers are
+    throttled once ``max_pending_bytes`` are queued or in flight, which applies backpressure when
+    the socket is slow.
+
+    The realtime API accepts exactly one event per websocket message, so control events cannot
+    share a frame; batching them saves wakeups and serialization work, and audio coalescing
+    reduces the number of frames.
+    """
+
+    def __init__(
+        self,
+        send: Callable[[bytes], Awaitable[None]],
+        params: Optional[ClientEventSenderParams] = None,
+    ):
+        """Initialize the sender.
+
+        Args:
+            send: Coroutine function that writes one serialized event to the websocket.
+            params: Sender configuration. If None, uses default ClientEventSenderParams.
+        """
+        self._send = send
+        self._params = params or ClientEventSenderParams()
+        self._pending = deque()
+        self._pending_bytes = 0
+        self._audio = bytearray()
+        self._audio_chunks = 0
+        self._audio_deadline: Optional[float] = None
+        self._wakeup = asyncio.Event()
+        self._space = asyncio.Event()
+        self._space.set()
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._events_sent = 0
+        self._audio_chunks_coalesced = 0
+
+    @property
+    def events_sent(self) -> int:
+        """Number of events written to the websocket."""
+        return self._events_sent
+
+    @property
+    def audio_chunks_coalesced(self) -> int:
+        """Number of input audio chunks that were merged into another append event."""
+        return self._audio_chunks_coalesced
+
+    async def send(self, event: events.ClientEvent):
+        """Queue a client event."""
+        await self.send_many((event,))
+
+    async def send_many(self, client_events: Iterable[events.ClientEvent]):
+        """Queue several client events to be flushed together."""
+        await self.send_encoded(encode_client_event(event) for event in client_events)
+
+    async def send_encoded(self, payloads: Iterable[bytes]):
+        """Queue already serialized client events to be flushed together."""
+        await self._queue_audio()
+        for payload in payloads:
+            await self._enqueue(payload)
+
+    async def append_audio(self, audio: bytes):
+        """Buffer input audio, sending it once the size or time budget is reached."""
+        if not self._audio:
+            self._audio_deadline = asyncio.get_running_loop().time() + self._params.max_audio_delay
+            self._wakeup.set()
+        else:
+            self._audio_chunks_coalesced += 1
+        self._audio += audio
+        if len(self._audio) >= self._params.max_audio_bytes:
+            await self._queue_audio()
+
+    async def flush(self):
+        """Wait until every queued event and buffered audio has been written."""
+        await self._queue_audio()
+        await self._idle.wait()
+
+    def clear(self):
+        """Drop queued events and buffered audio."""
+        self._pending.clear()
+        self._pending_bytes = 0
+        self._audio.clear()
+        self._audio_deadline = None
+        self._space.set()
+        self._idle.set()
+
+    async def run(self):
+        """Writer loop. Run it as a task for as long as the websocket is connected."""
+        loop = asyncio.get_running_loop()
+        while True:
+            try:
+                async with asyncio.timeout_at(self._audio_deadline):
+                    await self._wakeup.wait()
+            except TimeoutError:
+                pass
+            self._wakeup.clear()
+            if self._audio_deadline is not None and loop.time() >= self._audio_deadline:
+                self._push(self._take_audio())
+            if not self._pending:
+                continue
+            batch, self._pending = self._pending, deque()
+            for payload in batch:
+                await self._send(payload)
+                self._pending_bytes -= len(payload)
+            self._events_sent += len(batch)
+            if self._pending_bytes < self._params.max_pending_bytes:
+                self._space.set()
+            if not self._pending:
+                self._idle.set()
+
+    async def _enqueue(self, payload: bytes):
+        while self._pending_bytes >= self._params.max_pending_bytes:
+            self._space.clear()
+            await self._space.wait()
+        self._push(payload)
+
+    async def _queue_audio(self):
+        if self._audio:
+            await self._enqueue(self._take_audio())
+
+    def _push(self, payload: bytes):
+        self._pending.append(payload)
+        self._pending_bytes += len(payload)
+        self._idle.clear()
+        self._wakeup.set()
+
+    def _take_audio(self) -> bytes:
+        payload = encode_input_audio_append(self._audio)
+        self._audio.clear()
+        self._audio_deadline = None
+        return payload
+
+
+def encode_input_audio_append(audio, event_id: Optional[str] = None) -> bytes:
+    """Serialize an ``input_audio_buffer.append`` event straight from a buffer of PCM audio.
+
+    Gives the same bytes as serializing an InputAudioBufferAppendEvent, without the
+    intermediate base64 str and pydantic model. ``audio`` may be any bytes-like object and is
+    not copied. A new event id is generated if ``event_id`` is None.
+    """
+    return b"".join(
+        (
+            b'{"event_id":"',
+            (event_id or str(uuid.uuid4())).encode(),
+            b'","type":"input_audio_buffer.append","audio":"',
+            binascii.b2a_base64(audio, newline=False),
+            b'"}',
+        )
+    )
+
+
+def encode_client_event(event: events.ClientEvent) -> bytes:
+    """Serialize a client event to the JSON bytes sent on the websocket."""
+    if isinstance(event, events.SessionUpdateEvent):
+        # SessionUpdateEvent.model_dump turns a disabled turn_detection (False) into null.
+        return to_json(event.model_dump(exclude_none=True))
+    return to_json(event, exclude_none=True)
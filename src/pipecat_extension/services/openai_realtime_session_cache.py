@@ -0,0 +1,104 @@
+"""Cache of encoded ``session.update`` payloads for OpenAI Realtime sessions."""
+
+from collections import OrderedDict
+from typing import Optional
+
+from pipecat.services.openai.realtime import events
+from pydantic_core import to_json
+
+SessionFields = dict[str, bytes]
+
+
+def session_fields(session: events.SessionProperties) -> SessionFields:
+    """Encode each set top-level field of ``session`` on its own.
+
+    The result identifies the session's content: two sessions with equal fields produce equal
+    encodings, and comparing two results shows which fields changed.
+    """
+    return {
+        name: to_json(value, exclude_none=True)
+        for name, value in session
+        if value is not None
+    }
+
+
+def changed_session_fields(previous: SessionFields, current: SessionFields) -> list[str]:
+    """Return the fields of ``current`` that differ from ``previous``, in field order.
+
+    The realtime API replaces every field sent in a ``session.update`` and leaves the others
+    as they are, so only changed fields need to be sent. ``type`` is always kept because the
+    API requires it. Fields dropped from ``current`` are not reported: the API cannot unset a
+    field, so leaving them out matches what sending the full session would do.
+    """
+    return [
+        name
+        for name, value in current.items()
+        if name == "type" or previous.get(name) != value
+    ]
+
+
+class SessionUpdateCache:
+    """LRU cache of encoded ``session.update`` events, keyed by session content.
+
+    Building and serializing a session.update with several KB of instructions and tool
+    schemas costs far more than encoding its fields for the key, and agents send the same
+    few configurations on every connect. Share one cache between sessions to reuse payloads
+    across them. Cached payloads have no ``event_id``, which is optional, so they can be
+    reused as is.
+    """
+
+    def __init__(self, max_entries: int = 64):
+        """Initialize the cache.
+
+        Args:
+            max_entries: Number of payloads kept. Defaults to 64.
+        """
+        self._max_entries = max_entries
+        self._payloads: OrderedDict[tuple, bytes] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def hits(self) -> int:
+        """Number of payloads served from the cache."""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """Number of payloads that had to be encoded."""
+        return self._misses
+
+    def encode(
+        self,
+        session: events.SessionProperties,
+        fields: Optional[SessionFields] = None,
+        only: Optional[list[str]] = None,
+    ) -> bytes:
+        """Return the encoded session.update event for ``session``.
+
+        Args:
+            session: The session properties to send.
+            fields: ``session_fields(session)``, if already computed.
+            only: If given, only these top-level fields are sent.
+        """
+        fields = fields if fields is not None else session_fields(session)
+        names = only if only is not None else list(fields)
+        key = tuple((name, fields[name]) for name in names)
+        payload = self._payloads.get(key)
+        if payload is not None:
+            self._hits += 1
+            self._payloads.move_to_end(key)
+            return payload
+
+        self._misses += 1
+        if only is not None:
+            session = events.SessionProperties.model_construct(
+                _fields_set=set(names), **{name: getattr(session, name) for name in names}
+            )
+        # SessionUpdateEvent.model_dump turns a disabled turn_detection (False) into null.
+        event = events.SessionUpdateEvent(session=session)
+        payload = to_json(event.model_dump(exclude_none=True, exclude={"event_id"}))
+        self._payloads[key] = payload
+        if len(self._payloads) > self._max_entries:
+            self._payloads.popitem(last=False)
+        return payload
@@ -0,0 +1,191 @@
+"""Asynchronous (PENDING) tool calls for OpenAI Realtime sessions."""
+
+import asyncio
+import inspect
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Optional
+
+from loguru import logger
+from pydantic import BaseModel
+
+from pipecat.services.llm_service import FunctionCallParams
+
+
+class AsyncToolCallParams(BaseModel):
+    """Configuration for an AsyncToolCallEngine.
+
+    Parameters:
+        max_concurrency: Maximum number of tools running at the same time. Defaults to 8.
+        default_timeout: Timeout in seconds for tools registered without one. None disables
+            the timeout. Defaults to 30.
+        batch_window: Time in seconds to wait for more completions before delivering results,
+            so tools finishing close together are delivered as one item. Defaults to 0.05.
+        pending_result: Result returned to the model as soon as a tool is called.
+            Defaults to ``{"status": "PENDING"}``.
+    """
+
+    max_concurrency: int = 8
+    default_timeout: Optional[float] = 30.0
+    batch_window: float = 0.05
+    pending_result: Any = {"status": "PENDING"}
+
+
+@dataclass
+class AsyncToolResult:
+    """Final result of an asynchronous tool call.
+
+    Parameters:
+        function_name: Name of the tool that was called.
+        tool_call_id: ID of the tool call.
+        result: Result returned by the tool, or an error or cancellation status.
+        cancelled: Whether the call was cancelled by an interruption.
+    """
+
+    function_name: str
+    tool_call_id: str
+    result: Any
+    cancelled: bool = False
+
+
+@dataclass
+class _AsyncToolCall:
+    function_name: str
+    tool_call_id: str
+    cancel_on_interruption: bool
+    task: Optional[asyncio.Task] = None
+    result: Optional[AsyncToolResult] = None
+    acknowledged: bool = False
+
+
+class AsyncToolCallEngine:
+    """Runs long-running tools in the background and delivers their results when ready.
+
+    A tool wrapped with :meth:`function` immediately returns ``pending_result`` to the model and
+    keeps running on a bounded pool of tasks with its own timeout. A result is only delivered
+    once the pending output has been sent (see :meth:`acknowledge`), so the final result can
+    never overtake it, and results completing within ``batch_window`` of each other are
+    delivered together.
+    """
+
+    def __init__(
+        self,
+        deliver: Callable[[list[AsyncToolResult]], Awaitable[None]],
+        params: Optional[AsyncToolCallParams] = None,
+    ):
+        """Initialize the engine.
+
+        Args:
+            deliver: Coroutine function called with each batch of ready results.
+            params: Engine configuration. If None, uses default AsyncToolCallParams.
+        """
+        self._deliver = deliver
+        self._params = params or AsyncToolCallParams()
+        self._semaphore = asyncio.Semaphore(self._params.max_concurrency)
+        self._calls: dict[str, _AsyncToolCall] = {}
+        self._ready: list[AsyncToolResult] = []
+        self._deliver_task: Optional[asyncio.Task] = None
+
+    @property
+    def in_flight(self) -> int:
+        """Number of calls whose results have not been delivered yet."""
+        return len(self._calls)
+
+    def function(
+        self,
+        handler: Callable[[FunctionCallParams], Any],
+        *,
+        timeout: Optional[float] = None,
+        cancel_on_interruption: bool = True,
+    ):
+        """Wrap a tool as a function handler that can be passed to ``register_function``.
+
+        Args:
+            handler: Coroutine function (or plain function, which is run in a thread) that
+                receives the FunctionCallParams and returns the tool result.
+            timeout: Timeout in seconds. If None, uses ``default_timeout``.
+            cancel_on_interruption: Whether to cancel the call when the user interrupts.
+
+        Returns:
+            A function handler that returns ``pending_result`` and runs the tool in the
+            background.
+        """
+        timeout = timeout if timeout is not None else self._params.default_timeout
+
+        async def function_handler(params: FunctionCallParams):
+            call = _AsyncToolCall(
+                function_name=params.function_name,
+                tool_call_id=params.tool_call_id,
+                cancel_on_interruption=cancel_on_interruption,
+            )
+            self._calls[call.tool_call_id] = call
+            call.task = asyncio.create_task(self._run(call, handler, params, timeout))
+            await params.result_callback(self._params.pending_result)
+
+        return function_handler
+
+    def acknowledge(self, tool_call_id: str):
+        """Mark the pending output of a call as sent, allowing its result to be delivered."""
+        call = self._calls.get(tool_call_id)
+        if call:
+            call.acknowledged = True
+            self._maybe_ready(call)
+
+    def cancel_interruptible(self):
+        """Cancel the running calls that were registered with cancel_on_interruption."""
+        for call in self._calls.values():
+            if call.cancel_on_interruption and call.task and not call.task.done():
+                call.task.cancel()
+
+    def cancel_all(self):
+        """Cancel every running call and drop undelivered results."""
+        calls, self._calls = self._calls, {}
+        for call in calls.values():
+            if call.task:
+                call.task.cancel()
+        self._ready.clear()
+        if self._deliver_task:
+            self._deliver_task.cancel()
+            self._deliver_task = None
+
+    async def _run(self, call: _AsyncToolCall, handler, params: FunctionCallParams, timeout):
+        cancelled = False
+        try:
+            async with self._semaphore:
+                async with asyncio.timeout(timeout):
+                    if inspect.iscoroutinefunction(handler):
+                        result = await handler(params)
+                    else:
+                        result = await asyncio.to_thread(handler, params)
+        except TimeoutError:
+            result = {"status": "ERROR", "reason": f"Timed out after {timeout} seconds"}
+        except asyncio.CancelledError:
+            if self._calls.get(call.tool_call_id) is not call:
+                raise
+            result = {"status": "CANCELLED"}
+            cancelled = True
+        except Exception as e:
+            logger.error(f"Error running tool {call.function_name}: {e}")
+            result = {"status": "ERROR", "reason": str(e)}
+        call.result = AsyncToolResult(
+            function_name=call.function_name,
+            tool_call_id=call.tool_call_id,
+            result=result,
+            cancelled=cancelled,
+        )
+        self._maybe_ready(call)
+
+    def _maybe_ready(self, call: _AsyncToolCall):
+        if not (call.result and call.acknowledged):
+            return
+        # A reused tool_call_id may already belong to a newer call; leave that one tracked.
+        if self._calls.get(call.tool_call_id) is call:
+            del self._calls[call.tool_call_id]
+        self._ready.append(call.result)
+        if not self._deliver_task:
+            self._deliver_task = asyncio.create_task(self._deliver_after_window())
+
+    async def _deliver_after_window(self):
+        await asyncio.sleep(self._params.batch_window)
+        results, self._ready = self._ready, []
+        self._deliver_task = None
+        await self._deliver(results)
@@ -0,0 +1,223 @@
+"""Run many OpenAI Realtime sessions in one process, sharing what does not vary per session."""
+
+import asyncio
+import os
+import resource
+import ssl
+import time
+from typing import Optional
+
+from loguru import logger
+
+from pipecat.pipeline.runner import PipelineRunner
+from pipecat.pipeline.task import PipelineTask
+from pipecat.services.openai.realtime import events
+from pydantic import BaseModel
+
+from pipecat_extension.services.openai_realtime_llm_service import OpenAIRealtimeLLMServiceExt
+
+
+class SessionRejectedError(Exception):
+    """Raised when a realtime worker has no capacity left for another session."""
+
+
+class RealtimeWorkerParams(BaseModel):
+    """Configuration for RealtimeWorker admission control.
+
+    Parameters:
+        max_sessions: Hard limit on concurrent sessions. None means no limit. Defaults to None.
+        max_cpu_utilization: CPU time the event loop's thread may use per second of wall time,
+            as a fraction of one core (the sessions share one event loop). CPU used by other
+            threads, such as model inference pools, is not counted. A session is admitted only
+            if the measured CPU use plus one more session's share stays below it. Defaults to
+            0.8.
+        max_memory_bytes: Resident set size the process may reach. A session is admitted only
+            if the current RSS plus one more session's measured share stays below it. None means
+            no limit. Defaults to None.
+        sample_interval: Seconds between CPU and memory measurements. Defaults to 1.0.
+        smoothing: Weight of the newest CPU measurement in the moving average. Defaults to 0.3.
+    """
+
+    max_sessions: Optional[int] = None
+    max_cpu_utilization: float = 0.8
+    max_memory_bytes: Optional[int] = None
+    sample_interval: float = 1.0
+    smoothing: float = 0.3
+
+
+def current_rss_bytes() -> int:
+    """Resident set size of this process, falling back to the peak where /proc is unavailable."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+class RealtimeWorker:
+    """Hosts many realtime sessions on one event loop.
+
+    Every session created with ``create_service`` shares the worker's SSL context, so the CA
+    certificates are loaded once per process instead of once per connection, and starts from
+    the worker's parsed SessionProperties (tool schemas included) instead of building its own.
+    The base service writes context tools and instructions into its session properties, so each
+    session gets a shallow copy: the nested tool schemas stay shared, the top-level fields do not.
+    Client events are still serialized with the module level JSON encoders, which are already
+    shared by every session in the process.
+
+    Sessions are admitted against the CPU time of the event loop's thread and the memory of the
+    process: the current usage divided by the number of running sessions is taken as the cost
+    of one more.
+
+    Example::
+
+        worker = RealtimeWorker(RealtimeWorkerParams(max_memory_bytes=2 * 1024**3),
+                                session_properties=session_properties)
+        await worker.start()
+
+        async def on_call(transport):
+            llm = worker.create_service(api_key=api_key)
+            task = PipelineTask(Pipeline([transport.input(), llm, transport.output()]))
+            try:
+                await worker.run_session(task)
+            except SessionRejectedError:
+                ...  # send the caller elsewhere
+    """
+
+    def __init__(
+        self,
+        params: Optional[RealtimeWorkerParams] = None,
+        *,
+        session_properties: Optional[events.SessionProperties] = None,
+        ssl_context: Optional[ssl.SSLContext] = None,
+    ):
+        """Initialize the worker.
+
+        Args:
+            params: Admission control configuration. If None, uses default RealtimeWorkerParams.
+            session_properties: Session properties every session starts from.
+            ssl_context: SSL context shared by every session's websocket. If None, a default
+                context is created once for the worker.
+        """
+        self._params = params or RealtimeWorkerParams()
+        self._session_properties = session_properties or events.SessionProperties()
+        self._ssl_context = ssl_context or ssl.create_default_context()
+        self._sessions: set[asyncio.Task] = set()
+        self._rejected_count = 0
+        self._cpu_utilization = 0.0
+        self._rss = current_rss_bytes()
+        self._baseline_rss = self._rss
+        self._last_sample: Optional[tuple[float, float]] = None
+        self._sample_task: Optional[asyncio.Task] = None
+
+    @property
+    def active_sessions(self) -> int:
+        """The number of sessions currently running."""
+        return len(self._sessions)
+
+    @property
+    def rejected_sessions(self) -> int:
+        """The number of sessions turned away since the worker was created."""
+        return self._rejected_count
+
+    @property
+    def cpu_utilization(self) -> float:
+        """The smoothed CPU use of the event loop's thread, as a fraction of one core."""
+        return self._cpu_utilization
+
+    @property
+    def ssl_context(self) -> ssl.SSLContext:
+        """The SSL context shared by every session."""
+        return self._ssl_context
+
+    def session_properties(self) -> events.SessionProperties:
+        """Return a per-session copy of the shared session properties."""
+        return self._session_properties.model_copy()
+
+    def create_service(self, **kwargs) -> OpenAIRealtimeLLMServiceExt:
+        """Create a realtime service wired to the worker's shared resources.
+
+        Args:
+            **kwargs: Arguments for OpenAIRealtimeLLMServiceExt. ``session_properties`` and
+                ``ssl_context`` default to the worker's.
+        """
+        kwargs.setdefault("session_properties", self.session_properties())
+        kwargs.setdefault("ssl_context", self._ssl_context)
+        return OpenAIRealtimeLLMServiceExt(**kwargs)
+
+    async def start(self):
+        """Take the baseline measurements and start sampling CPU and memory use."""
+        self._baseline_rss = current_rss_bytes()
+        self.sample()
+        if not self._sample_task:
+            self._sample_task = asyncio.create_task(self._sample_task_handler())
+
+    async def stop(self):
+        """Stop sampling and cancel every running session."""
+        if self._sample_task:
+            self._sample_task.cancel()
+            await asyncio.gather(self._sample_task, return_exceptions=True)
+            self._sample_task = None
+        for session in list(self._sessions):
+            session.cancel()
+        await asyncio.gather(*self._sessions, return_exceptions=True)
+
+    def sample(self):
+        """Measure CPU and memory use now and update the moving averages.
+
+        Must be called on the event loop's thread, whose CPU time is measured.
+        """
+        now = (time.monotonic(), time.thread_time())
+        if self._last_sample:
+            wall = now[0] - self._last_sample[0]
+            if wall > 0:
+                utilization = (now[1] - self._last_sample[1]) / wall
+                smoothing = self._params.smoothing
+                self._cpu_utilization += smoothing * (utilization - self._cpu_utilization)
+        self._last_sample = now
+        self._rss = current_rss_bytes()
+
+    def admission_error(self) -> Optional[str]:
+        """Return why another session would be rejected now, or None if it can be admitted."""
+        active = len(self._sessions)
+        params = self._params
+        if params.max_sessions is not None and active >= params.max_sessions:
+            return f"session limit reached ({active} sessions)"
+        cpu_per_session = self._cpu_utilization / active if active else 0.0
+        if self._cpu_utilization + cpu_per_session > params.max_cpu_utilization:
+            return f"CPU budget exhausted ({self._cpu_utilization:.0%} of a core in use)"
+        if params.max_memory_bytes is not None:
+            memory_per_session = max(self._rss - self._baseline_rss, 0) / active if active else 0
+            if self._rss + memory_per_session > params.max_memory_bytes:
+                return f"memory budget exhausted ({self._rss} bytes resident)"
+        return None
+
+    async def run_session(self, task: PipelineTask, *, runner: Optional[PipelineRunner] = None):
+        """Run a session's pipeline to completion if the worker has capacity for it.
+
+        Args:
+            task: The session's pipeline task.
+            runner: Runner for the task. If None, a runner that leaves signal handling to the
+                process is created.
+
+        Raises:
+            SessionRejectedError: If admitting the session would exceed a configured limit.
+        """
+        error = self.admission_error()
+        if error:
+            self._rejected_count += 1
+            logger.warning(f"Rejecting realtime session: {error}")
+            raise SessionRejectedError(error)
+
+        runner = runner or PipelineRunner(handle_sigint=False)
+        session = asyncio.create_task(runner.run(task))
+        self._sessions.add(session)
+        try:
+            await session
+        finally:
+            self._sessions.discard(session)
+
+    async def _sample_task_handler(self):
+        while True:
+            await asyncio.sleep(self._params.sample_interval)
+            self.sample()
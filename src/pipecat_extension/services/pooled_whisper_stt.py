@@ -0,0 +1,462 @@
+"""Local Whisper transcription on CPU with one model and batched inference shared by all calls.
+
+pipecat's WhisperSTTService loads a model per call and WhisperSTTServiceMLX only runs on
+Apple Silicon. :class:`WhisperInferencePool` loads one int8-quantized CTranslate2 Whisper
+model (through faster-whisper) per process and transcribes the utterances of concurrent
+calls together; :class:`PooledWhisperSTTService` is the per-call service feeding it.
+"""
+
+import asyncio
+import io
+import os
+import time
+import wave
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import AsyncGenerator, Callable, List, Optional
+
+import numpy as np
+from loguru import logger
+
+from pipecat.frames.frames import (
+    AudioRawFrame,
+    ErrorFrame,
+    Frame,
+    InterimTranscriptionFrame,
+    MetricsFrame,
+    TranscriptionFrame,
+    UserStartedSpeakingFrame,
+    UserStoppedSpeakingFrame,
+    VADUserStoppedSpeakingFrame,
+)
+from pipecat.metrics.metrics import MetricsData
+from pipecat.processors.frame_processor import FrameDirection
+from pipecat.services.stt_service import SegmentedSTTService
+from pipecat.services.whisper.stt import Model, language_to_whisper_language
+from pipecat.transcriptions.language import Language
+from pipecat.utils.time import time_now_iso8601
+
+BatchTranscriber = Callable[[List[np.ndarray], Optional[str], List[str]], List[str]]
+
+# Whisper sees 30 seconds of 16 kHz audio at a time.
+_WHISPER_SAMPLES = 30 * 16000
+_WHISPER_MAX_LENGTH = 448
+
+
+def faster_whisper_batch_transcriber(
+    model: str | Model = Model.DISTIL_MEDIUM_EN,
+    *,
+    compute_type: str = "int8",
+    cpu_threads: int = 0,
+    no_speech_threshold: float = 0.4,
+) -> BatchTranscriber:
+    """Load a CTranslate2 Whisper model and return a function transcribing a batch.
+
+    ``WhisperModel.transcribe`` decodes one audio at a time. Here every utterance is cut
+    into 30-second windows, the windows of the whole batch are encoded together and
+    greedily decoded together, and windows judged to hold no speech are dropped, as
+    pipecat's WhisperSTTService does with ``no_speech_prob``. An utterance's prefix, text
+    already known to start its transcript, is forced into the decoder in one step so only
+    the rest is generated token by token; it is ignored for utterances over 30 seconds.
+    Given no language, a multilingual model detects the language of each window from its
+    encoder output, as ``WhisperModel.transcribe`` does.
+
+    Args:
+        model: Whisper model name, Hugging Face repo or path of a CTranslate2 conversion.
+        compute_type: CTranslate2 quantization. Defaults to int8.
+        cpu_threads: Threads CTranslate2 uses per batch. 0 uses its default.
+        no_speech_threshold: Windows with a higher no-speech probability are dropped.
+    """
+    from faster_whisper import WhisperModel
+    from faster_whisper.tokenizer import Tokenizer
+
+    whisper = WhisperModel(
+        model if isinstance(model, str) else model.value,
+        device="cpu",
+        compute_type=compute_type,
+        cpu_threads=cpu_threads,
+    )
+    frames = whisper.feature_extractor.nb_max_frames
+
+    def transcribe_batch(
+        audios: List[np.ndarray], language: Optional[str], prefixes: List[str]
+    ) -> List[str]:
+        owners, features, window_prefixes = [], [], []
+        for i, (audio, prefix) in enumerate(zip(audios, prefixes)):
+            if len(audio) > _WHISPER_SAMPLES:
+                prefix = ""
+            for start in range(0, max(len(audio), 1), _WHISPER_SAMPLES):
+                window = whisper.feature_extractor(audio[start : start + _WHISPER_SAMPLES])
+                window = window[:, :frames]
+                features.append(np.pad(window, ((0, 0), (0, frames - window.shape[1]))))
+                owners.append(i)
+                window_prefixes.append(prefix)
+
+        encoded = whisper.encode(np.stack(features).astype(np.float32))
+        if not whisper.model.is_multilingual:
+            languages = [None] * len(features)
+        elif language is None:
+            # Most likely language token of each window, e.g. "<|en|>".
+            detected = whisper.model.detect_language(encoded)
+            languages = [probabilities[0][0][2:-2] for probabilities in detected]
+        else:
+            languages = [language] * len(features)
+        tokenizers = {
+            code: Tokenizer(
+                whisper.hf_tokenizer,
+                whisper.model.is_multilingual,
+                task="transcribe",
+                language=code,
+            )
+            for code in set(languages)
+        }
+        prompts = [
+            whisper.get_prompt(
+                tokenizers[code], [], without_timestamps=True, prefix=prefix or None
+            )
+            for code, prefix in zip(languages, window_prefixes)
+        ]
+        results = whisper.model.generate(
+            encoded,
+            prompts,
+            beam_size=1,
+            max_length=_WHISPER_MAX_LENGTH,
+            return_no_speech_prob=True,
+            include_prompt_in_result=False,
+            suppress_blank=True,
+            suppress_tokens=[-1],
+        )
+
+        texts = [[] for _ in audios]
+        for owner, code, prefix, result in zip(owners, languages, window_prefixes, results):
+            if result.no_speech_prob < no_speech_threshold:
+                text = tokenizers[code].decode(result.sequences_ids[0]).strip()
+                texts[owner].append(f"{prefix} {text}".strip())
+        return [" ".join(t for t in text if t) for text in texts]
+
+    return transcribe_batch
+
+
+class WhisperInferencePool:
+    """One local Whisper model and a pool of threads running it, shared by many calls.
+
+    Utterances reaching the pool within ``batch_window_ms`` of each other, up to
+    ``max_batch_size``, are transcribed as one batch; utterances in different languages
+    run in separate batches. CTranslate2 releases the GIL while it runs, so the threads
+    run batches in parallel.
+    """
+
+    def __init__(
+        self,
+        *,
+        model: str | Model = Model.DISTIL_MEDIUM_EN,
+        compute_type: str = "int8",
+        max_workers: Optional[int] = None,
+        max_batch_size: int = 8,
+        batch_window_ms: float = 20.0,
+        transcribe_batch: Optional[BatchTranscriber] = None,
+    ):
+        """Initialize the pool.
+
+        Args:
+            model: Whisper model to load with faster-whisper. Defaults to distil-medium.en.
+            compute_type: CTranslate2 quantization. Defaults to int8.
+            max_workers: Number of batches transcribed at once. Defaults to 1; each batch
+                already uses all CPUs through CTranslate2's own threads.
+            max_batch_size: Maximum number of utterances transcribed together. Defaults to 8.
+            batch_window_ms: How long the first utterance of a batch waits for others.
+                Defaults to 20.
+            transcribe_batch: Function mapping a list of 16 kHz float32 utterances, a
+                Whisper language code (None to detect it) and each utterance's transcript
+                prefix to one transcript each, used instead of loading a faster-whisper
+                model.
+        """
+        self._transcribe_batch = transcribe_batch or faster_whisper_batch_transcriber(
+            model, compute_type=compute_type, cpu_threads=os.cpu_count() or 0
+        )
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers or 1, thread_name_prefix="whisper"
+        )
+        self._max_batch_size = max_batch_size
+        self._batch_window = batch_window_ms / 1000
+        self._requests: Optional[asyncio.Queue] = None
+        self._batch_task: Optional[asyncio.Task] = None
+
+    async def transcribe(
+        self, audio: np.ndarray, language: Optional[str] = None, prefix: str = ""
+    ) -> str:
+        """Transcribe one 16 kHz float32 utterance without blocking the event loop.
+
+        Args:
+            audio: The utterance.
+            language: Whisper language code, or None to let a multilingual model detect
+                it. English-only models ignore it.
+            prefix: Text the transcript is known to start with, e.g. from an earlier pass
+                over the start of the same utterance. The transcript returned includes it.
+        """
+        loop = asyncio.get_running_loop()
+        if not self._batch_task:
+            self._requests = asyncio.Queue()
+            self._batch_task = loop.create_task(self._batch_task_handler())
+        future = loop.create_future()
+        self._requests.put_nowait((audio, language, prefix, future))
+        return await future
+
+    def shutdown(self):
+        """Stop batching and the inference threads, dropping utterances not yet started."""
+        if self._batch_task:
+            self._batch_task.cancel()
+            self._batch_task = None
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    async def _batch_task_handler(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._requests.get()]
+            deadline = loop.time() + self._batch_window
+            while len(batch) < self._max_batch_size:
+                try:
+                    async with asyncio.timeout_at(deadline):
+                        batch.append(await self._requests.get())
+                except TimeoutError:
+                    break
+            by_language: dict[Optional[str], list] = {}
+            for audio, language, prefix, future in batch:
+                if not future.done():
+                    by_language.setdefault(language, []).append(((audio, prefix), future))
+            for language, requests in by_language.items():
+                run = loop.run_in_executor(
+                    self._executor,
+                    self._transcribe_batch,
+                    [audio for (audio, _), _ in requests],
+                    language,
+                    [prefix for (_, prefix), _ in requests],
+                )
+                run.add_done_callback(partial(_deliver_batch, requests))
+
+
+def _deliver_batch(batch: list, run: asyncio.Future):
+    futures = [future for _, future in batch if not future.done()]
+    if run.cancelled():
+        for future in futures:
+            future.cancel()
+    elif run.exception():
+        for future in futures:
+            future.set_exception(run.exception())
+    else:
+        for (_, future), result in zip(batch, run.result()):
+            if not future.done():
+                future.set_result(result)
+
+
+class RealTimeFactorMetricsData(MetricsData):
+    """Transcription speed of one utterance.
+
+    Parameters:
+        value: Real-time factor, the time to transcribe divided by the audio duration,
+            including the wait for a batch. Below 1 is faster than real time.
+        audio_secs: Duration of the utterance.
+        processing_secs: Time from the end of the utterance to its transcript.
+    """
+
+    value: float
+    audio_secs: float
+    processing_secs: float
+
+
+class PooledWhisperSTTService(SegmentedSTTService):
+    """Segmented STT service transcribing on a shared WhisperInferencePool.
+
+    Like WhisperSTTService, each utterance delimited by the VAD is transcribed once the
+    user stops speaking. After every utterance a MetricsFrame with its
+    :class:`RealTimeFactorMetricsData` is pushed, and ``last_real_time_factor`` holds the
+    same value.
+
+    With ``interim_interval_ms`` set, the utterance so far is also transcribed every that
+    many milliseconds of speech and pushed as an InterimTranscriptionFrame. The words two
+    consecutive passes agree on are taken as settled and given to the next pass, and to
+    the final one, as the transcript prefix, so the decoder only generates the words after
+    them. The final transcript is then mostly decoded by the time the user stops speaking.
+    Only one pass per call runs at a time; a pass still running when the next is due
+    delays it. When the VAD reports a pause within the turn, a pass over everything said
+    so far starts right away, replacing one still running, so the latest interim
+    transcript covers the whole turn while the turn analyzer decides whether it is over.
+    """
+
+    def __init__(
+        self,
+        pool: WhisperInferencePool,
+        *,
+        language: Language = Language.EN,
+        interim_interval_ms: Optional[float] = None,
+        **kwargs,
+    ):
+        """Initialize the service.
+
+        Args:
+            pool: The shared model.
+            language: The language of the call.
+            interim_interval_ms: Milliseconds of speech between interim transcriptions.
+                None only transcribes when the user stops speaking. Defaults to None.
+            **kwargs: Additional arguments passed to SegmentedSTTService.
+        """
+        super().__init__(**kwargs)
+        self._pool = pool
+        self._settings = {"language": language}
+        self._interim_interval_ms = interim_interval_ms
+        self._last_real_time_factor: Optional[float] = None
+        self._interim_task: Optional[asyncio.Task] = None
+        self._interim_buffer_size = 0
+        self._interim_text = ""
+        self._settled_text = ""
+
+    @property
+    def last_real_time_factor(self) -> Optional[float]:
+        """Real-time factor of the last utterance, or None before the first one."""
+        return self._last_real_time_factor
+
+    def can_generate_metrics(self) -> bool:
+        """Indicates whether this service can generate metrics.
+
+        Returns:
+            bool: True, as this service supports metric generation.
+        """
+        return True
+
+    def language_to_service_language(self, language: Language) -> Optional[str]:
+        """Convert from pipecat Language to Whisper language code."""
+        return language_to_whisper_language(language)
+
+    async def set_language(self, language: Language):
+        """Set the language for transcription.
+
+        Args:
+            language: The Language enum value to use for transcription.
+        """
+        logger.info(f"Switching STT language to: [{language}]")
+        self._settings["language"] = language
+
+    async def process_frame(self, frame: Frame, direction: FrameDirection):
+        """Process frames, starting an interim transcription when the user pauses."""
+        await super().process_frame(frame, direction)
+        if isinstance(frame, VADUserStoppedSpeakingFrame):
+            await self._handle_vad_user_stopped_speaking(frame)
+
+    async def process_audio_frame(self, frame: AudioRawFrame, direction: FrameDirection):
+        """Buffer the audio frame and start an interim transcription when one is due."""
+        await super().process_audio_frame(frame, direction)
+        if self._interim_interval_ms is None or not self._user_speaking or self._interim_task:
+            return
+        interval_size = int(self.sample_rate * self._interim_interval_ms / 1000) * 2
+        if len(self._audio_buffer) - self._interim_buffer_size >= interval_size:
+            self._interim_buffer_size = len(self._audio_buffer)
+            self._interim_task = self.create_task(
+                self._transcribe_interim(bytes(self._audio_buffer))
+            )
+
+    async def _handle_user_started_speaking(self, frame: UserStartedSpeakingFrame):
+        await super()._handle_user_started_speaking(frame)
+        if frame.emulated:
+            return
+        self._interim_buffer_size = len(self._audio_buffer)
+        self._interim_text = ""
+        self._settled_text = ""
+
+    async def _handle_user_stopped_speaking(self, frame: UserStoppedSpeakingFrame):
+        if self._interim_task and not frame.emulated:
+            await self.cancel_task(self._interim_task)
+            self._interim_task = None
+        await super()._handle_user_stopped_speaking(frame)
+
+    async def _handle_vad_user_stopped_speaking(self, frame: VADUserStoppedSpeakingFrame):
+        if self._interim_interval_ms is None or not self._user_speaking:
+            return
+        if self._interim_task:
+            await self.cancel_task(self._interim_task)
+        self._interim_buffer_size = len(self._audio_buffer)
+        self._interim_task = self.create_task(self._transcribe_interim(bytes(self._audio_buffer)))
+
+    async def _transcribe_interim(self, audio: bytes):
+        samples = np.frombuffer(audio, dtype=np.int16).astype(np.float32) / 32768.0
+        language = self._settings["language"]
+        try:
+            text = await self._pool.transcribe(
+                samples, self.language_to_service_language(language), self._settled_text
+            )
+        except Exception as e:
+            logger.warning(f"{self} error in interim transcription: {e}")
+            return
+        finally:
+            self._interim_task = None
+        self._settled_text = _common_words(self._interim_text, text) or self._settled_text
+        self._interim_text = text
+        if text:
+            await self.push_frame(
+                InterimTranscriptionFrame(text, self._user_id, time_now_iso8601(), language)
+            )
+
+    async def run_stt(self, audio: bytes) -> AsyncGenerator[Frame, None]:
+        """Transcribe one utterance on the pool.
+
+        Args:
+            audio: The utterance as a 16-bit mono WAV file, as SegmentedSTTService
+                provides it.
+
+        Yields:
+            Frame: A TranscriptionFrame if anything was said, then a MetricsFrame with the
+                real-time factor; or an ErrorFrame if transcription fails.
+        """
+        with wave.open(io.BytesIO(audio), "rb") as wav:
+            sample_rate = wav.getframerate()
+            pcm = wav.readframes(wav.getnframes())
+        samples = np.frombuffer(pcm, dtype=np.int16).astype(np.float32) / 32768.0
+        if sample_rate != 16000:
+            yield ErrorFrame(f"Whisper needs 16 kHz audio (sample rate: {sample_rate})")
+            return
+
+        await self.start_processing_metrics()
+        await self.start_ttfb_metrics()
+        start = time.perf_counter()
+        language = self._settings["language"]
+        try:
+            text = await self._pool.transcribe(
+                samples, self.language_to_service_language(language), self._settled_text
+            )
+        except Exception as e:
+            logger.error(f"{self} error transcribing audio: {e}")
+            yield ErrorFrame(f"Error transcribing audio: {e}")
+            return
+        processing_secs = time.perf_counter() - start
+        await self.stop_ttfb_metrics()
+        await self.stop_processing_metrics()
+
+        audio_secs = len(samples) / sample_rate
+        self._last_real_time_factor = processing_secs / audio_secs if audio_secs else 0.0
+        logger.debug(
+            f"{self}: transcribed {audio_secs:.2f}s in {processing_secs:.2f}s "
+            f"(RTF {self._last_real_time_factor:.3f})"
+        )
+
+        if text:
+            logger.debug(f"Transcription: [{text}]")
+            yield TranscriptionFrame(text, self._user_id, time_now_iso8601(), language)
+        yield MetricsFrame(
+            data=[
+                RealTimeFactorMetricsData(
+                    processor=self.name,
+                    value=self._last_real_time_factor,
+                    audio_secs=audio_secs,
+                    processing_secs=processing_secs,
+                )
+            ]
+        )
+
+
+def _common_words(a: str, b: str) -> str:
+    """Longest run of whole words both transcripts start with."""
+    common = []
+    for word_a, word_b in zip(a.split(), b.split()):
+        if word_a != word_b:
+            break
+        common.append(word_a)
+    return " ".join(common)
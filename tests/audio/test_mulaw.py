@@ -0,0 +1,31 @@
+import numpy as np
+import pytest
+
+from pipecat_extension.audio.mulaw import ulaw_decode, ulaw_encode
+
+audioop = pytest.importorskip("audioop")
+
+
+class TestMulaw:
+    """Unit tests for the μ-law lookup-table codec."""
+
+    def test_decode_matches_audioop(self):
+        """Test that every μ-law byte decodes to the same sample as audioop."""
+        data = bytes(range(256))
+
+        assert ulaw_decode(data).tobytes() == audioop.ulaw2lin(data, 2)
+
+    def test_encode_matches_audioop(self):
+        """Test that every 16-bit sample encodes to the same byte as audioop."""
+        samples = np.arange(-32768, 32768, dtype=np.int16)
+
+        assert ulaw_encode(samples).tobytes() == audioop.lin2ulaw(samples.tobytes(), 2)
+
+    def test_accepts_bytes_and_arrays(self):
+        """Test that bytes and arrays give the same result."""
+        samples = np.array([0, 1000, -1000, 32767], dtype=np.int16)
+
+        encoded = ulaw_encode(samples.tobytes())
+
+        assert np.array_equal(encoded, ulaw_encode(samples))
+        assert np.array_equal(ulaw_decode(encoded), ulaw_decode(encoded.tobytes()))
@@ -0,0 +1,89 @@
+import pytest
+from pipecat.frames.frames import BotStoppedSpeakingFrame, OutputAudioRawFrame
+from pipecat.observers.base_observer import FramePushed
+from pipecat.processors.frame_processor import FrameDirection, FrameProcessor
+
+from pipecat_extension.audio.output_pacing import AudioPacingObserver
+
+CHUNK = b"\x00\x00" * 320  # 40 ms at 8 kHz
+
+
+def pushed(source, frame, secs: float) -> FramePushed:
+    return FramePushed(
+        source=source,
+        destination=None,
+        frame=frame,
+        direction=FrameDirection.DOWNSTREAM,
+        timestamp=int(secs * 1e9),
+    )
+
+
+async def send(observer: AudioPacingObserver, output, times: list[float]):
+    for secs in times:
+        await observer.on_push_frame(pushed(output, OutputAudioRawFrame(CHUNK, 8000, 1), secs))
+
+
+class TestAudioPacingObserver:
+    """Unit tests for AudioPacingObserver."""
+
+    @pytest.mark.asyncio
+    async def test_even_pacing_has_no_underruns(self):
+        """Test that chunks sent at the playback rate give no underruns or jitter."""
+        output = FrameProcessor()
+        observer = AudioPacingObserver(output)
+
+        await send(observer, output, [0.0, 0.04, 0.08, 0.12])
+
+        stats = observer.stats
+        assert (stats.chunks, stats.underruns) == (4, 0)
+        assert stats.audio_secs == pytest.approx(0.16)
+        assert stats.jitter_secs == pytest.approx(0.0, abs=1e-9)
+        assert stats.max_interval_secs == pytest.approx(0.04)
+
+    @pytest.mark.asyncio
+    async def test_counts_late_chunks_as_underruns(self):
+        """Test that a chunk sent after the buffered audio ran out is an underrun."""
+        output = FrameProcessor()
+        observer = AudioPacingObserver(output, prebuffer_ms=0)
+
+        await send(observer, output, [0.0, 0.04, 0.2, 0.24])
+
+        stats = observer.stats
+        assert stats.underruns == 1
+        assert stats.underrun_secs == pytest.approx(0.12)
+        assert stats.max_interval_secs == pytest.approx(0.16)
+        assert stats.jitter_secs > 0
+
+    @pytest.mark.asyncio
+    async def test_prebuffer_absorbs_late_chunks(self):
+        """Test that audio buffered before playback covers a late chunk."""
+        output = FrameProcessor()
+        observer = AudioPacingObserver(output, prebuffer_ms=200)
+
+        await send(observer, output, [0.0, 0.04, 0.2, 0.24])
+
+        assert observer.stats.underruns == 0
+
+    @pytest.mark.asyncio
+    async def test_gap_between_utterances_is_not_an_underrun(self):
+        """Test that silence after the bot stopped speaking is not counted."""
+        output = FrameProcessor()
+        observer = AudioPacingObserver(output)
+
+        await send(observer, output, [0.0, 0.04])
+        await observer.on_push_frame(pushed(output, BotStoppedSpeakingFrame(), 0.5))
+        await send(observer, output, [2.0, 2.04])
+
+        stats = observer.stats
+        assert (stats.chunks, stats.underruns) == (4, 0)
+        assert stats.max_interval_secs == pytest.approx(0.04)
+
+    @pytest.mark.asyncio
+    async def test_ignores_frames_from_other_processors(self):
+        """Test that only audio passed on by the output transport is measured."""
+        output = FrameProcessor()
+        observer = AudioPacingObserver(output)
+
+        await send(observer, FrameProcessor(), [0.0, 1.0])
+
+        assert observer.stats.chunks == 0
@@ -0,0 +1,115 @@
+import numpy as np
+import pytest
+
+from pipecat_extension.audio.polyphase_resampler import PolyphaseResampler, resample_many
+from pipecat_extension.audio.telephony_codec import pcm_to_ulaw_many, ulaw_to_pcm_many
+
+RATE_PAIRS = [(8000, 16000), (16000, 8000), (8000, 24000), (24000, 8000), (16000, 24000)]
+
+
+def tone(frequency: float, rate: int, seconds: float = 0.5) -> np.ndarray:
+    t = np.arange(int(rate * seconds)) / rate
+    return (np.sin(2 * np.pi * frequency * t) * 10000).astype(np.int16)
+
+
+def level_db(output: np.ndarray, reference: np.ndarray) -> float:
+    def rms(x):
+        return np.sqrt(np.mean(x[len(x) // 4 :].astype(np.float64) ** 2))
+
+    return 20 * np.log10(rms(output) / rms(reference) + 1e-12)
+
+
+def stream(resampler: PolyphaseResampler, samples, in_rate, out_rate, chunk):
+    return np.concatenate(
+        [
+            resampler.resample_samples(samples[i : i + chunk], in_rate, out_rate)
+            for i in range(0, len(samples), chunk)
+        ]
+    )
+
+
+class TestPolyphaseResampler:
+    """Unit tests for PolyphaseResampler."""
+
+    @pytest.mark.parametrize("in_rate,out_rate", RATE_PAIRS)
+    def test_output_length_and_passband(self, in_rate, out_rate):
+        """Test that 20 ms chunks give the right length and keep a 1 kHz tone's level."""
+        samples = tone(1000, in_rate)
+
+        output = stream(PolyphaseResampler(), samples, in_rate, out_rate, in_rate // 50)
+
+        assert len(output) == len(samples) * out_rate // in_rate
+        assert abs(level_db(output, samples)) < 0.1
+
+    def test_rejects_aliasing_tone(self):
+        """Test that a tone above the 8 kHz Nyquist frequency is removed when downsampling."""
+        samples = tone(6000, 24000)
+
+        output = stream(PolyphaseResampler(), samples, 24000, 8000, 480)
+
+        assert level_db(output, samples) < -60
+
+    def test_chunking_does_not_change_output(self):
+        """Test that the stream state makes the output independent of chunk boundaries."""
+        samples = tone(440, 8000)
+
+        whole = PolyphaseResampler().resample_samples(samples, 8000, 24000)
+        chunked = stream(PolyphaseResampler(), samples, 8000, 24000, 37)
+
+        # Equal up to float rounding of the different matrix products.
+        assert np.abs(whole.astype(np.int32) - chunked).max() <= 1
+
+    @pytest.mark.asyncio
+    async def test_resample_bytes(self):
+        """Test that the BaseAudioResampler interface converts raw bytes."""
+        samples = tone(440, 16000, 0.02)
+
+        output = await PolyphaseResampler().resample(samples.tobytes(), 16000, 8000)
+
+        assert len(output) == len(samples)
+
+    def test_rejects_different_rates(self):
+        """Test that a resampler cannot be reused with different rates."""
+        resampler = PolyphaseResampler()
+        resampler.resample_samples(tone(440, 8000, 0.02), 8000, 16000)
+
+        with pytest.raises(ValueError):
+            resampler.resample_samples(tone(440, 8000, 0.02), 8000, 24000)
+
+
+class TestBulkResampling:
+    """Unit tests for converting many calls at once."""
+
+    def test_resample_many_matches_per_call(self):
+        """Test that bulk resampling gives each call the same audio as its own resampler."""
+        calls = [tone(300 + 100 * i, 8000) for i in range(4)]
+        calls[3] = calls[3][:-37]  # a call out of step with the others
+        single = [stream(PolyphaseResampler(), c, 8000, 16000, 160) for c in calls]
+
+        resamplers = [PolyphaseResampler() for _ in calls]
+        bulk = [[] for _ in calls]
+        for start in range(0, len(calls[0]), 160):
+            chunks = [c[start : start + 160] for c in calls]
+            for output, chunk in zip(bulk, resample_many(resamplers, chunks, 8000, 16000)):
+                output.append(chunk)
+
+        for expected, output in zip(single, bulk):
+            assert np.abs(expected.astype(np.int32) - np.concatenate(output)).max() <= 1
+
+    def test_ulaw_round_trip_many(self):
+        """Test that μ-law packets of several calls decode and encode back in order."""
+        payloads = [bytes([i]) * 160 for i in (0x10, 0x90, 0xFF)]
+
+        pcm = ulaw_to_pcm_many(payloads, 8000, 8000, [PolyphaseResampler() for _ in payloads])
+        encoded = pcm_to_ulaw_many(pcm, 8000, 8000, [PolyphaseResampler() for _ in payloads])
+
+        assert [len(p) for p in pcm] == [320] * 3
+        assert encoded == payloads
+
+    def test_ulaw_to_pcm_many_resamples(self):
+        """Test that decoded packets are resampled with each call's resampler."""
+        payloads = [b"\x10" * 160, b"\x90" * 80]
+
+        pcm = ulaw_to_pcm_many(payloads, 8000, 16000, [PolyphaseResampler() for _ in payloads])
+
+        assert [len(p) for p in pcm] == [640, 320]
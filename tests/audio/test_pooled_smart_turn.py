@@ -0,0 +1,147 @@
+import asyncio
+import threading
+
+import pytest
+from pipecat.audio.turn.base_turn_analyzer import EndOfTurnState
+
+from pipecat_extension.audio.turn.pooled_smart_turn import (
+    PooledSmartTurnAnalyzer,
+    PooledSmartTurnParams,
+    SmartTurnInferencePool,
+)
+
+# 20 ms of 16 kHz, 16-bit mono audio.
+CHUNK = b"\x00\x01" * 320
+
+
+def make_pool(predictions: list[int], gate: threading.Event = None) -> SmartTurnInferencePool:
+    def predict(audio):
+        if gate:
+            gate.wait()
+        prediction = predictions.pop(0)
+        return {"prediction": prediction, "probability": float(prediction)}
+
+    return SmartTurnInferencePool(max_workers=1, predict=predict)
+
+
+def make_analyzer(pool: SmartTurnInferencePool, interval_ms=40) -> PooledSmartTurnAnalyzer:
+    analyzer = PooledSmartTurnAnalyzer(
+        pool, params=PooledSmartTurnParams(stop_secs=3, reevaluation_interval_ms=interval_ms)
+    )
+    analyzer.set_sample_rate(16000)
+    return analyzer
+
+
+async def wait_for_evaluation(analyzer: PooledSmartTurnAnalyzer):
+    while analyzer._evaluation:
+        await asyncio.sleep(0.001)
+
+
+class TestPooledSmartTurnAnalyzer:
+    """Unit tests for PooledSmartTurnAnalyzer."""
+
+    @pytest.mark.asyncio
+    async def test_complete_turn(self):
+        """Test that a complete prediction ends the turn."""
+        analyzer = make_analyzer(make_pool([1]))
+        analyzer.append_audio(CHUNK, True)
+
+        state, metrics = await analyzer.analyze_end_of_turn()
+
+        assert state == EndOfTurnState.COMPLETE
+        assert metrics.is_complete
+        assert not analyzer.speech_triggered
+
+    @pytest.mark.asyncio
+    async def test_reevaluates_incomplete_turn_during_silence(self):
+        """Test that an incomplete turn is re-evaluated on the cadence and completes later."""
+        analyzer = make_analyzer(make_pool([0, 1]))
+        analyzer.append_audio(CHUNK, True)
+        state, _ = await analyzer.analyze_end_of_turn()
+        assert state == EndOfTurnState.INCOMPLETE
+
+        assert analyzer.append_audio(CHUNK, False) == EndOfTurnState.INCOMPLETE
+        assert analyzer._evaluation is None
+        assert analyzer.append_audio(CHUNK, False) == EndOfTurnState.INCOMPLETE
+        assert analyzer._evaluation is not None
+        await wait_for_evaluation(analyzer)
+
+        assert analyzer.append_audio(CHUNK, False) == EndOfTurnState.COMPLETE
+        assert not analyzer.speech_triggered
+
+    @pytest.mark.asyncio
+    async def test_new_speech_cancels_pending_evaluation(self):
+        """Test that a re-evaluation started before new speech is discarded."""
+        gate = threading.Event()
+        analyzer = make_analyzer(make_pool([0, 1], gate), interval_ms=20)
+        analyzer.append_audio(CHUNK, True)
+        gate.set()
+        await analyzer.analyze_end_of_turn()
+
+        gate.clear()
+        analyzer.append_audio(CHUNK, False)
+        stale = analyzer._evaluation
+        assert stale is not None
+        analyzer.append_audio(CHUNK, True)
+        gate.set()
+
+        await asyncio.sleep(0.01)
+
+        assert stale.cancelled()
+        assert analyzer.append_audio(CHUNK, False) == EndOfTurnState.INCOMPLETE
+
+    @pytest.mark.asyncio
+    async def test_no_reevaluation_without_interval(self):
+        """Test that re-evaluation can be disabled."""
+        analyzer = make_analyzer(make_pool([0]), interval_ms=None)
+        analyzer.append_audio(CHUNK, True)
+        await analyzer.analyze_end_of_turn()
+
+        for _ in range(10):
+            analyzer.append_audio(CHUNK, False)
+
+        assert analyzer._evaluation is None
+
+    @pytest.mark.asyncio
+    async def test_turn_audio_is_bounded(self):
+        """Test that a long turn keeps at most max_duration_secs of audio."""
+        segments = []
+
+        def predict(audio):
+            segments.append(len(audio))
+            return {"prediction": 1, "probability": 1.0}
+
+        pool = SmartTurnInferencePool(max_workers=1, predict=predict)
+        analyzer = PooledSmartTurnAnalyzer(
+            pool, params=PooledSmartTurnParams(max_duration_secs=1, pre_speech_ms=100)
+        )
+        analyzer.set_sample_rate(16000)
+        for _ in range(200):  # 4 seconds of speech
+            analyzer.append_audio(CHUNK, True)
+
+        state, metrics = await analyzer.analyze_end_of_turn()
+
+        assert state == EndOfTurnState.COMPLETE
+        assert segments == [16000]
+        assert metrics.segment_ms == 1000
+        assert metrics.audio_buffer_bytes == analyzer.audio_buffer_bytes == 2 * 16000 * 4
+
+    @pytest.mark.asyncio
+    async def test_segment_starts_before_speech(self):
+        """Test that the evaluated segment includes pre_speech_ms of audio before speech."""
+        segments = []
+
+        def predict(audio):
+            segments.append(len(audio))
+            return {"prediction": 1, "probability": 1.0}
+
+        pool = SmartTurnInferencePool(max_workers=1, predict=predict)
+        analyzer = PooledSmartTurnAnalyzer(pool, params=PooledSmartTurnParams(pre_speech_ms=40))
+        analyzer.set_sample_rate(16000)
+        for _ in range(10):
+            analyzer.append_audio(CHUNK, False)
+        analyzer.append_audio(CHUNK, True)
+
+        await analyzer.analyze_end_of_turn()
+
+        assert segments == [3 * 320]
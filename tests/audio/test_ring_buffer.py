@@ -0,0 +1,50 @@
+import numpy as np
+import pytest
+
+from pipecat_extension.audio.ring_buffer import AudioRingBuffer
+
+
+class TestAudioRingBuffer:
+    """Unit tests for AudioRingBuffer."""
+
+    def test_keeps_most_recent_samples(self):
+        """Test that views return the newest samples in order across wraparounds."""
+        ring = AudioRingBuffer(5)
+        stream = np.arange(23, dtype=np.float32)
+
+        for start in range(0, len(stream), 3):
+            ring.append(stream[start : start + 3])
+
+        assert len(ring) == 5
+        assert ring.total_written == 23
+        np.testing.assert_array_equal(ring.view(), stream[-5:])
+        np.testing.assert_array_equal(ring.view(2), stream[-2:])
+
+    def test_views_are_zero_copy_and_read_only(self):
+        """Test that views share the buffer's memory and cannot be written."""
+        ring = AudioRingBuffer(4)
+        ring.append(np.ones(3, dtype=np.float32))
+
+        view = ring.view()
+
+        assert np.shares_memory(view, ring._data)
+        with pytest.raises(ValueError):
+            view[0] = 2
+
+    def test_chunk_larger_than_capacity(self):
+        """Test that only the tail of an oversized chunk is kept."""
+        ring = AudioRingBuffer(4)
+        ring.append(np.arange(10, dtype=np.float32))
+
+        np.testing.assert_array_equal(ring.view(), [6, 7, 8, 9])
+
+    def test_clear(self):
+        """Test that clearing drops samples but keeps the allocation."""
+        ring = AudioRingBuffer(4)
+        ring.append(np.arange(3, dtype=np.float32))
+
+        ring.clear()
+
+        assert len(ring) == 0
+        assert ring.view().size == 0
+        assert ring.nbytes == 8 * 4
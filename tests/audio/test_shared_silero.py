@@ -0,0 +1,58 @@
+import asyncio
+
+import numpy as np
+import pytest
+from pipecat.audio.vad.silero import SileroVADAnalyzer
+
+from pipecat_extension.audio.vad.shared_silero import SharedSileroVADAnalyzer, SileroVADPool
+
+
+@pytest.fixture
+def pool():
+    pool = SileroVADPool(max_workers=1)
+    yield pool
+    pool.shutdown()
+
+
+def make_audio() -> list[bytes]:
+    """Half a second of noise, then a second of a loud tone, in 20 ms chunks at 16 kHz."""
+    rng = np.random.default_rng(0)
+    tone = np.sin(np.arange(16000) * 0.05) * 8000
+    audio = np.concatenate([rng.standard_normal(8000) * 50, tone]).astype(np.int16)
+    return [audio[i : i + 320].tobytes() for i in range(0, len(audio), 320)]
+
+
+async def run(analyzer, chunks: list[bytes]) -> list:
+    analyzer.set_sample_rate(16000)
+    return [await analyzer.analyze_audio(chunk) for chunk in chunks]
+
+
+class TestSharedSileroVADAnalyzer:
+    """Unit tests for SharedSileroVADAnalyzer."""
+
+    @pytest.mark.asyncio
+    async def test_matches_silero_vad_analyzer(self, pool):
+        """Test that VAD states match a SileroVADAnalyzer with its own model."""
+        chunks = make_audio()
+
+        expected = await run(SileroVADAnalyzer(), chunks)
+        states = await run(SharedSileroVADAnalyzer(pool), chunks)
+
+        assert states == expected
+
+    @pytest.mark.asyncio
+    async def test_batches_concurrent_calls(self, pool):
+        """Test that windows from concurrent calls run together with independent state."""
+        chunks = make_audio()
+        analyzers = [SharedSileroVADAnalyzer(pool) for _ in range(8)]
+
+        results = await asyncio.gather(*(run(analyzer, chunks) for analyzer in analyzers))
+
+        assert all(states == results[0] for states in results)
+        assert pool.average_batch_size > 1
+        assert all(analyzer.max_latency_ms > 0 for analyzer in analyzers)
+
+    def test_rejects_unsupported_sample_rate(self, pool):
+        """Test that only 8 and 16 kHz are accepted."""
+        with pytest.raises(ValueError):
+            SharedSileroVADAnalyzer(pool).set_sample_rate(24000)
@@ -0,0 +1,168 @@
+import asyncio
+
+import pytest
+from pipecat.frames.frames import LLMContextAssistantTimestampFrame
+from pipecat.processors.aggregators.llm_context import LLMContext
+from pipecat.tests.utils import SleepFrame, run_test
+
+from pipecat_extension.context.compaction import (
+    ContextCompactionParams,
+    ContextCompactor,
+    form_state_digest,
+)
+
+SYSTEM = {"role": "system", "content": "You are a form-filling assistant."}
+DIGEST = {"role": "user", "content": "<system>digest</system>"}
+PARAMS = ContextCompactionParams(max_turns=4, keep_turns=2)
+
+
+def conversation(turns: int) -> list:
+    messages = [SYSTEM]
+    for turn in range(turns):
+        messages.append({"role": "user", "content": f"user {turn}"})
+        messages.append({"role": "assistant", "content": f"assistant {turn}"})
+    return messages
+
+
+def timestamp_frame() -> LLMContextAssistantTimestampFrame:
+    return LLMContextAssistantTimestampFrame(timestamp="2026-01-01T00:00:00Z")
+
+
+class TestFormStateDigest:
+    """Unit tests for form_state_digest."""
+
+    @pytest.mark.asyncio
+    async def test_lists_only_answered_questions(self):
+        """Test that the digest lists the answered questions with escaped values."""
+        questionnaire = {
+            "1.1": {"question_text": "Name?", "answer": "Ann <Lee>"},
+            "1.2": {"question_text": "Email?", "answer": None},
+        }
+        message = await form_state_digest(questionnaire)([])
+        assert message["role"] == "user"
+        assert "<question_id>1.1</question_id><value>Ann &lt;Lee&gt;</value>" in message["content"]
+        assert "1.2" not in message["content"]
+
+    @pytest.mark.asyncio
+    async def test_reads_latest_answers(self):
+        """Test that the digest reflects answers recorded after it was created."""
+        questionnaire = {"1.1": {"question_text": "Name?", "answer": None}}
+        digest = form_state_digest(questionnaire)
+        questionnaire["1.1"]["answer"] = "Ann"
+        message = await digest([])
+        assert "<value>Ann</value>" in message["content"]
+
+
+class TestContextCompactor:
+    """Unit tests for ContextCompactor."""
+
+    @pytest.mark.asyncio
+    async def test_keeps_context_within_max_turns(self):
+        """Test that the context is left alone while it holds at most max_turns turns."""
+        context = LLMContext(messages=conversation(4))
+        compactor = ContextCompactor(context, form_state_digest({}), params=PARAMS)
+        await run_test(
+            compactor,
+            frames_to_send=[timestamp_frame(), SleepFrame(0.05)],
+            expected_down_frames=[LLMContextAssistantTimestampFrame],
+        )
+        assert context.messages == conversation(4)
+        assert compactor.compactions == 0
+
+    @pytest.mark.asyncio
+    async def test_folds_old_turns_into_digest(self):
+        """Test that older turns are replaced by the digest between prefix and recent turns."""
+        messages = conversation(5)
+        context = LLMContext(messages=list(messages))
+        folded = []
+
+        async def digest(messages):
+            folded.extend(messages)
+            return DIGEST
+
+        compactor = ContextCompactor(context, digest, params=PARAMS)
+        await run_test(
+            compactor,
+            frames_to_send=[timestamp_frame(), SleepFrame(0.05)],
+            expected_down_frames=[LLMContextAssistantTimestampFrame],
+        )
+        assert folded == messages[1:7]
+        assert context.messages == [SYSTEM, DIGEST, *messages[7:]]
+        assert compactor.compactions == 1
+        assert compactor.folded_messages == 6
+
+    @pytest.mark.asyncio
+    async def test_keeps_function_calls_with_their_turn(self):
+        """Test that folding starts at a user message, never between a call and its result."""
+        call = {
+            "role": "assistant",
+            "tool_calls": [{"id": "c1", "type": "function", "function": {"name": "f"}}],
+        }
+        result = {"role": "tool", "tool_call_id": "c1", "content": "ok"}
+        messages = conversation(3) + [{"role": "user", "content": "user 3"}, call, result]
+        messages += conversation(2)[1:]
+        context = LLMContext(messages=list(messages))
+
+        compactor = ContextCompactor(context, form_state_digest({}), params=PARAMS)
+        await run_test(
+            compactor,
+            frames_to_send=[timestamp_frame(), SleepFrame(0.05)],
+            expected_down_frames=[LLMContextAssistantTimestampFrame],
+        )
+        remaining = context.messages[2:]
+        assert remaining[0]["role"] == "user"
+        assert (call in remaining) == (result in remaining)
+
+    @pytest.mark.asyncio
+    async def test_does_not_count_digest_as_turn(self):
+        """Test that a previous digest is folded again but not counted as a turn."""
+        context = LLMContext(messages=[SYSTEM, DIGEST, *conversation(4)[1:]])
+        compactor = ContextCompactor(context, form_state_digest({}), params=PARAMS)
+        compactor._digest_message = DIGEST
+        await run_test(
+            compactor,
+            frames_to_send=[timestamp_frame(), SleepFrame(0.05)],
+            expected_down_frames=[LLMContextAssistantTimestampFrame],
+        )
+        assert compactor.compactions == 0
+
+    @pytest.mark.asyncio
+    async def test_skips_digest_when_context_changed(self):
+        """Test that a digest is discarded if the folded messages changed meanwhile."""
+        context = LLMContext(messages=conversation(5))
+
+        async def digest(messages):
+            context.set_messages(conversation(1))
+            await asyncio.sleep(0)
+            return DIGEST
+
+        compactor = ContextCompactor(context, digest, params=PARAMS)
+        await run_test(
+            compactor,
+            frames_to_send=[timestamp_frame(), SleepFrame(0.05)],
+            expected_down_frames=[LLMContextAssistantTimestampFrame],
+        )
+        assert context.messages == conversation(1)
+        assert compactor.compactions == 0
+
+    @pytest.mark.asyncio
+    async def test_digest_failure_leaves_context(self):
+        """Test that a failing digest leaves the context unchanged and compaction can retry."""
+        context = LLMContext(messages=conversation(5))
+        calls = 0
+
+        async def digest(messages):
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                raise RuntimeError("boom")
+            return DIGEST
+
+        compactor = ContextCompactor(context, digest, params=PARAMS)
+        await run_test(
+            compactor,
+            frames_to_send=[timestamp_frame(), SleepFrame(0.05), timestamp_frame(), SleepFrame(0.05)],
+            expected_down_frames=[LLMContextAssistantTimestampFrame] * 2,
+        )
+        assert calls == 2
+        assert compactor.compactions == 1
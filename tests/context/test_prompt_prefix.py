@@ -0,0 +1,114 @@
+import pytest
+from pipecat.adapters.schemas.function_schema import FunctionSchema
+from pipecat.adapters.schemas.tools_schema import ToolsSchema
+from pipecat.frames.frames import MetricsFrame
+from pipecat.metrics.metrics import LLMTokenUsage, LLMUsageMetricsData
+from pipecat.observers.base_observer import FramePushed
+
+from pipecat_extension.context.prompt_prefix import (
+    PromptCacheObserver,
+    StaticPromptPrefix,
+    render_form,
+)
+
+QUESTIONNAIRE = {
+    "1.1": {"question_text": "What is the callers name?", "spelling_sensitive": False},
+    "1.2": {"question_text": "What is the callers <email>?", "spelling_sensitive": True},
+}
+
+TOOLS = ToolsSchema(
+    standard_tools=[
+        FunctionSchema(name="set_answer", description="Set an answer.", properties={}, required=[])
+    ]
+)
+
+
+def usage_frame(prompt_tokens: int, cached_tokens: int) -> MetricsFrame:
+    usage = LLMTokenUsage(
+        prompt_tokens=prompt_tokens,
+        completion_tokens=10,
+        total_tokens=prompt_tokens + 10,
+        cache_read_input_tokens=cached_tokens,
+    )
+    return MetricsFrame(data=[LLMUsageMetricsData(processor="llm", value=usage)])
+
+
+def pushed(frame) -> FramePushed:
+    return FramePushed(source=None, destination=None, frame=frame, direction=None, timestamp=0)
+
+
+class TestRenderForm:
+    """Unit tests for render_form."""
+
+    def test_renders_questions_in_order(self):
+        """Test that each question becomes one escaped <question> line."""
+        assert render_form(QUESTIONNAIRE) == (
+            "# Form\n"
+            "<form>\n"
+            "<question><question_id>1.1</question_id><question_text>What is the callers name?"
+            "</question_text><spelling_sensitive>false</spelling_sensitive></question>\n"
+            "<question><question_id>1.2</question_id><question_text>What is the callers "
+            "&lt;email&gt;?</question_text><spelling_sensitive>true</spelling_sensitive>"
+            "</question>\n"
+            "</form>"
+        )
+
+    def test_ignores_answers(self):
+        """Test that answers given during a call do not change the form section."""
+        answered = {
+            question_id: {**question, "answer": "James"}
+            for question_id, question in QUESTIONNAIRE.items()
+        }
+
+        assert render_form(answered) == render_form(QUESTIONNAIRE)
+
+
+class TestStaticPromptPrefix:
+    """Unit tests for StaticPromptPrefix."""
+
+    def test_contexts_share_the_prefix(self):
+        """Test that every context starts with the same system message and tools."""
+        prefix = StaticPromptPrefix(["# Role", render_form(QUESTIONNAIRE)], tools=TOOLS)
+        user = {"role": "user", "content": "hello"}
+
+        first = prefix.create_context([user])
+        second = prefix.create_context()
+
+        assert first.messages[0] == second.messages[0] == prefix.system_message()
+        assert first.messages[1:] == [user]
+        assert first.tools is second.tools is TOOLS
+
+    def test_contexts_cannot_change_the_prefix(self):
+        """Test that editing one call's system message leaves the prefix unchanged."""
+        prefix = StaticPromptPrefix(["# Role"])
+
+        prefix.create_context().messages[0]["content"][0]["text"] = "changed"
+
+        assert prefix.system_message()["content"][0]["text"] == "# Role"
+
+    def test_cache_key_follows_content(self):
+        """Test that the cache key is stable for the same prompt and changes with it."""
+        key = StaticPromptPrefix(["# Role"], tools=TOOLS).cache_key
+
+        assert StaticPromptPrefix(["# Role"], tools=TOOLS).cache_key == key
+        assert StaticPromptPrefix(["# Role!"], tools=TOOLS).cache_key != key
+        assert StaticPromptPrefix(["# Role"]).cache_key != key
+
+
+class TestPromptCacheObserver:
+    """Unit tests for PromptCacheObserver."""
+
+    @pytest.mark.asyncio
+    async def test_records_cached_tokens_per_turn(self):
+        """Test that each usage report is recorded once, however many hops it makes."""
+        observer = PromptCacheObserver()
+        first, second = usage_frame(1500, 0), usage_frame(1600, 1408)
+
+        for frame in (first, first, second, second):
+            await observer.on_push_frame(pushed(frame))
+
+        assert [(t.prompt_tokens, t.cached_tokens) for t in observer.turns] == [
+            (1500, 0),
+            (1600, 1408),
+        ]
+        assert observer.hit_ratio == pytest.approx(1408 / 3100)
@@ -0,0 +1,258 @@
+import asyncio
+
+import pytest
+from pipecat.frames.frames import (
+    InterimTranscriptionFrame,
+    InterruptionFrame,
+    LLMContextFrame,
+    LLMFullResponseEndFrame,
+    LLMFullResponseStartFrame,
+    LLMTextFrame,
+    TranscriptionFrame,
+    UserStartedSpeakingFrame,
+    UserStoppedSpeakingFrame,
+    VADUserStartedSpeakingFrame,
+    VADUserStoppedSpeakingFrame,
+)
+from pipecat.pipeline.pipeline import Pipeline
+from pipecat.processors.aggregators.llm_context import LLMContext
+from pipecat.processors.aggregators.llm_response import LLMUserAggregatorParams
+from pipecat.processors.aggregators.llm_response_universal import LLMUserAggregator
+from pipecat.processors.frame_processor import FrameProcessor
+from pipecat.tests.utils import SleepFrame, run_test
+
+from pipecat_extension.processors.speculative_llm import SpeculativeLLM
+
+SYSTEM = {"role": "system", "content": "You are a form-filling assistant."}
+PAUSE = [VADUserStoppedSpeakingFrame(), InterimTranscriptionFrame("my name is ann", "", "")]
+RESPONSE = [LLMFullResponseStartFrame, LLMTextFrame, LLMFullResponseEndFrame]
+
+
+class FakeLLM(FrameProcessor):
+    """Replies to the last user message of every context it receives."""
+
+    def __init__(self, delay: float = 0.0):
+        super().__init__()
+        self.delay = delay
+        self.prompts = []
+
+    async def process_frame(self, frame, direction):
+        await super().process_frame(frame, direction)
+        if not isinstance(frame, LLMContextFrame):
+            await self.push_frame(frame, direction)
+            return
+        prompt = frame.context.messages[-1]["content"]
+        self.prompts.append(prompt)
+        await self.push_frame(LLMFullResponseStartFrame())
+        await asyncio.sleep(self.delay)
+        await self.push_frame(LLMTextFrame(f"reply to {prompt}"))
+        await self.push_frame(LLMFullResponseEndFrame())
+
+
+def pipeline(
+    speculation: SpeculativeLLM,
+    context: LLMContext,
+    llm: FrameProcessor,
+    user: LLMUserAggregator = None,
+) -> Pipeline:
+    user = user or LLMUserAggregator(
+        context, params=LLMUserAggregatorParams(aggregation_timeout=0.05)
+    )
+    return Pipeline([speculation.input(), user, llm, speculation.output()])
+
+
+class TestSpeculativeLLM:
+    """Unit tests for SpeculativeLLM."""
+
+    @pytest.mark.asyncio
+    async def test_releases_response_when_final_transcript_matches(self):
+        """Test that the held response is released once a matching final transcript arrives."""
+        context = LLMContext(messages=[SYSTEM])
+        speculation = SpeculativeLLM(context)
+        llm = FakeLLM()
+
+        down, _ = await run_test(
+            pipeline(speculation, context, llm),
+            frames_to_send=[
+                UserStartedSpeakingFrame(),
+                *PAUSE,
+                SleepFrame(0.05),
+                UserStoppedSpeakingFrame(),
+                SleepFrame(0.02),
+                TranscriptionFrame("My name is Ann.", "", ""),
+                SleepFrame(0.05),
+            ],
+            expected_down_frames=[
+                UserStartedSpeakingFrame,
+                VADUserStoppedSpeakingFrame,
+                UserStoppedSpeakingFrame,
+                *RESPONSE,
+            ],
+        )
+
+        assert llm.prompts == ["my name is ann"]
+        assert down[4].text == "reply to my name is ann"
+        assert context.messages == [SYSTEM, {"role": "user", "content": "My name is Ann."}]
+        assert (speculation.speculations, speculation.confirmed) == (1, 1)
+
+    @pytest.mark.asyncio
+    async def test_user_aggregator_is_idle_after_confirmed_turn(self):
+        """Test that the user aggregator is not left waiting for the consumed final transcript."""
+        context = LLMContext(messages=[SYSTEM])
+        speculation = SpeculativeLLM(context)
+        llm = FakeLLM()
+        user = LLMUserAggregator(context, params=LLMUserAggregatorParams(aggregation_timeout=0.05))
+
+        await run_test(
+            pipeline(speculation, context, llm, user),
+            frames_to_send=[
+                UserStartedSpeakingFrame(),
+                InterimTranscriptionFrame("my name", "", ""),
+                SleepFrame(0.02),
+                *PAUSE,
+                SleepFrame(0.05),
+                UserStoppedSpeakingFrame(),
+                SleepFrame(0.02),
+                TranscriptionFrame("My name is Ann.", "", ""),
+                SleepFrame(0.05),
+            ],
+            expected_down_frames=[
+                UserStartedSpeakingFrame,
+                VADUserStoppedSpeakingFrame,
+                UserStoppedSpeakingFrame,
+                *RESPONSE,
+            ],
+        )
+
+        assert user._seen_interim_results is False
+        assert user._aggregation == ""
+        assert (speculation.speculations, speculation.confirmed) == (1, 1)
+
+    @pytest.mark.asyncio
+    async def test_cancels_response_when_user_resumes(self):
+        """Test that speaking again drops the held response with an interruption."""
+        context = LLMContext(messages=[SYSTEM])
+        speculation = SpeculativeLLM(context)
+
+        await run_test(
+            pipeline(speculation, context, FakeLLM()),
+            frames_to_send=[
+                UserStartedSpeakingFrame(),
+                *PAUSE,
+                SleepFrame(0.05),
+                VADUserStartedSpeakingFrame(),
+                SleepFrame(0.05),
+            ],
+            expected_down_frames=[
+                UserStartedSpeakingFrame,
+                VADUserStoppedSpeakingFrame,
+                InterruptionFrame,
+                VADUserStartedSpeakingFrame,
+            ],
+        )
+
+        assert context.messages == [SYSTEM]
+        assert (speculation.speculations, speculation.confirmed) == (1, 0)
+
+    @pytest.mark.asyncio
+    async def test_runs_turn_as_usual_when_final_transcript_differs(self):
+        """Test that a different final transcript cancels the response and reaches the LLM."""
+        context = LLMContext(messages=[SYSTEM])
+        speculation = SpeculativeLLM(context)
+        llm = FakeLLM()
+
+        down, _ = await run_test(
+            pipeline(speculation, context, llm),
+            frames_to_send=[
+                UserStartedSpeakingFrame(),
+                *PAUSE,
+                SleepFrame(0.05),
+                UserStoppedSpeakingFrame(),
+                SleepFrame(0.02),
+                TranscriptionFrame("My name is Anna.", "", ""),
+                SleepFrame(0.15),
+            ],
+            expected_down_frames=[
+                UserStartedSpeakingFrame,
+                VADUserStoppedSpeakingFrame,
+                UserStoppedSpeakingFrame,
+                InterruptionFrame,
+                *RESPONSE,
+            ],
+        )
+
+        assert llm.prompts == ["my name is ann", "My name is Anna."]
+        assert down[-2].text == "reply to My name is Anna."
+        assert context.messages == [SYSTEM, {"role": "user", "content": "My name is Anna."}]
+
+    @pytest.mark.asyncio
+    async def test_passes_response_once_confirmed(self):
+        """Test that output still being generated at confirmation passes straight through."""
+        context = LLMContext(messages=[SYSTEM])
+        speculation = SpeculativeLLM(context)
+
+        await run_test(
+            pipeline(speculation, context, FakeLLM(delay=0.1)),
+            frames_to_send=[
+                UserStartedSpeakingFrame(),
+                *PAUSE,
+                SleepFrame(0.05),
+                UserStoppedSpeakingFrame(),
+                SleepFrame(0.02),
+                TranscriptionFrame("my name is ann", "", ""),
+                SleepFrame(0.15),
+            ],
+            expected_down_frames=[
+                UserStartedSpeakingFrame,
+                VADUserStoppedSpeakingFrame,
+                UserStoppedSpeakingFrame,
+                *RESPONSE,
+            ],
+        )
+
+        assert speculation.confirmed == 1
+
+    @pytest.mark.asyncio
+    async def test_ignores_interim_transcripts_while_speaking(self):
+        """Test that interim transcripts only start a response after a VAD pause."""
+        context = LLMContext(messages=[SYSTEM])
+        speculation = SpeculativeLLM(context)
+
+        await run_test(
+            pipeline(speculation, context, FakeLLM()),
+            frames_to_send=[
+                UserStartedSpeakingFrame(),
+                InterimTranscriptionFrame("my name", "", ""),
+                SleepFrame(0.05),
+            ],
+            expected_down_frames=[UserStartedSpeakingFrame],
+        )
+
+        assert speculation.speculations == 0
+
+    @pytest.mark.asyncio
+    async def test_defer_waits_for_confirmation(self):
+        """Test that deferred handlers run once confirmed and never run once cancelled."""
+        speculation = SpeculativeLLM(LLMContext(messages=[SYSTEM]))
+        calls = []
+
+        async def handler(params):
+            calls.append(params)
+
+        deferred = speculation.defer(handler)
+        await deferred("outside")
+
+        speculation._start("hello")
+        task = asyncio.create_task(deferred("confirmed"))
+        await asyncio.sleep(0)
+        assert calls == ["outside"]
+        await speculation._confirm("hello")
+        await task
+
+        speculation._start("hello")
+        task = asyncio.create_task(deferred("cancelled"))
+        await asyncio.sleep(0)
+        speculation._cancel()
+        await task
+
+        assert calls == ["outside", "confirmed"]
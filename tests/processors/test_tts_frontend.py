@@ -0,0 +1,184 @@
+import pytest
+from pipecat.frames.frames import (
+    InterruptionFrame,
+    LLMFullResponseEndFrame,
+    LLMFullResponseStartFrame,
+    LLMTextFrame,
+    TTSAudioRawFrame,
+    TTSStartedFrame,
+    TTSStoppedFrame,
+    TTSTextFrame,
+)
+from pipecat.pipeline.pipeline import Pipeline
+from pipecat.services.tts_service import TTSService
+from pipecat.tests.utils import SleepFrame, run_test
+
+from pipecat_extension.processors.tts_frontend import (
+    CachedPhrase,
+    PhraseCache,
+    TTSFrontend,
+)
+
+VOICE = "aura-2-andromeda-en"
+SYNTHESIZED = [TTSStartedFrame, TTSAudioRawFrame, TTSStoppedFrame, TTSTextFrame]
+
+
+class FakeTTS(TTSService):
+    """Synthesizes two bytes of audio per character."""
+
+    def __init__(self):
+        super().__init__(sample_rate=16000, aggregate_sentences=False)
+        self.texts = []
+
+    async def run_tts(self, text):
+        self.texts.append(text)
+        yield TTSStartedFrame()
+        yield TTSAudioRawFrame(b"\x01\x00" * len(text), self.sample_rate, 1)
+        yield TTSStoppedFrame()
+
+
+def response(*tokens: str) -> list:
+    return [
+        LLMFullResponseStartFrame(),
+        *[LLMTextFrame(token) for token in tokens],
+        LLMFullResponseEndFrame(),
+        SleepFrame(0.05),
+    ]
+
+
+def pipeline(frontend: TTSFrontend, tts: FakeTTS) -> Pipeline:
+    return Pipeline([frontend.input(), tts, frontend.output()])
+
+
+class TestPhraseCache:
+    """Unit tests for PhraseCache."""
+
+    def test_keys_by_voice_and_stripped_text(self):
+        """Test that lookups match on voice and text, ignoring surrounding whitespace."""
+        cache = PhraseCache()
+        cache.put(VOICE, " Hello. ", CachedPhrase(b"\x00\x00", 16000))
+        assert cache.get(VOICE, "Hello.") == CachedPhrase(b"\x00\x00", 16000)
+        assert cache.get("other-voice", "Hello.") is None
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_evicts_least_recently_used(self):
+        """Test that the least recently used phrases are evicted over the byte limit."""
+        cache = PhraseCache(max_bytes=4)
+        cache.put(VOICE, "a", CachedPhrase(b"\x00\x00", 16000))
+        cache.put(VOICE, "b", CachedPhrase(b"\x00\x00", 16000))
+        cache.get(VOICE, "a")
+        cache.put(VOICE, "c", CachedPhrase(b"\x00\x00", 16000))
+        assert cache.get(VOICE, "a") is not None
+        assert cache.get(VOICE, "b") is None
+        assert len(cache) == 2
+
+    def test_skips_phrases_over_limit(self):
+        """Test that a phrase larger than the whole cache is not cached."""
+        cache = PhraseCache(max_bytes=2)
+        cache.put(VOICE, "a", CachedPhrase(b"\x00" * 4, 16000))
+        assert len(cache) == 0
+
+
+class TestTTSFrontend:
+    """Unit tests for TTSFrontend."""
+
+    @pytest.mark.asyncio
+    async def test_sends_first_clause_then_sentences(self):
+        """Test that the first clause goes out alone and later text by sentence."""
+        tts = FakeTTS()
+        frontend = TTSFrontend(voice=VOICE)
+
+        await run_test(
+            pipeline(frontend, tts),
+            frames_to_send=response(
+                "Okay, let", "'s get ", "your name, then your email. ", "What is your name?"
+            ),
+            expected_down_frames=[
+                LLMFullResponseStartFrame,
+                *SYNTHESIZED * 3,
+                LLMFullResponseEndFrame,
+            ],
+        )
+
+        assert tts.texts == [
+            "Okay,",
+            "let's get your name, then your email.",
+            "What is your name?",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_keeps_short_first_clause_and_decimals_together(self):
+        """Test that clauses under the minimum and decimal points don't end a chunk."""
+        tts = FakeTTS()
+        frontend = TTSFrontend(voice=VOICE)
+
+        await run_test(
+            pipeline(frontend, tts),
+            frames_to_send=response("Hi, it costs 3.", "5 dollars. Thanks"),
+            expected_down_frames=[
+                LLMFullResponseStartFrame,
+                *SYNTHESIZED * 2,
+                LLMFullResponseEndFrame,
+            ],
+        )
+
+        assert tts.texts == ["Hi, it costs 3.5 dollars.", "Thanks"]
+
+    @pytest.mark.asyncio
+    async def test_speaks_cached_phrases_without_synthesis(self):
+        """Test that a repeated phrase is served from the cache shared between calls."""
+        cache = PhraseCache()
+        greeting = ("Hello, ", "my name is Hunter's Digital.")
+
+        first_tts = FakeTTS()
+        await run_test(
+            pipeline(TTSFrontend(voice=VOICE, cache=cache), first_tts),
+            frames_to_send=response(*greeting),
+            expected_down_frames=[
+                LLMFullResponseStartFrame,
+                *SYNTHESIZED * 2,
+                LLMFullResponseEndFrame,
+            ],
+        )
+        second_tts = FakeTTS()
+        down, _ = await run_test(
+            pipeline(TTSFrontend(voice=VOICE, cache=cache), second_tts),
+            frames_to_send=response(*greeting),
+            expected_down_frames=[
+                LLMFullResponseStartFrame,
+                *SYNTHESIZED * 2,
+                LLMFullResponseEndFrame,
+            ],
+        )
+
+        assert first_tts.texts == ["Hello,", "my name is Hunter's Digital."]
+        assert second_tts.texts == []
+        assert [f.text for f in down if isinstance(f, TTSTextFrame)] == list(first_tts.texts)
+        assert down[2].audio == b"\x01\x00" * len("Hello,")
+        assert (cache.hits, len(cache)) == (2, 2)
+
+    @pytest.mark.asyncio
+    async def test_interruption_drops_pending_text(self):
+        """Test that text not yet sent is dropped by an interruption."""
+        tts = FakeTTS()
+        frontend = TTSFrontend(voice=VOICE)
+
+        await run_test(
+            pipeline(frontend, tts),
+            frames_to_send=[
+                LLMFullResponseStartFrame(),
+                LLMTextFrame("Your name is"),
+                SleepFrame(0.05),
+                InterruptionFrame(),
+                *response("Sorry?"),
+            ],
+            expected_down_frames=[
+                LLMFullResponseStartFrame,
+                InterruptionFrame,
+                LLMFullResponseStartFrame,
+                *SYNTHESIZED,
+                LLMFullResponseEndFrame,
+            ],
+        )
+
+        assert tts.texts == ["Sorry?"]
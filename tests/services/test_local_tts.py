@@ -0,0 +1,82 @@
+import time
+
+import numpy as np
+import pytest
+from pipecat.frames.frames import (
+    TTSAudioRawFrame,
+    TTSSpeakFrame,
+    TTSStartedFrame,
+    TTSStoppedFrame,
+    TTSTextFrame,
+)
+from pipecat.tests.utils import run_test
+
+from pipecat_extension.services.local_tts import LocalTTSParams, LocalTTSService, synthesize
+
+
+class TestSynthesize:
+    """Unit tests for synthesize."""
+
+    def test_is_deterministic(self):
+        """Test that the same text always gives the same audio, and other text other audio."""
+        first = synthesize("My name is Ann.", 16000)
+        assert np.array_equal(first, synthesize("My name is Ann.", 16000))
+        assert not np.array_equal(first, synthesize("My name is Bob.", 16000))
+
+    def test_length_follows_speaking_rate(self):
+        """Test that every character takes the same time and punctuation pauses twice as long."""
+        assert len(synthesize("hello", 16000, chars_per_second=10)) == 5 * 1600
+        assert len(synthesize("hi.", 16000, chars_per_second=10)) == 4 * 1600
+        assert len(synthesize("", 16000)) == 0
+
+    def test_pauses_are_silent(self):
+        """Test that spaces are rendered as silence and letters are not."""
+        audio = synthesize("a b", 8000, chars_per_second=10)
+        assert np.any(audio[:800]) and not np.any(audio[800:1600]) and np.any(audio[1600:])
+
+
+class TestLocalTTSService:
+    """Unit tests for LocalTTSService."""
+
+    @pytest.mark.asyncio
+    async def test_streams_synthesized_audio_in_chunks(self):
+        """Test that the audio of the text is pushed in chunks of the configured length."""
+        tts = LocalTTSService(sample_rate=16000, params=LocalTTSParams(chunk_ms=40))
+
+        down, _ = await run_test(
+            tts,
+            frames_to_send=[TTSSpeakFrame("Hello there")],
+            expected_down_frames=[
+                TTSStartedFrame,
+                *[TTSAudioRawFrame] * 20,
+                TTSStoppedFrame,
+                TTSTextFrame,
+            ],
+        )
+
+        audio = [f.audio for f in down if isinstance(f, TTSAudioRawFrame)]
+        assert all(len(chunk) == 1280 for chunk in audio[:-1])
+        assert b"".join(audio) == synthesize("Hello there", 16000).tobytes()
+
+    @pytest.mark.asyncio
+    async def test_waits_for_first_byte_and_paces_synthesis(self):
+        """Test that the first chunk waits ttfb_ms and the rest follow the real-time factor."""
+        tts = LocalTTSService(
+            sample_rate=16000,
+            params=LocalTTSParams(ttfb_ms=100, real_time_factor=0.5, chars_per_second=10),
+        )
+
+        start = time.monotonic()
+        await run_test(
+            tts,
+            frames_to_send=[TTSSpeakFrame("hi")],
+            expected_down_frames=[
+                TTSStartedFrame,
+                *[TTSAudioRawFrame] * 5,
+                TTSStoppedFrame,
+                TTSTextFrame,
+            ],
+        )
+
+        # 100 ms to the first chunk, then 160 of the 200 ms of audio at half speed.
+        assert time.monotonic() - start >= 0.18
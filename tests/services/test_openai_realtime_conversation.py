@@ -0,0 +1,144 @@
+from pipecat.services.openai.realtime import events
+
+from pipecat_extension.services.openai_realtime_conversation import ConversationStore
+
+
+def make_item(item_id: str, audio: str = None, transcript: str = None) -> events.ConversationItem:
+    return events.ConversationItem(
+        id=item_id,
+        type="message",
+        role="user",
+        content=[events.ItemContent(type="input_audio", audio=audio, transcript=transcript)],
+    )
+
+
+class TestConversationStore:
+    """Unit tests for ConversationStore."""
+
+    def test_add_orders_by_previous_item_id(self):
+        """Test that items are ordered using previous_item_id rather than arrival order."""
+        store = ConversationStore()
+        store.add(make_item("a"))
+        store.add(make_item("c"), "a")
+        store.add(make_item("b"), "a")
+        store.add(make_item("first"))
+
+        assert [item.id for item in store] == ["first", "a", "b", "c"]
+        assert store.previous_item_id("b") == "a"
+        assert store.previous_item_id("first") is None
+
+    def test_add_unknown_previous_item_appends(self):
+        """Test that an item whose previous item is unknown is appended."""
+        store = ConversationStore()
+        store.add(make_item("a"))
+        store.add(make_item("b"), "missing")
+
+        assert [item.id for item in store] == ["a", "b"]
+
+    def test_get_update_and_delete(self):
+        """Test lookup, in-place update and deletion by item id."""
+        store = ConversationStore()
+        store.add(make_item("a"))
+        store.add(make_item("b"), "a")
+        store.add(make_item("c"), "b")
+        updated = make_item("b", transcript="hello")
+
+        store.update(updated)
+        assert store.get("b") is updated
+        assert [item.id for item in store] == ["a", "b", "c"]
+
+        assert store.delete("b") is True
+        assert store.delete("b") is False
+        assert "b" not in store
+        assert store.get("b") is None
+        assert [item.id for item in store] == ["a", "c"]
+
+    def test_update_unknown_item_appends(self):
+        """Test that updating an item that was never added appends it."""
+        store = ConversationStore()
+        store.add(make_item("a"))
+        store.update(make_item("b"))
+
+        assert [item.id for item in store] == ["a", "b"]
+
+    def test_set_transcript_copies_item(self):
+        """Test that set_transcript replaces the stored item without mutating the original."""
+        store = ConversationStore()
+        original = make_item("a")
+        store.add(original)
+
+        store.set_transcript("a", 0, "hello")
+        store.set_transcript("missing", 0, "ignored")
+
+        assert store.get("a").content[0].transcript == "hello"
+        assert original.content[0].transcript is None
+
+    def test_snapshot_is_cached_until_modified(self):
+        """Test that snapshots are reused until the store changes."""
+        store = ConversationStore()
+        store.add(make_item("a"))
+
+        snapshot = store.snapshot()
+        assert store.snapshot() is snapshot
+        assert [item.id for item in snapshot] == ["a"]
+
+        store.add(make_item("b"), "a")
+        assert [item.id for item in snapshot] == ["a"]
+        assert [item.id for item in store.snapshot()] == ["a", "b"]
+
+    def test_payload_eviction(self):
+        """Test that only the most recent items keep their audio and transcript payloads."""
+        store = ConversationStore(max_audio_items=1, max_transcript_items=2)
+        originals = [make_item(item_id, audio="AAAA", transcript="hi") for item_id in "abc"]
+        store.add(originals[0])
+        store.add(originals[1], "a")
+        store.add(originals[2], "b")
+
+        audio = [item.content[0].audio for item in store]
+        transcripts = [item.content[0].transcript for item in store]
+        assert audio == [None, None, "AAAA"]
+        assert transcripts == [None, "hi", "hi"]
+        assert originals[0].content[0].audio == "AAAA"
+
+    def test_delete_frees_payload_slots(self):
+        """Test that a deleted item no longer counts towards the payload limits."""
+        store = ConversationStore(max_audio_items=2, max_transcript_items=2)
+        store.add(make_item("a", audio="AAAA", transcript="hi"))
+        store.add(make_item("b", audio="AAAA", transcript="hi"), "a")
+        store.delete("b")
+        store.add(make_item("c", audio="AAAA", transcript="hi"), "a")
+
+        assert [item.content[0].audio for item in store] == ["AAAA", "AAAA"]
+        assert [item.content[0].transcript for item in store] == ["hi", "hi"]
+        assert list(store._audio_ids) == list(store._transcript_ids) == ["a", "c"]
+
+    def test_transcript_set_after_eviction(self):
+        """Test that payloads set on an item after eviction are stripped again."""
+        store = ConversationStore(max_audio_items=1, max_transcript_items=1)
+        store.add(make_item("u1"))
+        store.add(make_item("a1", transcript="hello"), "u1")
+        store.set_transcript("u1", 0, "hello")
+        store.update(make_item("u1", audio="AAAA", transcript="hello"))
+
+        assert [item.content[0].transcript for item in store] == [None, "hello"]
+        assert [item.content[0].audio for item in store] == [None, None]
+        assert list(store._transcript_ids) == ["a1"]
+
+    def test_max_items_drops_oldest(self):
+        """Test that max_items bounds the number of items kept."""
+        store = ConversationStore(max_items=2)
+        store.add(make_item("a"))
+        store.add(make_item("b"), "a")
+        store.add(make_item("c"), "b")
+
+        assert len(store) == 2
+        assert [item.id for item in store] == ["b", "c"]
+
+    def test_clear(self):
+        """Test that clear removes every item."""
+        store = ConversationStore()
+        store.add(make_item("a"))
+        store.clear()
+
+        assert len(store) == 0
+        assert store.snapshot() == ()
@@ -0,0 +1,87 @@
+import base64
+import json
+
+import pytest
+
+from pipecat.services.openai.realtime import events
+
+from pipecat_extension.services.openai_realtime_events import (
+    AudioDeltaEvent,
+    parse_audio_delta,
+    parse_server_event,
+)
+
+
+def make_audio_delta_message(audio: bytes) -> str:
+    return json.dumps(
+        {
+            "type": "response.output_audio.delta",
+            "event_id": "event_1",
+            "response_id": "resp_1",
+            "item_id": "item_1",
+            "output_index": 0,
+            "content_index": 2,
+            "delta": base64.b64encode(audio).decode(),
+        },
+        separators=(",", ":"),
+    )
+
+
+class TestParseAudioDelta:
+    """Unit tests for the audio delta fast path."""
+
+    @pytest.mark.parametrize("encode", [False, True])
+    def test_matches_full_validation(self, encode):
+        """Test that the fast path decodes the same fields and audio as the pydantic path."""
+        audio = bytes(range(256)) * 10
+        message = make_audio_delta_message(audio)
+        expected = events.parse_server_event(message)
+
+        evt = parse_audio_delta(message.encode() if encode else message)
+
+        assert isinstance(evt, AudioDeltaEvent)
+        assert evt.type == expected.type
+        assert evt.event_id == expected.event_id
+        assert evt.response_id == expected.response_id
+        assert evt.item_id == expected.item_id
+        assert evt.output_index == expected.output_index
+        assert evt.content_index == expected.content_index
+        assert evt.audio == base64.b64decode(expected.delta) == audio
+
+    def test_returns_none_for_other_events(self):
+        """Test that non audio delta events are not handled by the fast path."""
+        message = json.dumps({"type": "response.output_audio.done", "event_id": "event_1"})
+        assert parse_audio_delta(message) is None
+
+    def test_returns_none_for_non_compact_json(self):
+        """Test that audio deltas that are not in the compact API form fall back to full validation."""
+        message = json.dumps(json.loads(make_audio_delta_message(b"\x00\x01")), indent=2)
+        assert parse_audio_delta(message) is None
+
+    def test_returns_none_for_missing_fields(self):
+        """Test that audio deltas missing required fields are not decoded by the fast path."""
+        message = '{"type":"response.output_audio.delta","event_id":"event_1","delta":"AAE="}'
+        assert parse_audio_delta(message) is None
+
+
+class TestParseServerEvent:
+    """Unit tests for parse_server_event."""
+
+    def test_audio_delta_uses_fast_path(self):
+        """Test that audio deltas are returned as AudioDeltaEvent."""
+        evt = parse_server_event(make_audio_delta_message(b"\x00\x01").encode())
+        assert isinstance(evt, AudioDeltaEvent)
+        assert evt.audio == b"\x00\x01"
+
+    @pytest.mark.parametrize("encode", [False, True])
+    def test_control_events_are_validated(self, encode):
+        """Test that control events go through full pydantic validation."""
+        message = events.ConversationItemDeleted(
+            event_id="event_1", type="conversation.item.deleted", item_id="item_1"
+        ).model_dump_json()
+
+        evt = parse_server_event(message.encode() if encode else message)
+
+        assert isinstance(evt, events.ConversationItemDeleted)
+        assert evt.item_id == "item_1"
+
@@ -0,0 +1,123 @@
+import asyncio
+
+import pytest
+
+from pipecat_extension.services.openai_realtime_handlers import (
+    HandlerExecutionPolicy,
+    HandlerExecutor,
+)
+
+
+class TestHandlerExecutor:
+    """Unit tests for HandlerExecutor."""
+
+    @pytest.mark.asyncio
+    async def test_inline_returns_result(self):
+        """Test that inline calls are awaited and their result returned."""
+        executor = HandlerExecutor("evt", HandlerExecutionPolicy())
+
+        async def handler(value):
+            return value * 2
+
+        assert await executor.submit(handler, 21) == 42
+
+    @pytest.mark.asyncio
+    async def test_task_does_not_block(self):
+        """Test that task calls return immediately and run in the background."""
+        executor = HandlerExecutor("evt", HandlerExecutionPolicy(mode="task"))
+        release = asyncio.Event()
+        done = []
+
+        async def handler(value):
+            await release.wait()
+            done.append(value)
+
+        assert await executor.submit(handler, 1) is None
+        await executor.submit(handler, 2)
+        assert executor.pending == 2
+
+        release.set()
+        await executor.drain()
+        assert sorted(done) == [1, 2]
+        assert executor.pending == 0
+
+    @pytest.mark.asyncio
+    async def test_queue_runs_in_order_and_drops_on_overflow(self):
+        """Test that queued calls run one at a time in order and overflow is counted."""
+        executor = HandlerExecutor("evt", HandlerExecutionPolicy(mode="queue", max_queue_size=2))
+        done = []
+
+        async def handler(value):
+            await asyncio.sleep(0)
+            done.append(value)
+
+        for value in range(5):
+            await executor.submit(handler, value)
+        await executor.drain()
+
+        assert done == [0, 1]
+        assert executor.overflow_count == 3
+
+    @pytest.mark.asyncio
+    async def test_queue_coalesces_on_overflow(self):
+        """Test that coalescing replaces the newest queued call with the incoming one."""
+        policy = HandlerExecutionPolicy(mode="queue", max_queue_size=2, overflow="coalesce")
+        executor = HandlerExecutor("evt", policy)
+        done = []
+
+        async def handler(value):
+            done.append(value)
+
+        for value in range(5):
+            await executor.submit(handler, value)
+        await executor.drain()
+
+        assert done == [0, 4]
+        assert executor.overflow_count == 3
+
+    @pytest.mark.asyncio
+    async def test_background_exceptions_are_isolated(self):
+        """Test that an exception in a queued call does not stop the worker."""
+        executor = HandlerExecutor("evt", HandlerExecutionPolicy(mode="queue"))
+        done = []
+
+        async def handler(value):
+            if value == 0:
+                raise RuntimeError("boom")
+            done.append(value)
+
+        await executor.submit(handler, 0)
+        await executor.submit(handler, 1)
+        await executor.drain()
+
+        assert done == [1]
+
+    @pytest.mark.asyncio
+    async def test_cancel(self):
+        """Test that cancel stops running calls and drops queued ones."""
+        executor = HandlerExecutor("evt", HandlerExecutionPolicy(mode="queue"))
+
+        async def handler():
+            await asyncio.sleep(1)
+
+        await executor.submit(handler)
+        await executor.submit(handler)
+        await asyncio.sleep(0)
+        executor.cancel()
+        await executor.drain()
+
+        assert executor.pending == 0
+
+    @pytest.mark.asyncio
+    async def test_cancel_before_worker_starts(self):
+        """Test that drain returns when the queue worker is cancelled before it ever ran."""
+        executor = HandlerExecutor("evt", HandlerExecutionPolicy(mode="queue"))
+
+        async def handler():
+            await asyncio.sleep(1)
+
+        await executor.submit(handler)
+        executor.cancel()
+        await asyncio.wait_for(executor.drain(), timeout=0.1)
+
+        assert executor.pending == 0
@@ -1,10 +1,20 @@
 import pytest
 import asyncio
+import base64
+import json
 from unittest.mock import Mock, patch, MagicMock, AsyncMock, call
 
 from pipecat_extension.services.openai_realtime_llm_service import OpenAIRealtimeLLMServiceExt
+from pipecat_extension.services.openai_realtime_handlers import HandlerExecutionPolicy
+from pipecat_extension.services.openai_realtime_metrics import InMemoryMetricsSink
+from pipecat_extension.services.openai_realtime_reconnect import ReconnectParams
+from pipecat_extension.services.openai_realtime_sender import ClientEventSenderParams
+from pipecat_extension.services.openai_realtime_tools import AsyncToolResult
 from pipecat.services.openai.realtime.llm import OpenAIRealtimeLLMService
 from pipecat.services.openai.realtime import events
+from pipecat.frames.frames import CancelFrame, TTSAudioRawFrame, TTSStartedFrame
+from pipecat.utils.base_object import EventHandler
+from websockets.exceptions import ConnectionClosedError, ConnectionClosedOK
 
 
 class TestOpenAIRealtimeLLMServiceExt:
@@ -283,8 +293,10 @@ class TestOpenAIRealtimeLLMServiceExt:
     @patch.object(OpenAIRealtimeLLMService, "_register_event_handler")
     @patch("pipecat_extension.services.openai_realtime_llm_service.events.parse_server_event")
     @patch.object(OpenAIRealtimeLLMService, "_handle_evt_session_updated", new_callable=AsyncMock)
+    @patch.object(OpenAIRealtimeLLMService, "_call_event_handler", new_callable=AsyncMock)
     async def test_receive_task_handler_session_updated(
         self,
+        mock_call_event_handler,
         mock_handle_evt_session_updated,
         mock_parse_server_event,
         mock_register_event_handler,
@@ -313,6 +325,7 @@ class TestOpenAIRealtimeLLMServiceExt:
             pass
         
         mock_handle_evt_session_updated.assert_awaited_once_with(mock_event)
+        mock_call_event_handler.assert_awaited_once_with("on_session_updated", mock_event.session)
 
     @pytest.mark.asyncio
     @patch.object(OpenAIRealtimeLLMService, "__init__")
@@ -530,3 +543,743 @@ class TestOpenAIRealtimeLLMServiceExt:
         
         mock_handle_evt_function_call_arguments_done.assert_awaited_once_with(mock_event)
 
+
+    @pytest.mark.asyncio
+    @patch.object(OpenAIRealtimeLLMService, "__init__")
+    @patch.object(OpenAIRealtimeLLMService, "_register_event_handler")
+    @patch("pipecat_extension.services.openai_realtime_llm_service.events.parse_server_event")
+    async def test_receive_task_handler_counts_unhandled_events(
+        self,
+        mock_parse_server_event,
+        mock_register_event_handler,
+        mock_parent_init,
+    ):
+        """Test that _receive_task_handler counts events that have no handler and keeps receiving."""
+        mock_parent_init.return_value = None
+
+        first_event = Mock()
+        first_event.type = "rate_limits.updated"
+        second_event = Mock()
+        second_event.type = "rate_limits.updated"
+        mock_parse_server_event.side_effect = [first_event, second_event]
+
+        async def websocket_iter():
+            yield "first_message"
+            yield "second_message"
+
+        mock_websocket = AsyncMock()
+        mock_websocket.__aiter__ = lambda self: websocket_iter()
+
+        service = OpenAIRealtimeLLMServiceExt(Mock(), Mock())
+        service._websocket = mock_websocket
+
+        await asyncio.wait_for(service._receive_task_handler(), timeout=1.0)
+
+        assert service.get_unhandled_server_event_counts() == {"rate_limits.updated": 2}
+
+    @pytest.mark.asyncio
+    @patch.object(OpenAIRealtimeLLMService, "__init__")
+    @patch.object(OpenAIRealtimeLLMService, "_register_event_handler")
+    @patch.object(OpenAIRealtimeLLMService, "_handle_evt_text_delta", new_callable=AsyncMock)
+    @patch("pipecat_extension.services.openai_realtime_llm_service.events.parse_server_event")
+    async def test_receive_task_handler_reports_metrics(
+        self,
+        mock_parse_server_event,
+        mock_handle_evt_text_delta,
+        mock_register_event_handler,
+        mock_parent_init,
+    ):
+        """Test that a metrics sink receives per-event timings and the websocket queue depth."""
+        mock_parent_init.return_value = None
+
+        text_event = Mock()
+        text_event.type = "response.output_text.delta"
+        unhandled_event = Mock()
+        unhandled_event.type = "rate_limits.updated"
+        mock_parse_server_event.side_effect = [text_event, unhandled_event]
+
+        async def websocket_iter():
+            yield "first_message"
+            yield "second_message"
+
+        mock_websocket = Mock()
+        mock_websocket.__aiter__ = lambda self: websocket_iter()
+        mock_websocket.recv_messages.frames = [b"queued"]
+
+        sink = InMemoryMetricsSink()
+        service = OpenAIRealtimeLLMServiceExt(Mock(), Mock(), metrics_sink=sink)
+        service._websocket = mock_websocket
+
+        await asyncio.wait_for(service._receive_task_handler(), timeout=1.0)
+
+        snapshot = sink.snapshot()
+        assert snapshot["server_events"]["response.output_text.delta"]["dispatch"].count == 1
+        assert snapshot["server_events"]["rate_limits.updated"]["parse"].count == 1
+        assert snapshot["max_queue_depth_frames"] == 1
+        mock_handle_evt_text_delta.assert_awaited_once_with(text_event)
+
+    @pytest.mark.asyncio
+    @patch.object(OpenAIRealtimeLLMService, "__init__")
+    @patch.object(OpenAIRealtimeLLMService, "_register_event_handler")
+    async def test_run_handler_reports_metrics(self, mock_register_event_handler, mock_parent_init):
+        """Test that registered event handler run times are reported to the metrics sink."""
+        mock_parent_init.return_value = None
+        sink = InMemoryMetricsSink()
+        service = OpenAIRealtimeLLMServiceExt(Mock(), Mock(), metrics_sink=sink)
+        handler = AsyncMock()
+
+        await service._run_handler("on_conversation_item_deleted", handler, "item_1")
+
+        handler.assert_awaited_once_with(service, "item_1")
+        assert sink.snapshot()["event_handlers"]["on_conversation_item_deleted"].count == 1
+
+    @pytest.mark.asyncio
+    @patch.object(OpenAIRealtimeLLMService, "__init__")
+    @patch.object(OpenAIRealtimeLLMService, "_register_event_handler")
+    async def test_event_handler_policy_runs_sync_handler_in_task(
+        self, mock_register_event_handler, mock_parent_init
+    ):
+        """Test that a task policy stops a slow sync event handler from blocking the caller."""
+        mock_parent_init.return_value = None
+        service = OpenAIRealtimeLLMServiceExt(
+            Mock(),
+            Mock(),
+            event_handler_policies={
+                "after_function_call_output_sent": HandlerExecutionPolicy(mode="task")
+            },
+        )
+        release = asyncio.Event()
+        calls = []
+
+        async def handler(*args):
+            await release.wait()
+            calls.append(args)
+
+        service._event_handlers = {
+            "after_function_call_output_sent": EventHandler(
+                name="after_function_call_output_sent", handlers=[handler], is_sync=True
+            )
+        }
+        frame = Mock()
+
+        await asyncio.wait_for(
+            service._call_event_handler("after_function_call_output_sent", frame), timeout=0.1
+        )
+        assert calls == []
+        release.set()
+        await service._handler_executors["after_function_call_output_sent"].drain()
+
+        assert calls == [(service, frame)]
+
+    @patch.object(OpenAIRealtimeLLMService, "__init__")
+    @patch.object(OpenAIRealtimeLLMService, "_register_event_handler")
+    def test_loop_control_event_policy_must_be_inline(
+        self, mock_register_event_handler, mock_parent_init
+    ):
+        """Test that the error handler, which can stop the receive loop, cannot run in the background."""
+        mock_parent_init.return_value = None
+
+        with pytest.raises(ValueError, match="error"):
+            OpenAIRealtimeLLMServiceExt(
+                Mock(), Mock(), event_handler_policies={"error": HandlerExecutionPolicy(mode="task")}
+            )
+        OpenAIRealtimeLLMServiceExt(
+            Mock(), Mock(), event_handler_policies={"error": HandlerExecutionPolicy(mode="inline")}
+        )
+
+    @pytest.mark.asyncio
+    @patch.object(OpenAIRealtimeLLMService, "__init__")
+    @patch.object(OpenAIRealtimeLLMService, "_register_event_handler")
+    @patch.object(OpenAIRealtimeLLMService, "cancel", new_callable=AsyncMock)
+    async def test_cancel_drops_background_event_handlers(
+        self, mock_parent_cancel, mock_register_event_handler, mock_parent_init
+    ):
+        """Test that cancelling the service cancels event handlers still running in the background."""
+        mock_parent_init.return_value = None
+        service = OpenAIRealtimeLLMServiceExt(
+            Mock(),
+            Mock(),
+            event_handler_policies={
+                "rate_limits.updated": HandlerExecutionPolicy(mode="queue", max_queue_size=10)
+            },
+        )
+        finished = []
+
+        async def handler(service, evt):
+            await asyncio.sleep(1)
+            finished.append(evt)
+
+        service.register_server_event_handler("rate_limits.updated", handler)
+        rate_limits_event = Mock()
+        rate_limits_event.type = "rate_limits.updated"
+        for _ in range(3):
+            await service._dispatch_server_event(rate_limits_event)
+        await asyncio.sleep(0)
+
+        frame = CancelFrame()
+        await service.cancel(frame)
+        executor = service._handler_executors["rate_limits.updated"]
+        await asyncio.wait_for(executor.drain(), timeout=0.1)
+
+        assert finished == []
+        assert executor.pending == 0
+        mock_parent_cancel.assert_awaited_once_with(frame)
+
+    @pytest.mark.asyncio
+    @patch.object(OpenAIRealtimeLLMService, "__init__")
+    @patch.object(OpenAIRealtimeLLMService, "_register_event_handler")
+    async def test_server_event_handler_policy_counts_overflow(
+        self, mock_register_event_handler, mock_parent_init
+    ):
+        """Test that a queued server event handler drops events when its queue overflows."""
+        mock_parent_init.return_value = None
+        service = OpenAIRealtimeLLMServiceExt(
+            Mock(),
+            Mock(),
+            event_handler_policies={
+                "rate_limits.updated": HandlerExecutionPolicy(mode="queue", max_queue_size=1)
+            },
+        )
+        handler = AsyncMock()
+        service.register_server_event_handler("rate_limits.updated", handler)
+        rate_limits_event = Mock()
+        rate_limits_event.type = "rate_limits.updated"
+
+        for _ in range(3):
+            assert await service._dispatch_server_event(rate_limits_event) is True
+        await service._handler_executors["rate_limits.updated"].drain()
+
+        handler.assert_awaited_once_with(service, rate_limits_event)
+        assert service.get_event_handler_overflow_counts() == {"rate_limits.updated": 2}
+
+    @pytest.mark.asyncio
+    @patch.object(OpenAIRealtimeLLMService, "__init__")
+    @patch.object(OpenAIRealtimeLLMService, "_register_event_handler")
+    @patch.object(OpenAIRealtimeLLMService, "push_error", new_callable=AsyncMock)
+    @patch.object(OpenAIRealtimeLLMServiceExt, "_reconnect", new_callable=AsyncMock)
+    @patch("pipecat_extension.services.openai_realtime_llm_service.events.parse_server_event")
+    async def test_receive_task_handler_classifies_errors(
+        self,
+        mock_parse_server_event,
+        mock_reconnect,
+        mock_push_error,
+        mock_register_event_handler,
+        mock_parent_init,
+    ):
+        """Test that ignorable errors keep the session and recoverable errors reconnect."""
+        mock_parent_init.return_value = None
+        mock_parse_server_event.side_effect = [
+            events.ErrorEvent(
+                type="error",
+                event_id="e1",
+                error=events.RealtimeError(
+                    type="invalid_request_error",
+                    code="response_cancel_not_active",
+                    message="Cancellation failed: no active response found.",
+                ),
+            ),
+            events.ErrorEvent(
+                type="error",
+                event_id="e2",
+                error=events.RealtimeError(
+                    type="invalid_request_error",
+                    code="session_expired",
+                    message="Your session hit the maximum duration of 60 minutes.",
+                ),
+            ),
+        ]
+
+        async def websocket_iter():
+            yield "first_message"
+            yield "second_message"
+
+        mock_websocket = AsyncMock()
+        mock_websocket.__aiter__ = lambda self: websocket_iter()
+
+        service = OpenAIRealtimeLLMServiceExt(Mock(), Mock(), reconnect_params=ReconnectParams())
+        service._websocket = mock_websocket
+        service._disconnecting = False
+
+        await asyncio.wait_for(service._receive_task_handler(), timeout=1.0)
+
+        assert mock_push_error.await_args.args[0].fatal is False
+        mock_reconnect.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    @patch.object(OpenAIRealtimeLLMService, "__init__")
+    @patch.object(OpenAIRealtimeLLMService, "_register_event_handler")
+    @patch.object(OpenAIRealtimeLLMServiceExt, "_reconnect", new_callable=AsyncMock)
+    async def test_receive_task_handler_reconnects_when_connection_drops(
+        self, mock_reconnect, mock_register_event_handler, mock_parent_init
+    ):
+        """Test that an abnormal close reconnects when reconnect is enabled."""
+        mock_parent_init.return_value = None
+
+        async def websocket_iter():
+            raise ConnectionClosedError(None, None)
+            yield
+
+        mock_websocket = AsyncMock()
+        mock_websocket.__aiter__ = lambda self: websocket_iter()
+
+        service = OpenAIRealtimeLLMServiceExt(Mock(), Mock(), reconnect_params=ReconnectParams())
+        service._websocket = mock_websocket
+        service._disconnecting = False
+
+        await asyncio.wait_for(service._receive_task_handler(), timeout=1.0)
+
+        mock_reconnect.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    @patch.object(OpenAIRealtimeLLMService, "__init__")
+    @patch.object(OpenAIRealtimeLLMService, "_register_event_handler")
+    @patch.object(OpenAIRealtimeLLMService, "push_error", new_callable=AsyncMock)
+    @patch.object(OpenAIRealtimeLLMServiceExt, "_reconnect", new_callable=AsyncMock)
+    async def test_send_on_dropped_connection_leaves_reconnect_to_receive_loop(
+        self, mock_reconnect, mock_push_error, mock_register_event_handler, mock_parent_init
+    ):
+        """Test that a send failing before the receive loop sees the drop is not fatal."""
+        mock_parent_init.return_value = None
+
+        async def websocket_iter():
+            raise ConnectionClosedError(None, None)
+            yield
+
+        mock_websocket = AsyncMock()
+        mock_websocket.send.side_effect = ConnectionClosedError(None, None)
+        mock_websocket.__aiter__ = lambda self: websocket_iter()
+
+        service = OpenAIRealtimeLLMServiceExt(Mock(), Mock(), reconnect_params=ReconnectParams())
+        service._websocket = mock_websocket
+        service._disconnecting = False
+
+        await service._ws_send_payload(b'{"type":"input_audio_buffer.append","audio":""}')
+        await asyncio.wait_for(service._receive_task_handler(), timeout=1.0)
+
+        mock_push_error.assert_not_awaited()
+        mock_reconnect.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    @patch.object(OpenAIRealtimeLLMService, "__init__")
+    @patch.object(OpenAIRealtimeLLMService, "_register_event_handler")
+    @patch.object(OpenAIRealtimeLLMService, "push_error", new_callable=AsyncMock)
+    async def test_send_failure_without_reconnect_is_fatal(
+        self, mock_push_error, mock_register_event_handler, mock_parent_init
+    ):
+        """Test that a failed send still ends the session when reconnect is disabled."""
+        mock_parent_init.return_value = None
+        mock_websocket = AsyncMock()
+        mock_websocket.send.side_effect = ConnectionClosedError(None, None)
+
+        service = OpenAIRealtimeLLMServiceExt(Mock(), Mock())
+        service._websocket = mock_websocket
+        service._disconnecting = False
+
+        await service._ws_send_payload(b"{}")
+
+        assert mock_push_error.await_args.args[0].fatal is True
+
+    @pytest.mark.asyncio
+    @patch.object(OpenAIRealtimeLLMService, "__init__")
+    @patch.object(OpenAIRealtimeLLMService, "_register_event_handler")
+    @patch.object(OpenAIRealtimeLLMService, "_call_event_handler", new_callable=AsyncMock)
+    @patch.object(OpenAIRealtimeLLMServiceExt, "_connect", new_callable=AsyncMock)
+    async def test_reconnect_retries_with_backoff(
+        self,
+        mock_connect,
+        mock_call_event_handler,
+        mock_register_event_handler,
+        mock_parent_init,
+    ):
+        """Test that _reconnect retries until a connection is established."""
+        mock_parent_init.return_value = None
+        service = OpenAIRealtimeLLMServiceExt(
+            Mock(), Mock(), reconnect_params=ReconnectParams(initial_backoff=0)
+        )
+        old_websocket = AsyncMock()
+        new_websocket = AsyncMock()
+        service._websocket = old_websocket
+        attempts = iter([None, new_websocket])
+
+        async def connect():
+            service._websocket = next(attempts)
+
+        mock_connect.side_effect = connect
+
+        await service._reconnect()
+
+        old_websocket.close.assert_awaited_once()
+        assert mock_connect.await_count == 2
+        assert service._websocket is new_websocket
+        assert service._resuming is True
+        mock_call_event_handler.assert_awaited_once_with("on_reconnected", 2)
+
+    @pytest.mark.asyncio
+    @patch.object(OpenAIRealtimeLLMService, "__init__")
+    @patch.object(OpenAIRealtimeLLMService, "_register_event_handler")
+    @patch.object(OpenAIRealtimeLLMService, "_handle_evt_session_created", new_callable=AsyncMock)
+    @patch.object(OpenAIRealtimeLLMServiceExt, "send_client_events", new_callable=AsyncMock)
+    async def test_session_created_resumes_session(
+        self,
+        mock_send_client_events,
+        mock_handle_evt_session_created,
+        mock_register_event_handler,
+        mock_parent_init,
+    ):
+        """Test that a new session after a reconnect gets the last session.update and the conversation."""
+        mock_parent_init.return_value = None
+        service = OpenAIRealtimeLLMServiceExt(
+            Mock(), Mock(), reconnect_params=ReconnectParams()
+        )
+        service._messages_added_manually = {}
+        session_update = events.SessionUpdateEvent(
+            session=events.SessionProperties(instructions="Be brief.")
+        )
+        service._last_session_update = session_update
+        service.conversation.add(
+            events.ConversationItem(
+                id="user_1",
+                type="message",
+                role="user",
+                content=[events.ItemContent(type="input_audio", transcript="Hi")],
+            )
+        )
+        service._resuming = True
+
+        await service._dispatch_server_event(Mock(type="session.created"))
+
+        mock_handle_evt_session_created.assert_not_awaited()
+        [client_events] = mock_send_client_events.await_args.args
+        assert client_events[0] is session_update
+        assert client_events[1].item.id == "user_1"
+        assert client_events[1].item.content[0].text == "Hi"
+        assert service._messages_added_manually == {"user_1": True}
+        assert service._resuming is False
+
+    @pytest.mark.asyncio
+    @patch.object(OpenAIRealtimeLLMService, "__init__")
+    @patch.object(OpenAIRealtimeLLMService, "_register_event_handler")
+    @patch.object(OpenAIRealtimeLLMService, "_call_event_handler", new_callable=AsyncMock)
+    @patch.object(OpenAIRealtimeLLMServiceExt, "_connect", new_callable=AsyncMock)
+    async def test_reconnect_holds_user_audio_until_session_resumed(
+        self,
+        mock_connect,
+        mock_call_event_handler,
+        mock_register_event_handler,
+        mock_parent_init,
+    ):
+        """Test that audio from before and during a reconnect never precedes the resumed session.update."""
+        mock_parent_init.return_value = None
+        service = OpenAIRealtimeLLMServiceExt(
+            Mock(),
+            Mock(),
+            client_event_sender_params=ClientEventSenderParams(max_audio_delay=10),
+            reconnect_params=ReconnectParams(initial_backoff=0, replay_conversation=False),
+        )
+        service._disconnecting = False
+        service._last_session_update = events.SessionUpdateEvent(
+            session=events.SessionProperties(instructions="Be brief.")
+        )
+        service._websocket = AsyncMock()
+        new_websocket = AsyncMock()
+
+        async def connect():
+            service._websocket = new_websocket
+
+        mock_connect.side_effect = connect
+        writer = asyncio.create_task(service._client_event_sender.run())
+        audio_frame = Mock()
+        audio_frame.audio = b"\x01\x02"
+
+        await service._send_user_audio(audio_frame)
+        await service._reconnect()
+        await service._send_user_audio(audio_frame)
+        await service._dispatch_server_event(Mock(type="session.created"))
+        await service._send_user_audio(audio_frame)
+        await service._client_event_sender.flush()
+        writer.cancel()
+
+        sent = [json.loads(c.args[0]) for c in new_websocket.send.await_args_list]
+        assert [event["type"] for event in sent] == ["session.update", "input_audio_buffer.append"]
+        assert base64.b64decode(sent[1]["audio"]) == b"\x01\x02"
+        assert service._resuming is False
+
+    @pytest.mark.asyncio
+    @patch.object(OpenAIRealtimeLLMService, "__init__")
+    @patch.object(OpenAIRealtimeLLMService, "_register_event_handler")
+    async def test_subclass_extends_server_event_handlers(
+        self,
+        mock_register_event_handler,
+        mock_parent_init,
+    ):
+        """Test that subclasses can add and remove server event handlers without copying the loop."""
+        mock_parent_init.return_value = None
+
+        class Subclass(OpenAIRealtimeLLMServiceExt):
+            _server_event_handlers = {
+                "rate_limits.updated": "_handle_evt_rate_limits_updated",
+                "response.output_text.delta": None,
+            }
+
+            async def _handle_evt_rate_limits_updated(self, evt):
+                self.rate_limits = evt
+
+        assert "session.created" in Subclass._server_event_handlers
+        assert Subclass._server_event_handlers["response.output_text.delta"] is None
+        assert "response.output_text.delta" in OpenAIRealtimeLLMServiceExt._server_event_handlers
+
+        service = Subclass(Mock(), Mock())
+        rate_limits_event = Mock()
+        rate_limits_event.type = "rate_limits.updated"
+        text_event = Mock()
+        text_event.type = "response.output_text.delta"
+
+        assert await service._dispatch_server_event(rate_limits_event) is True
+        assert await service._dispatch_server_event(text_event) is True
+        assert service.rate_limits is rate_limits_event
+        assert service.get_unhandled_server_event_counts() == {"response.output_text.delta": 1}
+
+    @pytest.mark.asyncio
+    @patch.object(OpenAIRealtimeLLMService, "__init__")
+    @patch.object(OpenAIRealtimeLLMService, "_register_event_handler")
+    async def test_removed_server_event_handler_stays_removed_in_grandchildren(
+        self,
+        mock_register_event_handler,
+        mock_parent_init,
+    ):
+        """Test that a handler removed by a subclass is not restored for its own subclasses."""
+        mock_parent_init.return_value = None
+
+        class Child(OpenAIRealtimeLLMServiceExt):
+            _server_event_handlers = {"response.output_text.delta": None}
+
+        class Grandchild(Child):
+            pass
+
+        class OtherGrandchild(Child):
+            _server_event_handlers = {"rate_limits.updated": "_handle_evt_rate_limits_updated"}
+
+            async def _handle_evt_rate_limits_updated(self, evt):
+                pass
+
+        text_event = Mock()
+        text_event.type = "response.output_text.delta"
+        for subclass in (Grandchild, OtherGrandchild):
+            service = subclass(Mock(), Mock())
+            assert await service._dispatch_server_event(text_event) is True
+            assert service.get_unhandled_server_event_counts() == {
+                "response.output_text.delta": 1
+            }
+        assert "rate_limits.updated" not in Grandchild._server_event_handlers
+
+    @pytest.mark.asyncio
+    @patch.object(OpenAIRealtimeLLMService, "__init__")
+    @patch.object(OpenAIRealtimeLLMService, "_register_event_handler")
+    async def test_register_server_event_handler(
+        self,
+        mock_register_event_handler,
+        mock_parent_init,
+    ):
+        """Test that plugins can register server event handlers on an instance."""
+        mock_parent_init.return_value = None
+        service = OpenAIRealtimeLLMServiceExt(Mock(), Mock())
+        other_service = OpenAIRealtimeLLMServiceExt(Mock(), Mock())
+        handler = AsyncMock(return_value=False)
+
+        service.register_server_event_handler("response.created", handler)
+        mock_event = Mock()
+        mock_event.type = "response.created"
+
+        assert await service._dispatch_server_event(mock_event) is False
+        handler.assert_awaited_once_with(service, mock_event)
+        assert await other_service._dispatch_server_event(mock_event) is True
+
+    @pytest.mark.asyncio
+    @patch.object(OpenAIRealtimeLLMService, "__init__")
+    @patch.object(OpenAIRealtimeLLMService, "_register_event_handler")
+    @patch.object(OpenAIRealtimeLLMService, "_handle_evt_audio_done", new_callable=AsyncMock)
+    async def test_receive_task_handler_fast_audio_delta_parsing(
+        self,
+        mock_handle_evt_audio_done,
+        mock_register_event_handler,
+        mock_parent_init,
+    ):
+        """Test that fast_audio_delta_parsing reads raw frames and pushes decoded audio."""
+        mock_parent_init.return_value = None
+
+        audio_delta = (
+            b'{"type":"response.output_audio.delta","event_id":"event_1","response_id":"resp_1",'
+            b'"item_id":"item_1","output_index":0,"content_index":0,"delta":"AAECAw=="}'
+        )
+        audio_done = events.ResponseAudioDone(
+            event_id="event_2",
+            type="response.output_audio.done",
+            response_id="resp_1",
+            item_id="item_1",
+            output_index=0,
+            content_index=0,
+        ).model_dump_json().encode()
+
+        mock_websocket = AsyncMock()
+        mock_websocket.recv.side_effect = [audio_delta, audio_done, ConnectionClosedOK(None, None)]
+
+        service = OpenAIRealtimeLLMServiceExt(Mock(), Mock(), fast_audio_delta_parsing=True)
+        service._websocket = mock_websocket
+        service._current_audio_response = None
+        service.stop_ttfb_metrics = AsyncMock()
+        service.push_frame = AsyncMock()
+
+        await asyncio.wait_for(service._receive_task_handler(), timeout=1.0)
+
+        mock_websocket.recv.assert_awaited_with(decode=False)
+        pushed = [c.args[0] for c in service.push_frame.await_args_list]
+        assert isinstance(pushed[0], TTSStartedFrame)
+        assert isinstance(pushed[1], TTSAudioRawFrame)
+        assert pushed[1].audio == b"\x00\x01\x02\x03"
+        assert service._current_audio_response.item_id == "item_1"
+        assert service._current_audio_response.total_size == 4
+        mock_handle_evt_audio_done.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    @patch.object(OpenAIRealtimeLLMService, "__init__")
+    @patch.object(OpenAIRealtimeLLMService, "_register_event_handler")
+    @patch.object(OpenAIRealtimeLLMService, "_handle_evt_conversation_item_added", new_callable=AsyncMock)
+    @patch.object(OpenAIRealtimeLLMService, "_call_event_handler", new_callable=AsyncMock)
+    async def test_conversation_store_tracks_items(
+        self,
+        mock_call_event_handler,
+        mock_handle_evt_conversation_item_added,
+        mock_register_event_handler,
+        mock_parent_init,
+    ):
+        """Test that conversation items are mirrored in the conversation store."""
+        mock_parent_init.return_value = None
+        service = OpenAIRealtimeLLMServiceExt(Mock(), Mock())
+
+        for item_id, previous_item_id in [("a", None), ("c", "a"), ("b", "a")]:
+            await service._dispatch_server_event(
+                events.ConversationItemAdded(
+                    event_id=f"event_{item_id}",
+                    type="conversation.item.added",
+                    previous_item_id=previous_item_id,
+                    item=events.ConversationItem(id=item_id, type="message", role="user"),
+                )
+            )
+        await service._dispatch_server_event(
+            events.ConversationItemDeleted(
+                event_id="event_delete",
+                type="conversation.item.deleted",
+                item_id="c",
+            )
+        )
+
+        assert [item.id for item in service.conversation.snapshot()] == ["a", "b"]
+        assert mock_handle_evt_conversation_item_added.await_count == 3
+        mock_call_event_handler.assert_awaited_once_with("on_conversation_item_deleted", "c")
+
+    @pytest.mark.asyncio
+    @patch.object(OpenAIRealtimeLLMService, "__init__")
+    @patch.object(OpenAIRealtimeLLMService, "_register_event_handler")
+    @patch.object(OpenAIRealtimeLLMService, "send_client_event", new_callable=AsyncMock)
+    async def test_send_client_events_uses_batched_sender(
+        self,
+        mock_send_client_event,
+        mock_register_event_handler,
+        mock_parent_init,
+    ):
+        """Test that client events and user audio go through the batched sender when configured."""
+        mock_parent_init.return_value = None
+        service = OpenAIRealtimeLLMServiceExt(
+            Mock(), Mock(), client_event_sender_params=ClientEventSenderParams(max_audio_delay=10)
+        )
+        service._websocket = AsyncMock()
+        service._disconnecting = False
+        writer = asyncio.create_task(service._client_event_sender.run())
+
+        audio_frame = Mock()
+        audio_frame.audio = b"\x01\x02"
+        await service._send_user_audio(audio_frame)
+        await service.send_client_events(
+            [events.InputAudioBufferCommitEvent(), events.ResponseCreateEvent()]
+        )
+        await service._client_event_sender.flush()
+        writer.cancel()
+
+        sent = [c.args[0] for c in service._websocket.send.await_args_list]
+        assert [json.loads(payload)["type"] for payload in sent] == [
+            "input_audio_buffer.append",
+            "input_audio_buffer.commit",
+            "response.create",
+        ]
+        service._websocket.send.assert_awaited_with(sent[-1], text=True)
+        mock_send_client_event.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    @patch.object(OpenAIRealtimeLLMService, "__init__")
+    @patch.object(OpenAIRealtimeLLMService, "_register_event_handler")
+    @patch.object(OpenAIRealtimeLLMService, "_handle_evt_response_done", new_callable=AsyncMock)
+    async def test_deliver_async_tool_results(
+        self,
+        mock_handle_evt_response_done,
+        mock_register_event_handler,
+        mock_parent_init,
+    ):
+        """Test that tool results are injected as one item and the response waits for response.done."""
+        mock_parent_init.return_value = None
+        service = OpenAIRealtimeLLMServiceExt(Mock(), Mock())
+        service._messages_added_manually = {}
+        service._session_properties = events.SessionProperties()
+        service.send_client_events = AsyncMock()
+        service.send_client_event = AsyncMock()
+
+        response_created = Mock()
+        response_created.type = "response.created"
+        await service._dispatch_server_event(response_created)
+        await service._deliver_async_tool_results(
+            [
+                AsyncToolResult(function_name="a", tool_call_id="call_1", result={"x": 1}),
+                AsyncToolResult(function_name="b", tool_call_id="call_2", result="y"),
+            ]
+        )
+
+        [item_event] = service.send_client_events.await_args.args[0]
+        assert item_event.item.content[0].text == (
+            '<tool_result>{"tool_name": "a", "result": {"x": 1}}</tool_result>'
+            '<tool_result>{"tool_name": "b", "result": "y"}</tool_result>'
+        )
+        assert service._messages_added_manually == {item_event.item.id: True}
+        service.send_client_event.assert_not_awaited()
+
+        response_done = Mock()
+        response_done.type = "response.done"
+        await service._dispatch_server_event(response_done)
+
+        mock_handle_evt_response_done.assert_awaited_once_with(response_done)
+        assert service.send_client_event.await_args.args[0].type == "response.create"
+
+    @pytest.mark.asyncio
+    @patch.object(OpenAIRealtimeLLMService, "__init__")
+    @patch.object(OpenAIRealtimeLLMService, "_register_event_handler")
+    async def test_session_update_sends_changed_fields(
+        self,
+        mock_register_event_handler,
+        mock_parent_init,
+    ):
+        """Test that session.update sends the full session once, then only what changed."""
+        mock_parent_init.return_value = None
+        service = OpenAIRealtimeLLMServiceExt(Mock(), Mock())
+        service._websocket = AsyncMock()
+        service._disconnecting = False
+        session = events.SessionProperties(instructions="Be helpful.", tools=[])
+
+        await service.send_client_event(events.SessionUpdateEvent(session=session))
+        await service.send_client_event(events.SessionUpdateEvent(session=session))
+        session.tools = [{"type": "function", "name": "lookup"}]
+        await service.send_client_event(events.SessionUpdateEvent(session=session))
+
+        sent = [json.loads(c.args[0]) for c in service._websocket.send.await_args_list]
+        assert [payload["session"] for payload in sent] == [
+            {"type": "realtime", "instructions": "Be helpful.", "tools": []},
+            {"type": "realtime", "tools": [{"type": "function", "name": "lookup"}]},
+        ]
+        assert service._last_session_update.session is session
@@ -0,0 +1,88 @@
+from pipecat_extension.services.openai_realtime_metrics import (
+    InMemoryMetricsSink,
+    MetricStats,
+    PrometheusMetricsSink,
+)
+
+
+class TestInMemoryMetricsSink:
+    """Unit tests for InMemoryMetricsSink."""
+
+    def test_snapshot_summarizes_server_events(self):
+        """Test that server event timings are aggregated per event type and stage."""
+        sink = InMemoryMetricsSink(buckets=(0.001, 0.01, 0.1))
+        for dispatch_time in (0.0005, 0.0005, 0.05):
+            sink.observe_server_event("response.output_audio.delta", 0.0002, dispatch_time, 3)
+        sink.observe_server_event("response.done", 0.002, 0.2, 1)
+
+        snapshot = sink.snapshot()
+
+        audio = snapshot["server_events"]["response.output_audio.delta"]
+        assert isinstance(audio["parse"], MetricStats)
+        assert audio["parse"].count == 3
+        assert audio["parse"].max == 0.0002
+        assert audio["parse"].p99 == 0.001
+        assert audio["dispatch"].count == 3
+        assert audio["dispatch"].p50 == 0.001
+        assert audio["dispatch"].p99 == 0.1
+        assert snapshot["server_events"]["response.done"]["dispatch"].p99 == 0.2
+        assert snapshot["queue_depth_frames"] == 1
+        assert snapshot["max_queue_depth_frames"] == 3
+
+    def test_snapshot_summarizes_event_handlers(self):
+        """Test that event handler run times are aggregated per event name."""
+        sink = InMemoryMetricsSink()
+        sink.observe_event_handler("on_conversation_item_deleted", 0.003)
+        sink.observe_event_handler("on_conversation_item_deleted", 0.001)
+
+        stats = sink.snapshot()["event_handlers"]["on_conversation_item_deleted"]
+
+        assert stats.count == 2
+        assert stats.max == 0.003
+
+    def test_reset(self):
+        """Test that reset discards everything recorded."""
+        sink = InMemoryMetricsSink()
+        sink.observe_server_event("response.done", 0.001, 0.001, 5)
+        sink.observe_event_handler("after_function_call_output_sent", 0.001)
+
+        sink.reset()
+
+        assert sink.snapshot() == {
+            "server_events": {},
+            "event_handlers": {},
+            "queue_depth_frames": 0,
+            "max_queue_depth_frames": 0,
+        }
+
+
+class TestPrometheusMetricsSink:
+    """Unit tests for PrometheusMetricsSink."""
+
+    def test_render(self):
+        """Test that histograms render as cumulative Prometheus buckets with constant labels."""
+        sink = PrometheusMetricsSink(buckets=(0.01, 0.1), labels={"session": "abc"})
+        sink.observe_server_event("response.done", 0.005, 0.05, 2)
+        sink.observe_event_handler("on_conversation_item_deleted", 0.5)
+
+        text = sink.render()
+
+        assert "# TYPE pipecat_realtime_server_event_seconds histogram" in text
+        assert (
+            'pipecat_realtime_server_event_seconds_bucket{session="abc",event_type="response.done",'
+            'stage="dispatch",le="0.01"} 0'
+        ) in text
+        assert (
+            'pipecat_realtime_server_event_seconds_bucket{session="abc",event_type="response.done",'
+            'stage="dispatch",le="0.1"} 1'
+        ) in text
+        assert (
+            'pipecat_realtime_event_handler_seconds_bucket{session="abc",'
+            'event_name="on_conversation_item_deleted",le="+Inf"} 1'
+        ) in text
+        assert (
+            'pipecat_realtime_event_handler_seconds_count{session="abc",'
+            'event_name="on_conversation_item_deleted"} 1'
+        ) in text
+        assert 'pipecat_realtime_receive_queue_depth_frames_max{session="abc"} 2' in text
+        assert text.endswith("\n")
@@ -0,0 +1,121 @@
+from pipecat.services.openai.realtime import events
+
+from pipecat_extension.services.openai_realtime_reconnect import (
+    ReconnectParams,
+    classify_realtime_error,
+    conversation_replay_events,
+)
+
+
+def make_error(type: str, code: str = "") -> events.RealtimeError:
+    return events.RealtimeError(type=type, code=code, message="message")
+
+
+class TestClassifyRealtimeError:
+    """Unit tests for classify_realtime_error."""
+
+    def test_client_event_errors_are_ignored(self):
+        """Test that errors caused by a single client event do not end the session."""
+        assert classify_realtime_error(make_error("invalid_request_error", "invalid_value")) == "ignore"
+        assert (
+            classify_realtime_error(
+                make_error("invalid_request_error", "conversation_already_has_active_response")
+            )
+            == "ignore"
+        )
+
+    def test_lost_sessions_reconnect(self):
+        """Test that expired sessions and server errors reconnect."""
+        assert (
+            classify_realtime_error(make_error("invalid_request_error", "session_expired"))
+            == "reconnect"
+        )
+        assert classify_realtime_error(make_error("server_error")) == "reconnect"
+
+    def test_credentials_and_quota_are_fatal(self):
+        """Test that errors a new connection would hit again are fatal."""
+        assert classify_realtime_error(make_error("invalid_request_error", "invalid_api_key")) == "fatal"
+        assert classify_realtime_error(make_error("insufficient_quota", "insufficient_quota")) == "fatal"
+        assert classify_realtime_error(make_error("something_new")) == "fatal"
+
+
+class TestReconnectParams:
+    """Unit tests for ReconnectParams."""
+
+    def test_backoff_delays(self):
+        """Test that delays grow exponentially up to max_backoff for max_attempts attempts."""
+        params = ReconnectParams(
+            max_attempts=5, initial_backoff=1, max_backoff=5, backoff_multiplier=2, jitter=0
+        )
+
+        assert list(params.backoff_delays()) == [1, 2, 4, 5, 5]
+
+    def test_backoff_jitter(self):
+        """Test that jitter only ever shortens a delay."""
+        params = ReconnectParams(max_attempts=20, initial_backoff=1, max_backoff=1, jitter=0.5)
+
+        assert all(0.5 <= delay <= 1 for delay in params.backoff_delays())
+
+
+class TestConversationReplayEvents:
+    """Unit tests for conversation_replay_events."""
+
+    def test_replays_text_instead_of_audio(self):
+        """Test that audio is replaced by transcripts and items without text are skipped."""
+        items = (
+            events.ConversationItem(
+                id="user_1",
+                type="message",
+                role="user",
+                status="completed",
+                content=[events.ItemContent(type="input_audio", audio="AAAA", transcript="Hi")],
+            ),
+            events.ConversationItem(
+                id="assistant_1",
+                type="message",
+                role="assistant",
+                content=[events.ItemContent(type="output_audio", audio="AAAA", transcript="Hello")],
+            ),
+            events.ConversationItem(
+                id="user_2",
+                type="message",
+                role="user",
+                content=[events.ItemContent(type="input_audio", audio="AAAA")],
+            ),
+            events.ConversationItem(
+                id="call_item", type="function_call", call_id="call_1", name="lookup", arguments="{}"
+            ),
+            events.ConversationItem(
+                id="output_item", type="function_call_output", call_id="call_1", output='"ok"'
+            ),
+        )
+
+        replay = [event.model_dump(exclude_none=True) for event in conversation_replay_events(items)]
+
+        assert [event["item"] for event in replay] == [
+            {
+                "id": "user_1",
+                "type": "message",
+                "role": "user",
+                "content": [{"type": "input_text", "text": "Hi"}],
+            },
+            {
+                "id": "assistant_1",
+                "type": "message",
+                "role": "assistant",
+                "content": [{"type": "output_text", "text": "Hello"}],
+            },
+            {
+                "id": "call_item",
+                "type": "function_call",
+                "call_id": "call_1",
+                "name": "lookup",
+                "arguments": "{}",
+            },
+            {
+                "id": "output_item",
+                "type": "function_call_output",
+                "call_id": "call_1",
+                "output": '"ok"',
+            },
+        ]
@@ -0,0 +1,114 @@
+import asyncio
+import gzip
+import json
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+from websockets.asyncio.client import connect
+
+from pipecat.services.openai.realtime.llm import OpenAIRealtimeLLMService
+
+from pipecat_extension.services.openai_realtime_llm_service import OpenAIRealtimeLLMServiceExt
+from pipecat_extension.services.openai_realtime_replay import (
+    RealtimeRecording,
+    RealtimeReplayServer,
+    RealtimeSessionRecorder,
+)
+
+
+def item_added(item_id: str, previous_item_id=None) -> str:
+    return json.dumps(
+        {
+            "type": "conversation.item.added",
+            "event_id": f"event_{item_id}",
+            "previous_item_id": previous_item_id,
+            "item": {"id": item_id, "type": "message", "role": "user", "content": []},
+        }
+    )
+
+
+class TestRealtimeRecording:
+    def test_save_and_load_round_trip(self, tmp_path):
+        """Test that a saved recording loads back unchanged."""
+        recording = RealtimeRecording(events=[(0.0, '{"type":"a"}'), (0.25, '{"type":"b"}')])
+        path = tmp_path / "session.rec.gz"
+
+        recording.save(path)
+
+        assert RealtimeRecording.load(path) == recording
+        assert recording.duration == 0.25
+
+    def test_load_rejects_wrong_header(self, tmp_path):
+        """Test that a gzip file with the wrong header raises ValueError."""
+        path = tmp_path / "other.gz"
+        with gzip.open(path, "wt") as f:
+            f.write("# something else\n")
+
+        with pytest.raises(ValueError):
+            RealtimeRecording.load(path)
+
+
+class TestRealtimeSessionRecorder:
+    @patch("pipecat_extension.services.openai_realtime_replay.time.monotonic")
+    def test_record_offsets_from_first_event(self, mock_monotonic):
+        """Test that offsets are relative to the first event and bytes are decoded."""
+        mock_monotonic.side_effect = [100.0, 100.5]
+        recorder = RealtimeSessionRecorder()
+
+        recorder.record(b'{"type":"a"}')
+        recorder.record('{\n  "type": "b"\n}')
+
+        assert recorder.recording.events == [(0.0, '{"type":"a"}'), (0.5, '{"type":"b"}')]
+
+
+class TestRealtimeReplayServer:
+    @pytest.mark.asyncio
+    async def test_replays_events_and_collects_client_events(self):
+        """Test that the server replays the recording and keeps what the client sent."""
+        recording = RealtimeRecording(events=[(0.0, '{"type":"a"}'), (0.01, '{"type":"b"}')])
+
+        async with RealtimeReplayServer(recording, speed=None, close_when_done=False) as server:
+            async with connect(server.url) as websocket:
+                await websocket.send('{"type":"session.update"}')
+                received = [json.loads(await websocket.recv()) for _ in range(2)]
+
+        assert received == [{"type": "a"}, {"type": "b"}]
+        assert server.client_events == [[{"type": "session.update"}]]
+
+    @pytest.mark.asyncio
+    @patch.object(OpenAIRealtimeLLMService, "__init__")
+    @patch.object(OpenAIRealtimeLLMService, "_register_event_handler")
+    @patch.object(
+        OpenAIRealtimeLLMService, "_handle_evt_conversation_item_added", new_callable=AsyncMock
+    )
+    @patch.object(OpenAIRealtimeLLMService, "_call_event_handler", new_callable=AsyncMock)
+    async def test_service_receives_replayed_session(
+        self,
+        mock_call_event_handler,
+        mock_handle_evt_conversation_item_added,
+        mock_register_event_handler,
+        mock_parent_init,
+    ):
+        """Test that the service receive loop processes a replayed session and records it."""
+        mock_parent_init.return_value = None
+        recording = RealtimeRecording(
+            events=[
+                (0.0, item_added("a")),
+                (0.001, item_added("b", "a")),
+                (0.002, '{"type":"rate_limits.updated","event_id":"e","rate_limits":[]}'),
+                (0.003, '{"type":"conversation.item.deleted","event_id":"d","item_id":"a"}'),
+            ]
+        )
+        recorder = RealtimeSessionRecorder()
+        service = OpenAIRealtimeLLMServiceExt(Mock(), Mock(), session_recorder=recorder)
+
+        async with RealtimeReplayServer(recording, speed=10) as server:
+            async with connect(server.url) as websocket:
+                service._websocket = websocket
+                await asyncio.wait_for(service._receive_task_handler(), timeout=1.0)
+
+        assert [item.id for item in service.conversation.snapshot()] == ["b"]
+        assert service.get_unhandled_server_event_counts() == {"rate_limits.updated": 1}
+        assert [message for _, message in recorder.recording.events] == [
+            message for _, message in recording.events
+        ]
@@ -0,0 +1,167 @@
+import asyncio
+import base64
+import json
+
+import pytest
+import pytest_asyncio
+
+from pipecat.services.openai.realtime import events
+from pydantic_core import to_json
+
+from pipecat_extension.services.openai_realtime_sender import (
+    ClientEventSender,
+    ClientEventSenderParams,
+    encode_input_audio_append,
+)
+
+
+class RecordingSocket:
+    def __init__(self, delay: float = 0):
+        self.delay = delay
+        self.sent = []
+
+    async def send(self, payload: bytes):
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        self.sent.append(json.loads(payload))
+
+
+@pytest_asyncio.fixture
+async def run_sender():
+    tasks = []
+
+    def _run(sender: ClientEventSender):
+        tasks.append(asyncio.create_task(sender.run()))
+        return sender
+
+    yield _run
+    for task in tasks:
+        task.cancel()
+
+
+class TestClientEventSender:
+    """Unit tests for ClientEventSender."""
+
+    @pytest.mark.asyncio
+    async def test_send_many_flushes_events_in_order(self, run_sender):
+        """Test that queued events are serialized like send_client_event and sent in order."""
+        socket = RecordingSocket()
+        sender = run_sender(ClientEventSender(socket.send))
+        client_events = [
+            events.ConversationItemCreateEvent(
+                item=events.ConversationItem(type="function_call_output", call_id="c", output="{}")
+            ),
+            events.ResponseCreateEvent(),
+        ]
+
+        await sender.send_many(client_events)
+        await sender.flush()
+
+        assert socket.sent == [event.model_dump(exclude_none=True) for event in client_events]
+        assert sender.events_sent == 2
+
+    @pytest.mark.asyncio
+    async def test_session_update_serialized_like_send_client_event(self, run_sender):
+        """Test that a disabled turn_detection is sent as null, as SessionUpdateEvent.model_dump does."""
+        socket = RecordingSocket()
+        sender = run_sender(ClientEventSender(socket.send))
+        event = events.SessionUpdateEvent(
+            session=events.SessionProperties(
+                audio=events.AudioConfiguration(
+                    input=events.AudioInput(turn_detection=False)
+                )
+            )
+        )
+
+        await sender.send(event)
+        await sender.flush()
+
+        assert socket.sent == [event.model_dump(exclude_none=True)]
+        assert socket.sent[0]["session"]["audio"]["input"]["turn_detection"] is None
+
+    def test_input_audio_append_encoded_like_pydantic(self):
+        """Test that appends are encoded to the same bytes as InputAudioBufferAppendEvent."""
+        audio = bytes(range(256)) * 4
+        event = events.InputAudioBufferAppendEvent(
+            event_id="event_1", audio=base64.b64encode(audio).decode()
+        )
+
+        assert encode_input_audio_append(bytearray(audio), "event_1") == to_json(
+            event, exclude_none=True
+        )
+        assert json.loads(encode_input_audio_append(b""))["event_id"]
+
+    @pytest.mark.asyncio
+    async def test_audio_coalesced_up_to_size_budget(self, run_sender):
+        """Test that consecutive audio chunks are merged until max_audio_bytes is reached."""
+        socket = RecordingSocket()
+        params = ClientEventSenderParams(max_audio_bytes=6, max_audio_delay=10)
+        sender = run_sender(ClientEventSender(socket.send, params))
+
+        for chunk in (b"\x01\x02", b"\x03\x04", b"\x05\x06", b"\x07\x08"):
+            await sender.append_audio(chunk)
+        await asyncio.sleep(0.01)
+
+        assert [event["type"] for event in socket.sent] == ["input_audio_buffer.append"]
+        assert base64.b64decode(socket.sent[0]["audio"]) == b"\x01\x02\x03\x04\x05\x06"
+        assert sender.audio_chunks_coalesced == 2
+
+    @pytest.mark.asyncio
+    async def test_audio_flushed_after_time_budget(self, run_sender):
+        """Test that buffered audio is sent once max_audio_delay elapses."""
+        socket = RecordingSocket()
+        params = ClientEventSenderParams(max_audio_bytes=1000, max_audio_delay=0.02)
+        sender = run_sender(ClientEventSender(socket.send, params))
+
+        await sender.append_audio(b"\x01\x02")
+        await asyncio.sleep(0)
+        assert socket.sent == []
+
+        await asyncio.sleep(0.05)
+        assert len(socket.sent) == 1
+        assert base64.b64decode(socket.sent[0]["audio"]) == b"\x01\x02"
+
+    @pytest.mark.asyncio
+    async def test_audio_flushed_before_control_events(self, run_sender):
+        """Test that buffered audio is sent ahead of a later control event."""
+        socket = RecordingSocket()
+        params = ClientEventSenderParams(max_audio_bytes=1000, max_audio_delay=10)
+        sender = run_sender(ClientEventSender(socket.send, params))
+
+        await sender.append_audio(b"\x01\x02")
+        await sender.send(events.InputAudioBufferCommitEvent())
+        await sender.flush()
+
+        assert [event["type"] for event in socket.sent] == [
+            "input_audio_buffer.append",
+            "input_audio_buffer.commit",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_backpressure_blocks_producers(self, run_sender):
+        """Test that producers wait while max_pending_bytes are queued or in flight."""
+        socket = RecordingSocket(delay=0.05)
+        params = ClientEventSenderParams(max_pending_bytes=1)
+        sender = run_sender(ClientEventSender(socket.send, params))
+
+        await sender.send(events.ResponseCreateEvent())
+        second = asyncio.create_task(sender.send(events.ResponseCancelEvent()))
+        await asyncio.sleep(0.01)
+        assert not second.done()
+
+        await asyncio.wait_for(second, timeout=1.0)
+        await sender.flush()
+        assert [event["type"] for event in socket.sent] == ["response.create", "response.cancel"]
+
+    @pytest.mark.asyncio
+    async def test_clear_drops_pending_events(self):
+        """Test that clear drops queued events and buffered audio."""
+        socket = RecordingSocket()
+        sender = ClientEventSender(socket.send)
+
+        await sender.append_audio(b"\x01\x02")
+        await sender.send(events.ResponseCreateEvent())
+        sender.clear()
+
+        await asyncio.wait_for(sender.flush(), timeout=1.0)
+        assert socket.sent == []
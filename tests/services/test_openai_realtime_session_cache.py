@@ -0,0 +1,72 @@
+import json
+
+from pipecat.services.openai.realtime import events
+
+from pipecat_extension.services.openai_realtime_session_cache import (
+    SessionUpdateCache,
+    changed_session_fields,
+    session_fields,
+)
+
+TOOLS = [{"type": "function", "name": "lookup", "parameters": {"type": "object"}}]
+
+
+def make_session(**kwargs) -> events.SessionProperties:
+    return events.SessionProperties(**{"instructions": "Be helpful.", "tools": TOOLS, **kwargs})
+
+
+class TestSessionUpdateCache:
+    """Unit tests for SessionUpdateCache."""
+
+    def test_payload_matches_send_client_event(self):
+        """Test that cached payloads match the base service's serialization without event_id."""
+        session = make_session(
+            audio=events.AudioConfiguration(input=events.AudioInput(turn_detection=False))
+        )
+        event = events.SessionUpdateEvent(session=session)
+        expected = event.model_dump(exclude_none=True)
+        del expected["event_id"]
+
+        assert json.loads(SessionUpdateCache().encode(session)) == expected
+
+    def test_equal_sessions_share_a_payload(self):
+        """Test that sessions with the same content reuse one payload object."""
+        cache = SessionUpdateCache()
+
+        first = cache.encode(make_session())
+        second = cache.encode(make_session())
+        cache.encode(make_session(instructions="Be brief."))
+
+        assert first is second
+        assert (cache.hits, cache.misses) == (1, 2)
+
+    def test_partial_payload(self):
+        """Test that only the requested fields and the session type are sent."""
+        session = make_session()
+
+        payload = json.loads(SessionUpdateCache().encode(session, only=["type", "tools"]))
+
+        assert payload == {"type": "session.update", "session": {"type": "realtime", "tools": TOOLS}}
+
+    def test_evicts_least_recently_used(self):
+        """Test that the cache keeps at most max_entries payloads."""
+        cache = SessionUpdateCache(max_entries=1)
+
+        cache.encode(make_session())
+        cache.encode(make_session(instructions="Be brief."))
+        cache.encode(make_session())
+
+        assert cache.misses == 3
+
+
+class TestChangedSessionFields:
+    """Unit tests for changed_session_fields."""
+
+    def test_reports_changed_fields_and_type(self):
+        """Test that changed fields are reported along with the required type."""
+        previous = session_fields(make_session())
+        tools = TOOLS + [{"type": "function", "name": "transfer"}]
+
+        current = session_fields(events.SessionProperties(instructions="Be helpful.", tools=tools))
+
+        assert changed_session_fields(previous, current) == ["type", "tools"]
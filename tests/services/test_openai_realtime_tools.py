@@ -0,0 +1,172 @@
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from pipecat_extension.services.openai_realtime_tools import (
+    AsyncToolCallEngine,
+    AsyncToolCallParams,
+)
+
+
+def make_params(tool_call_id: str, function_name: str = "lookup") -> Mock:
+    params = Mock()
+    params.function_name = function_name
+    params.tool_call_id = tool_call_id
+    params.result_callback = AsyncMock()
+    return params
+
+
+class TestAsyncToolCallEngine:
+    """Unit tests for AsyncToolCallEngine."""
+
+    @pytest.mark.asyncio
+    async def test_returns_pending_and_delivers_result_after_acknowledge(self):
+        """Test that the tool answers PENDING and its result waits for the pending output to be sent."""
+        deliver = AsyncMock()
+        engine = AsyncToolCallEngine(deliver, AsyncToolCallParams(batch_window=0))
+
+        async def lookup(params):
+            return {"name": "James"}
+
+        params = make_params("call_1")
+        await engine.function(lookup)(params)
+        params.result_callback.assert_awaited_once_with({"status": "PENDING"})
+
+        await asyncio.sleep(0.01)
+        deliver.assert_not_awaited()
+
+        engine.acknowledge("call_1")
+        await asyncio.sleep(0.01)
+        deliver.assert_awaited_once()
+        [result] = deliver.await_args.args[0]
+        assert result.tool_call_id == "call_1"
+        assert result.result == {"name": "James"}
+        assert engine.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_batches_completions_within_window(self):
+        """Test that results completing close together are delivered in one batch."""
+        deliver = AsyncMock()
+        engine = AsyncToolCallEngine(deliver, AsyncToolCallParams(batch_window=0.05))
+        function = engine.function(lambda params: params.tool_call_id)
+
+        for tool_call_id in ("call_1", "call_2"):
+            await function(make_params(tool_call_id))
+            engine.acknowledge(tool_call_id)
+        await asyncio.sleep(0.1)
+
+        deliver.assert_awaited_once()
+        assert [result.result for result in deliver.await_args.args[0]] == ["call_1", "call_2"]
+
+    @pytest.mark.asyncio
+    async def test_timeout_and_errors_are_delivered(self):
+        """Test that timeouts and exceptions are delivered as error results."""
+        deliver = AsyncMock()
+        engine = AsyncToolCallEngine(deliver, AsyncToolCallParams(batch_window=0))
+
+        async def slow(params):
+            await asyncio.sleep(1)
+
+        async def broken(params):
+            raise ValueError("boom")
+
+        await engine.function(slow, timeout=0.01)(make_params("call_1"))
+        await engine.function(broken)(make_params("call_2"))
+        engine.acknowledge("call_1")
+        engine.acknowledge("call_2")
+        await asyncio.sleep(0.05)
+
+        results = [result for c in deliver.await_args_list for result in c.args[0]]
+        assert {result.tool_call_id: result.result["status"] for result in results} == {
+            "call_1": "ERROR",
+            "call_2": "ERROR",
+        }
+
+    @pytest.mark.asyncio
+    async def test_bounded_concurrency(self):
+        """Test that at most max_concurrency tools run at the same time."""
+        running = 0
+        peak = 0
+
+        async def tool(params):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+        engine = AsyncToolCallEngine(AsyncMock(), AsyncToolCallParams(max_concurrency=2))
+        for i in range(6):
+            await engine.function(tool)(make_params(f"call_{i}"))
+        await asyncio.sleep(0.1)
+
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_cancel_interruptible(self):
+        """Test that interruptible tools are cancelled and reported, others keep running."""
+        deliver = AsyncMock()
+        engine = AsyncToolCallEngine(deliver, AsyncToolCallParams(batch_window=0))
+
+        async def slow(params):
+            await asyncio.sleep(0.05)
+            return "done"
+
+        await engine.function(slow)(make_params("call_1"))
+        await engine.function(slow, cancel_on_interruption=False)(make_params("call_2"))
+        engine.acknowledge("call_1")
+        engine.acknowledge("call_2")
+        await asyncio.sleep(0)
+
+        engine.cancel_interruptible()
+        await asyncio.sleep(0.1)
+
+        results = {result.tool_call_id: result for c in deliver.await_args_list for result in c.args[0]}
+        assert results["call_1"].cancelled is True
+        assert results["call_1"].result == {"status": "CANCELLED"}
+        assert results["call_2"].result == "done"
+
+    @pytest.mark.asyncio
+    async def test_cancel_all_drops_results(self):
+        """Test that cancel_all cancels running tools without delivering anything."""
+        deliver = AsyncMock()
+        engine = AsyncToolCallEngine(deliver, AsyncToolCallParams(batch_window=0))
+
+        async def slow(params):
+            await asyncio.sleep(1)
+
+        await engine.function(slow)(make_params("call_1"))
+        engine.acknowledge("call_1")
+        engine.cancel_all()
+        await asyncio.sleep(0.01)
+
+        deliver.assert_not_awaited()
+        assert engine.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_reused_tool_call_id_keeps_newer_call(self):
+        """Test that an older call finishing does not untrack a newer call with the same id."""
+        deliver = AsyncMock()
+        engine = AsyncToolCallEngine(deliver, AsyncToolCallParams(batch_window=0))
+        release = asyncio.Event()
+
+        async def slow(params):
+            await release.wait()
+            return "old"
+
+        await engine.function(slow)(make_params("call_1"))
+        engine.acknowledge("call_1")
+        await engine.function(lambda params: "new")(make_params("call_1"))
+        release.set()
+        await asyncio.sleep(0.01)
+
+        assert engine.in_flight == 1
+        engine.acknowledge("call_1")
+        await asyncio.sleep(0.01)
+
+        assert [result.result for c in deliver.await_args_list for result in c.args[0]] == [
+            "old",
+            "new",
+        ]
+        assert engine.in_flight == 0
@@ -0,0 +1,129 @@
+import asyncio
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from pipecat.services.openai.realtime import events
+
+from pipecat_extension.services import openai_realtime_worker
+from pipecat_extension.services.openai_realtime_worker import (
+    RealtimeWorker,
+    RealtimeWorkerParams,
+    SessionRejectedError,
+)
+
+
+def make_runner(release: asyncio.Event) -> MagicMock:
+    async def run(task):
+        await release.wait()
+
+    runner = MagicMock()
+    runner.run = AsyncMock(side_effect=run)
+    return runner
+
+
+class TestRealtimeWorker:
+    """Unit tests for RealtimeWorker."""
+
+    def test_session_properties_are_copied(self):
+        """Test that sessions share nested tool schemas but not the top-level properties."""
+        tools = [{"type": "function", "name": "lookup"}]
+        worker = RealtimeWorker(session_properties=events.SessionProperties(tools=tools))
+
+        first = worker.session_properties()
+        second = worker.session_properties()
+        first.instructions = "Be brief."
+
+        assert second.instructions is None
+        assert first.tools is second.tools
+
+    @patch("pipecat_extension.services.openai_realtime_worker.OpenAIRealtimeLLMServiceExt")
+    def test_create_service_shares_ssl_context(self, mock_service):
+        """Test that every service gets the worker's SSL context."""
+        worker = RealtimeWorker()
+
+        worker.create_service(api_key="key")
+        worker.create_service(api_key="key")
+
+        contexts = [call.kwargs["ssl_context"] for call in mock_service.call_args_list]
+        assert contexts == [worker.ssl_context, worker.ssl_context]
+
+    @pytest.mark.asyncio
+    async def test_session_limit(self):
+        """Test that sessions over max_sessions are rejected and running ones are tracked."""
+        worker = RealtimeWorker(RealtimeWorkerParams(max_sessions=1))
+        release = asyncio.Event()
+
+        session = asyncio.create_task(worker.run_session(MagicMock(), runner=make_runner(release)))
+        await asyncio.sleep(0)
+        assert worker.active_sessions == 1
+
+        with pytest.raises(SessionRejectedError):
+            await worker.run_session(MagicMock(), runner=make_runner(release))
+        assert worker.rejected_sessions == 1
+
+        release.set()
+        await session
+        assert worker.active_sessions == 0
+
+    @pytest.mark.asyncio
+    async def test_cpu_admission_uses_per_session_share(self):
+        """Test that a session is rejected when one more session's CPU share would not fit."""
+        worker = RealtimeWorker(RealtimeWorkerParams(max_cpu_utilization=0.8, smoothing=1.0))
+        release = asyncio.Event()
+        for _ in range(2):
+            asyncio.create_task(worker.run_session(MagicMock(), runner=make_runner(release)))
+        await asyncio.sleep(0)
+
+        with (
+            patch.object(openai_realtime_worker.time, "monotonic", side_effect=[0.0, 1.0]),
+            patch.object(openai_realtime_worker.time, "thread_time", side_effect=[0.0, 0.5]),
+        ):
+            worker.sample()
+            worker.sample()
+
+        # Two sessions use half a core, so a third would take it to 0.75.
+        assert worker.admission_error() is None
+
+        with (
+            patch.object(openai_realtime_worker.time, "monotonic", side_effect=[2.0]),
+            patch.object(openai_realtime_worker.time, "thread_time", side_effect=[1.2]),
+        ):
+            worker.sample()
+
+        assert "CPU" in worker.admission_error()
+        await worker.stop()
+
+    @pytest.mark.asyncio
+    async def test_cpu_of_other_threads_is_not_counted(self):
+        """Test that CPU used by inference threads does not count against the event loop."""
+        worker = RealtimeWorker(RealtimeWorkerParams(smoothing=1.0))
+
+        def spin():
+            end = time.monotonic() + 0.2
+            while time.monotonic() < end:
+                pass
+
+        worker.sample()
+        await asyncio.get_running_loop().run_in_executor(None, spin)
+        worker.sample()
+
+        assert worker.cpu_utilization < 0.5
+
+    @pytest.mark.asyncio
+    async def test_memory_admission_uses_per_session_share(self):
+        """Test that a session is rejected when one more session's memory share would not fit."""
+        with patch.object(openai_realtime_worker, "current_rss_bytes", return_value=100):
+            worker = RealtimeWorker(RealtimeWorkerParams(max_memory_bytes=200))
+        release = asyncio.Event()
+        asyncio.create_task(worker.run_session(MagicMock(), runner=make_runner(release)))
+        await asyncio.sleep(0)
+
+        with patch.object(openai_realtime_worker, "current_rss_bytes", return_value=140):
+            worker.sample()
+        assert worker.admission_error() is None
+
+        with patch.object(openai_realtime_worker, "current_rss_bytes", return_value=160):
+            worker.sample()
+        assert "memory" in worker.admission_error()
+        await worker.stop()
@@ -0,0 +1,332 @@
+import asyncio
+import io
+import sys
+import wave
+from types import ModuleType, SimpleNamespace
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+from pipecat.frames.frames import (
+    ErrorFrame,
+    InputAudioRawFrame,
+    InterimTranscriptionFrame,
+    MetricsFrame,
+    TranscriptionFrame,
+    UserStartedSpeakingFrame,
+    UserStoppedSpeakingFrame,
+    VADUserStoppedSpeakingFrame,
+)
+from pipecat.services.whisper.stt import Model
+from pipecat.tests.utils import SleepFrame, run_test
+from pipecat.transcriptions.language import Language
+
+from pipecat_extension.services.pooled_whisper_stt import (
+    PooledWhisperSTTService,
+    RealTimeFactorMetricsData,
+    WhisperInferencePool,
+    faster_whisper_batch_transcriber,
+)
+
+
+def make_wav(seconds: float, sample_rate: int = 16000) -> bytes:
+    content = io.BytesIO()
+    with wave.open(content, "wb") as wav:
+        wav.setsampwidth(2)
+        wav.setnchannels(1)
+        wav.setframerate(sample_rate)
+        wav.writeframes(b"\x00\x01" * int(seconds * sample_rate))
+    return content.getvalue()
+
+
+def make_pool(batches: list, **kwargs) -> WhisperInferencePool:
+    def transcribe_batch(audios, language, prefixes):
+        batches.append((len(audios), language))
+        return [f"{len(audio)} samples" for audio in audios]
+
+    return WhisperInferencePool(transcribe_batch=transcribe_batch, **kwargs)
+
+
+async def collect(service: PooledWhisperSTTService, audio: bytes) -> list:
+    return [frame async for frame in service.run_stt(audio)]
+
+
+class FakeWhisperModel:
+    """Stands in for faster_whisper.WhisperModel, recording the calls made to it.
+
+    Features have one frame per 160 samples, and each window decodes to the tokens given in
+    ``outputs`` with its no-speech probability.
+    """
+
+    instances = []
+
+    def __init__(self, model, **kwargs):
+        self.name = model
+        self.kwargs = kwargs
+        self.feature_extractor = lambda audio: np.ones((80, len(audio) // 160), dtype=np.float64)
+        self.feature_extractor.nb_max_frames = 3000
+        self.hf_tokenizer = "hf_tokenizer"
+        self.model = SimpleNamespace(is_multilingual=False, generate=self.generate)
+        self.prompts = []
+        self.prompt_languages = []
+        self.encoded = None
+        self.generate_kwargs = None
+        self.outputs = []
+        FakeWhisperModel.instances.append(self)
+
+    def get_prompt(self, tokenizer, previous_tokens, *, without_timestamps, prefix):
+        assert previous_tokens == [] and without_timestamps
+        self.prompts.append(prefix)
+        self.prompt_languages.append(tokenizer.language)
+        return ["<|startoftranscript|>", prefix]
+
+    def encode(self, features):
+        self.encoded = features
+        return "encoded"
+
+    def generate(self, encoded, prompts, **kwargs):
+        assert encoded == "encoded" and len(prompts) == len(self.outputs)
+        self.generate_kwargs = kwargs
+        return [
+            SimpleNamespace(sequences_ids=[tokens], no_speech_prob=no_speech_prob)
+            for tokens, no_speech_prob in self.outputs
+        ]
+
+
+class FakeTokenizer:
+    def __init__(self, hf_tokenizer, multilingual, *, task, language):
+        assert (hf_tokenizer, task) == ("hf_tokenizer", "transcribe")
+        # faster-whisper rejects a missing language for multilingual models.
+        assert multilingual == (language is not None)
+        self.language = language
+
+    def decode(self, tokens):
+        return " " + " ".join(tokens)
+
+
+def fake_faster_whisper() -> dict:
+    faster_whisper = ModuleType("faster_whisper")
+    faster_whisper.WhisperModel = FakeWhisperModel
+    tokenizer = ModuleType("faster_whisper.tokenizer")
+    tokenizer.Tokenizer = FakeTokenizer
+    return {"faster_whisper": faster_whisper, "faster_whisper.tokenizer": tokenizer}
+
+
+class TestFasterWhisperBatchTranscriber:
+    """Unit tests for faster_whisper_batch_transcriber, against a stubbed WhisperModel."""
+
+    def test_encodes_windows_together_and_forces_prefixes(self):
+        """Test that a batch's 30-second windows are encoded and decoded in one call each."""
+        with patch.dict(sys.modules, fake_faster_whisper()):
+            transcribe_batch = faster_whisper_batch_transcriber(Model.DISTIL_MEDIUM_EN)
+        whisper = FakeWhisperModel.instances[-1]
+        whisper.outputs = [
+            (["is", "Ann"], 0.1),
+            (["hello"], 0.1),
+            (["there"], 0.1),
+            (["um"], 0.9),
+        ]
+        audios = [
+            np.zeros(16000, dtype=np.float32),
+            np.zeros(16000 * 35, dtype=np.float32),
+            np.zeros(16000, dtype=np.float32),
+        ]
+
+        texts = transcribe_batch(audios, "en", ["my name", "ignored", ""])
+
+        assert texts == ["my name is Ann", "hello there", ""]
+        assert (whisper.name, whisper.kwargs["device"], whisper.kwargs["compute_type"]) == (
+            Model.DISTIL_MEDIUM_EN.value,
+            "cpu",
+            "int8",
+        )
+        # The prefix of an utterance over 30 seconds is dropped for all of its windows.
+        assert whisper.prompts == ["my name", None, None, None]
+        assert whisper.encoded.shape == (4, 80, 3000)
+        assert whisper.encoded.dtype == np.float32
+        assert whisper.generate_kwargs["beam_size"] == 1
+        assert whisper.generate_kwargs["return_no_speech_prob"] is True
+        assert whisper.generate_kwargs["include_prompt_in_result"] is False
+        assert whisper.prompt_languages == [None] * 4
+
+    def test_multilingual_model_detects_language_per_window(self):
+        """Test that a multilingual model without a language detects it for each window."""
+        with patch.dict(sys.modules, fake_faster_whisper()):
+            transcribe_batch = faster_whisper_batch_transcriber("small")
+        whisper = FakeWhisperModel.instances[-1]
+        whisper.model.is_multilingual = True
+        whisper.model.detect_language = lambda encoded: [
+            [("<|es|>", 0.9), ("<|en|>", 0.1)],
+            [("<|en|>", 0.8), ("<|es|>", 0.2)],
+        ]
+        whisper.outputs = [(["hola"], 0.1), (["hello"], 0.1)]
+        audios = [np.zeros(16000, dtype=np.float32), np.zeros(16000, dtype=np.float32)]
+
+        assert transcribe_batch(audios, None, ["", ""]) == ["hola", "hello"]
+        assert whisper.prompt_languages == ["es", "en"]
+
+        whisper.prompt_languages.clear()
+        transcribe_batch(audios, "fr", ["", ""])
+        assert whisper.prompt_languages == ["fr", "fr"]
+
+
+class TestWhisperInferencePool:
+    """Unit tests for WhisperInferencePool."""
+
+    @pytest.mark.asyncio
+    async def test_batches_concurrent_utterances(self):
+        """Test that utterances from several calls within the window run as one batch."""
+        batches = []
+        pool = make_pool(batches, max_batch_size=4, batch_window_ms=50)
+        audios = [np.zeros(n, dtype=np.float32) for n in (100, 200, 300)]
+
+        texts = await asyncio.gather(*(pool.transcribe(audio, "en") for audio in audios))
+
+        assert texts == ["100 samples", "200 samples", "300 samples"]
+        assert batches == [(3, "en")]
+        pool.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_languages_run_in_separate_batches(self):
+        """Test that utterances in different languages are not decoded together."""
+        batches = []
+        pool = make_pool(batches, max_batch_size=4, batch_window_ms=50)
+        audio = np.zeros(100, dtype=np.float32)
+
+        await asyncio.gather(
+            pool.transcribe(audio, "en"), pool.transcribe(audio, "es"), pool.transcribe(audio, "en")
+        )
+
+        assert sorted(batches) == [(1, "es"), (2, "en")]
+        pool.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_errors_reach_every_caller(self):
+        """Test that a failed batch raises in each waiting call."""
+
+        def transcribe_batch(audios, language, prefixes):
+            raise RuntimeError("model failed")
+
+        pool = WhisperInferencePool(transcribe_batch=transcribe_batch, batch_window_ms=50)
+        audio = np.zeros(100, dtype=np.float32)
+
+        results = await asyncio.gather(
+            pool.transcribe(audio), pool.transcribe(audio), return_exceptions=True
+        )
+
+        assert [type(r) for r in results] == [RuntimeError, RuntimeError]
+        pool.shutdown()
+
+
+class TestPooledWhisperSTTService:
+    """Unit tests for PooledWhisperSTTService."""
+
+    @pytest.mark.asyncio
+    async def test_transcribes_wav_and_reports_real_time_factor(self):
+        """Test that the WAV header is stripped and the real-time factor is reported."""
+        batches = []
+        pool = make_pool(batches, batch_window_ms=0)
+        service = PooledWhisperSTTService(pool, language=Language.EN)
+
+        frames = await collect(service, make_wav(0.5))
+
+        transcription, metrics = frames
+        assert isinstance(transcription, TranscriptionFrame)
+        assert transcription.text == "8000 samples"
+        assert batches == [(1, "en")]
+        assert isinstance(metrics, MetricsFrame)
+        [data] = metrics.data
+        assert isinstance(data, RealTimeFactorMetricsData)
+        assert data.audio_secs == 0.5
+        assert data.value == service.last_real_time_factor == data.processing_secs / 0.5
+        pool.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_rejects_other_sample_rates(self):
+        """Test that audio not at 16 kHz is reported as an error."""
+        pool = make_pool([], batch_window_ms=0)
+        service = PooledWhisperSTTService(pool)
+
+        frames = await collect(service, make_wav(0.5, sample_rate=8000))
+
+        assert [type(frame) for frame in frames] == [ErrorFrame]
+        pool.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_incremental_transcription_reuses_settled_words(self):
+        """Test that interim passes emit interim transcripts and feed settled words forward."""
+        hypotheses = ["hello", "hello there", "hello there my", "hello there my name is"]
+        calls = []
+
+        def transcribe_batch(audios, language, prefixes):
+            calls.append(prefixes[0])
+            return [hypotheses[min(len(calls), len(hypotheses)) - 1]]
+
+        pool = WhisperInferencePool(transcribe_batch=transcribe_batch, batch_window_ms=0)
+        service = PooledWhisperSTTService(pool, interim_interval_ms=100, sample_rate=16000)
+        frames = [UserStartedSpeakingFrame()]
+        for _ in range(3):
+            frames += [InputAudioRawFrame(b"\x00\x01" * 1600, 16000, 1), SleepFrame(0.05)]
+        frames.append(UserStoppedSpeakingFrame())
+
+        down, _ = await run_test(
+            service,
+            frames_to_send=frames,
+            expected_down_frames=[UserStartedSpeakingFrame]
+            + [InputAudioRawFrame, InterimTranscriptionFrame] * 3
+            + [UserStoppedSpeakingFrame, TranscriptionFrame, MetricsFrame],
+        )
+
+        interim = [f.text for f in down if isinstance(f, InterimTranscriptionFrame)]
+        assert interim == hypotheses[:3]
+        assert down[-2].text == "hello there my name is"
+        assert calls == ["", "", "hello", "hello there"]
+        pool.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_pause_starts_interim_transcription(self):
+        """Test that a VAD pause transcribes everything said so far without waiting."""
+        batches = []
+        pool = make_pool(batches, batch_window_ms=0)
+        service = PooledWhisperSTTService(pool, interim_interval_ms=1000, sample_rate=16000)
+        frames = [
+            UserStartedSpeakingFrame(),
+            InputAudioRawFrame(b"\x00\x01" * 1600, 16000, 1),
+            VADUserStoppedSpeakingFrame(),
+            SleepFrame(0.05),
+        ]
+
+        down, _ = await run_test(
+            service,
+            frames_to_send=frames,
+            expected_down_frames=[
+                UserStartedSpeakingFrame,
+                InputAudioRawFrame,
+                VADUserStoppedSpeakingFrame,
+                InterimTranscriptionFrame,
+            ],
+        )
+
+        assert down[-1].text == "1600 samples"
+        pool.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_no_interim_transcription_by_default(self):
+        """Test that without an interval only the final transcript is produced."""
+        batches = []
+        pool = make_pool(batches, batch_window_ms=0)
+        service = PooledWhisperSTTService(pool, sample_rate=16000)
+        frames = [UserStartedSpeakingFrame()]
+        frames += [InputAudioRawFrame(b"\x00\x01" * 1600, 16000, 1), SleepFrame(0.05)] * 3
+        frames.append(UserStoppedSpeakingFrame())
+
+        await run_test(
+            service,
+            frames_to_send=frames,
+            expected_down_frames=[UserStartedSpeakingFrame]
+            + [InputAudioRawFrame] * 3
+            + [UserStoppedSpeakingFrame, TranscriptionFrame, MetricsFrame],
+        )
+
+        assert batches == [(1, "en")]
+        pool.shutdown()